@@ -0,0 +1,99 @@
+"""
+지역 단위 확장 벤치마크 (격자 -> 행정동 -> 자치구)
+
+250m 격자 단위 가상 데이터(CCTV/범죄/인구)를 1만~100만 행으로 만들어
+병합 -> 인구당 비율 -> 4분면 -> 위험도 -> 상위 단위 집계 전 과정을 측정합니다.
+행당 처리 시간이 행 수와 무관하게 비슷하면 선형으로 확장되는 것입니다.
+
+실행:
+    python 02_코드/benchmark_regions.py
+    python 02_코드/benchmark_regions.py --sizes 10000 100000 1000000 --repeat 3
+"""
+
+import sys
+import time
+import argparse
+sys.path.append('.')
+
+import numpy as np
+import pandas as pd
+
+from utils import *
+
+GRID = REGION_LEVELS['격자250m']['key']
+DONG = REGION_LEVELS['행정동']['key']
+GU = REGION_LEVELS['자치구']['key']
+N_DONGS = REGION_LEVELS['행정동']['expected']
+
+
+def make_sources(n_rows, seed=RANDOM_SEED):
+    """격자 n_rows 개의 CCTV/범죄/인구 가상 데이터 (키 순서를 섞어 병합 비용 반영)"""
+    rng = np.random.default_rng(seed)
+    grid_ids = pd.Series([f'다사{i:07d}' for i in range(n_rows)])
+    dong_of_gu = rng.integers(0, len(SEOUL_DISTRICTS), N_DONGS)
+    dong = rng.integers(0, N_DONGS, n_rows)
+
+    cctv = pd.DataFrame({
+        GRID: grid_ids,
+        DONG: pd.Categorical.from_codes(dong, [f'11{i:06d}' for i in range(N_DONGS)]),
+        GU: pd.Categorical.from_codes(dong_of_gu[dong], SEOUL_DISTRICTS),
+        'CCTV': rng.poisson(3, n_rows)
+    })
+    crime = pd.DataFrame({GRID: grid_ids, '범죄': rng.poisson(5, n_rows)}).sample(frac=1, random_state=seed)
+    population = pd.DataFrame({GRID: grid_ids, '인구': rng.integers(0, 2000, n_rows)}).sample(frac=1, random_state=seed + 1)
+    return [cctv, crime, population]
+
+
+def run_pipeline(sources):
+    """격자 단위 분석 한 번 실행, 단계별 소요 시간(초) 반환"""
+    timings = {}
+
+    def step(name, func):
+        started = time.perf_counter()
+        result = func()
+        timings[name] = time.perf_counter() - started
+        return result
+
+    df = step('병합', lambda: integrate(sources, key=GRID))
+    df = step('인구당 비율', lambda: per_capita(df, {'CCTV_per_1000': 'CCTV', '범죄_per_1000': '범죄'}, '인구'))
+    step('4분면 (행정동 내)', lambda: classify_quadrant(df, 'CCTV_per_1000', '범죄_per_1000', by=DONG))
+    step('위험도 (자치구 내)', lambda: risk_score(df, '범죄_per_1000', 'CCTV_per_1000', by=GU))
+    dong = step('행정동 집계', lambda: rollup(df, [GU, DONG], ['CCTV', '범죄', '인구']))
+    step('자치구 집계', lambda: rollup(dong, GU, ['CCTV', '범죄', '인구']))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description='지역 단위 확장 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=3, help='크기별 반복 횟수 (최솟값 사용)')
+    args = parser.parse_args()
+
+    print("="*80)
+    print("지역 단위 확장 벤치마크 (격자 -> 행정동 -> 자치구)")
+    print("="*80)
+
+    rows = []
+    for n_rows in args.sizes:
+        sources = make_sources(n_rows)
+        runs = [run_pipeline(sources) for _ in range(args.repeat)]
+        best = {name: min(run[name] for run in runs) for name in runs[0]}
+        best['합계'] = sum(best.values())
+        rows.append(pd.Series(best, name=n_rows))
+        print(f"[OK] {n_rows:>10,}행: {best['합계']:.3f}s ({best['합계'] / n_rows * 1e6:.2f} us/행)")
+
+    table = pd.DataFrame(rows)
+    per_row = table.div(table.index.to_series(), axis=0) * 1e6
+
+    print("\n단계별 소요 시간 (초, 반복 중 최솟값):")
+    print(table.round(4).to_string())
+    print("\n행당 처리 시간 (us/행, 크기와 무관하게 비슷하면 선형 확장):")
+    print(per_row.round(3).to_string())
+
+    if len(table) > 1:
+        ratio = per_row['합계'].iloc[-1] / per_row['합계'].iloc[0]
+        print(f"\n행당 시간 비 ({table.index[-1]:,}행 / {table.index[0]:,}행): {ratio:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
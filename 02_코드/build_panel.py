@@ -0,0 +1,87 @@
+"""
+(자치구, 연도) 패널 데이터 구축
+
+- 범죄예방 수사용 CCTV 연도별 누적 (2015~2025, 01_데이터셋/raw 워크북)
+- 연도별 단면 데이터 (CCTV/범죄/인구, data/raw/*_{연도}.csv)
+를 하나의 패널로 묶고, 연도별 파생 변수와 4분면을 계산해 저장합니다.
+"""
+
+import sys
+import os
+sys.path.append('.')
+
+import pandas as pd
+
+from utils import *
+
+# 원본 파일 폴더
+SOURCE_DIR = '01_데이터셋/raw'
+
+# 연도별 단면 데이터 (연도: (CCTV, 범죄, 인구))
+CROSS_SECTIONS = {
+    2024: ('data/raw/cctv_seoul_2024.csv', 'data/raw/crime_seoul_2024.csv', 'data/raw/population_seoul_2024.csv'),
+}
+
+# 인구 천 명당 비율 변수 (run_real_data_analysis.py 와 같은 정의)
+RATES = {
+    'CCTV_per_1000': 'CCTV_총계',
+    '방범CCTV_per_1000': '방범용',
+    '범죄_per_1000': '총범죄_발생',
+    'CCTV효과범죄_per_1000': 'CCTV효과범죄',
+    '범죄예방누적_per_1000': '범죄예방_누적'
+}
+
+PANEL_PATH = 'data/processed/panel_district_year.csv'
+
+
+def load_cross_section(cctv_path, crime_path, population_path):
+    """한 연도의 CCTV/범죄/인구 단면 병합"""
+    df = load_table(cctv_path).merge(load_table(crime_path), on='자치구', how='inner')
+    df = df.merge(load_table(population_path), on='자치구', how='inner')
+    df['CCTV효과범죄'] = df['절도_발생'] + df['강도_발생']
+    return df
+
+
+def main():
+    print("="*80)
+    print("(자치구, 연도) 패널 데이터 구축")
+    print("="*80)
+
+    # 1. 범죄예방 수사용 CCTV 연도별 누적 (기준일이 다른 워크북에 겹치는 연도는 한 번만 사용)
+    print("\n[1/3] 연도별 CCTV 누적 데이터 로드 중...")
+    yearly = load_sheets(os.path.join(SOURCE_DIR, '*(범죄예방 수사용)*.xlsx'),
+                         SHEET_SPECS['cctv_prevention_yearly'])
+    cctv_long = melt_years(yearly.drop(columns='파일'), '범죄예방_누적')
+    cctv_long = cctv_long.dropna(subset=['범죄예방_누적']).drop_duplicates(['자치구', '연도'])
+    panel = Panel(cctv_long)
+    print(f"[OK] {panel}")
+
+    # 2. 연도별 단면 결합 (인덱스 결합, 연도별 재병합 없음)
+    print("\n[2/3] 연도별 단면 데이터 결합 중...")
+    sections = {year: load_cross_section(*paths) for year, paths in CROSS_SECTIONS.items()
+                if all(os.path.exists(path) for path in paths)}
+    if sections:
+        panel = panel.join(Panel.from_frames(sections))
+    print(f"[OK] {panel} - 단면 연도: {sorted(sections)}")
+
+    # 3. 파생 변수 / 연도별 4분면 / 전년 대비 증감
+    print("\n[3/3] 파생 변수 계산 중...")
+    panel.add_rates(RATES, '총인구')
+    panel.add_change('범죄예방_누적', name='범죄예방_신규')
+    panel.classify_quadrants('방범CCTV_per_1000', 'CCTV효과범죄_per_1000')
+
+    save_table(panel.to_frame(), PANEL_PATH, export_csv=True)
+
+    print("\n연도별 범죄예방 CCTV 누적 (서울시 합계):")
+    print(panel.data.groupby(level='연도')['범죄예방_누적'].sum().to_string())
+    for year in sections:
+        print(f"\n{year}년 분면 분포:")
+        print(panel.cross_section(year)['분면'].value_counts().to_string())
+
+    print("\n" + "="*80)
+    print(f"패널 저장 완료: {PANEL_PATH} ({len(panel)}행)")
+    print("="*80)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,39 +3,31 @@ API 키로 접근 가능한 모든 서비스를 찾아보는 스크립트
 """
 
 import os
-import requests
+import sys
 from dotenv import load_dotenv
+sys.path.append('.')
+
+from utils.seoul_api import ServiceProber, SEOUL_API_BASE_URL
 
 load_dotenv()
 
 API_KEY = os.getenv('SEOUL_API_KEY')
-BASE_URL = "http://openapi.seoul.go.kr:8088"
-
-# 숫자 패턴으로 시도 (LOCALDATA_XXXXXX)
-def test_localdata_range(start, end, category_prefix):
-    """LOCALDATA 패턴 범위 테스트"""
-    successful = []
+BASE_URL = os.getenv('SEOUL_API_BASE_URL', SEOUL_API_BASE_URL)
 
-    for i in range(start, end + 1):
-        service_name = f"LOCALDATA_{category_prefix}{i:04d}"
-        url = f"{BASE_URL}/{API_KEY}/json/{service_name}/1/1"
+# 탐색 결과 저장 (다음 실행에서는 7일이 지난 항목만 다시 확인)
+PROBE_STATE_PATH = os.getenv('SEOUL_PROBE_STATE', 'data/cache/service_probe.csv')
 
-        try:
-            response = requests.get(url, timeout=5)
-            data = response.json()
+prober = ServiceProber(API_KEY, base_url=BASE_URL, state_path=PROBE_STATE_PATH)
 
-            if 'RESULT' in data:
-                code = data['RESULT'].get('CODE')
-                if code == 'INFO-000' or service_name in str(data):
-                    print(f"[OK] {service_name}")
-                    successful.append(service_name)
-            elif service_name in data:
-                print(f"[OK] {service_name}")
-                successful.append(service_name)
-
-        except:
-            pass
 
+# 숫자 패턴으로 시도 (LOCALDATA_XXXXXX)
+def test_localdata_range(start, end, category_prefix):
+    """LOCALDATA 패턴 범위 테스트 (병렬, 빈 범위 조기 중단)"""
+    results = prober.scan_range(f"LOCALDATA_{category_prefix}", start, end)
+    successful = results.loc[results['ok'], 'service'].tolist()
+    for service_name in successful:
+        print(f"[OK] {service_name}")
+    print(f"   확인 {len(results)}개, 평균 응답 {results['latency_ms'].mean():.0f}ms")
     return successful
 
 print("="*80)
@@ -64,6 +56,9 @@ if all_services:
 else:
     print("\n추가 서비스를 찾지 못했습니다.")
 
+print(f"\n탐색 결과 저장: {PROBE_STATE_PATH}")
+prober.close()
+
 print("\n권장 사항:")
 print("1. API 신청이 승인되었는지 서울 열린데이터광장에서 확인")
 print("2. 신청한 데이터가 'Open API(A)' 타입인지 '통계(S)' 타입인지 확인")
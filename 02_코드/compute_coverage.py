@@ -0,0 +1,70 @@
+"""
+CCTV 커버리지 지표 계산
+
+ingest_points.py 로 저장한 CCTV/범죄 좌표 데이터에서
+지역별 커버 면적 비율, 감시 반경 내 범죄 비율을 계산합니다.
+(CCTV 유형별 반경: utils/constants.py 의 COVERAGE_RADIUS)
+
+실행:
+    python 02_코드/compute_coverage.py                                 # 자치구 (범죄 비율만)
+    python 02_코드/compute_coverage.py --boundaries seoul_gu.geojson   # 자치구 (면적 비율 포함)
+    python 02_코드/compute_coverage.py --layer 격자250m
+
+결과는 generate_complete_report.py --quadrant-x 커버범죄비율 의 4분면 x축으로 사용할 수 있습니다.
+"""
+
+import sys
+import os
+import time
+import argparse
+sys.path.append('.')
+
+from utils import *
+
+POINTS_DIR = 'data/processed/points'
+OUTPUT_DIR = 'data/processed'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CCTV 커버리지 지표 계산')
+    parser.add_argument('--layer', default='자치구', choices=list(REGION_LEVELS), help='집계 지역 단위')
+    parser.add_argument('--boundaries', help='경계 GeoJSON (면적 비율 계산에 필요)')
+    parser.add_argument('--name-property', default='SIG_KOR_NM', help='GeoJSON 지역명 속성')
+    parser.add_argument('--cell-size', type=float, default=20, help='커버리지 마스크 셀 크기 (m)')
+    parser.add_argument('--approx', action='store_true', help='범죄 커버 여부를 마스크 셀로 근사 (더 빠름)')
+    args = parser.parse_args()
+
+    print("="*80)
+    print(f"CCTV 커버리지 지표 계산 ({args.layer} 단위)")
+    print("="*80)
+
+    layer = region_layer(args.layer, args.boundaries, args.name_property)
+    key = region_key(args.layer)
+
+    started = time.perf_counter()
+    cameras = PointSet.load(os.path.join(POINTS_DIR, 'cctv_points.csv'))
+    incidents = PointSet.load(os.path.join(POINTS_DIR, 'crime_points.csv'))
+    engine = CoverageEngine(cameras, cell_size=args.cell_size)
+    print(f"[OK] {engine} ({time.perf_counter() - started:.2f}s)")
+
+    started = time.perf_counter()
+    table = engine.incident_coverage(incidents, layer, exact=not args.approx)
+    print(f"[OK] 범죄 {len(incidents):,}건 커버 여부 판정 ({time.perf_counter() - started:.2f}s)")
+
+    if isinstance(layer, str):
+        print(f"[WARNING] 경계 데이터가 없어 면적 비율은 생략합니다 (--boundaries 지정)")
+    else:
+        started = time.perf_counter()
+        table = engine.area_coverage(layer).merge(table, on=key, how='outer')
+        print(f"[OK] 면적 커버리지 계산 ({time.perf_counter() - started:.2f}s)")
+
+    output_path = os.path.join(OUTPUT_DIR, f'coverage_{key}.csv')
+    save_table(table, output_path, export_csv=True)
+
+    print("\n" + "="*80)
+    print(table.describe().round(3).to_string())
+    print("="*80)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+CCTV 순증 - 범죄 시차 분석 (시차 상관 + 그랜저 인과 검정)
+
+build_panel.py 로 저장한 (자치구, 연도) 패널에서 자치구별·시차별로
+- CCTV→범죄: 올해 CCTV 순증이 k년 뒤 범죄와 관련 있는가
+- 범죄→CCTV: 올해 범죄가 k년 뒤 CCTV 순증과 관련 있는가 (역인과)
+를 계산해 data/processed/lag_cube 에 저장합니다 (utils/lags.py).
+대시보드 SUMMARY 탭의 시차 분석은 이 파일만 읽습니다.
+
+실행:
+    python 02_코드/compute_lags.py
+    python 02_코드/compute_lags.py --crime-col 총범죄_발생 --max-lag 2
+"""
+
+import sys
+import argparse
+sys.path.append('.')
+
+from utils import *
+
+PANEL_PATH = 'data/processed/panel_district_year.csv'
+LAG_CUBE_PATH = 'data/processed/lag_cube.csv'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CCTV 순증 - 범죄 시차 분석')
+    parser.add_argument('--panel', default=PANEL_PATH, help='패널 데이터 경로')
+    parser.add_argument('--cctv-col', default='범죄예방_누적', help='CCTV 누적 대수 컬럼 (전년 대비 순증으로 변환)')
+    parser.add_argument('--crime-col', default='CCTV효과범죄', help='범죄 컬럼')
+    parser.add_argument('--max-lag', type=int, default=3, help='최대 시차 (연)')
+    args = parser.parse_args()
+
+    print("="*80)
+    print("CCTV 순증 - 범죄 시차 분석")
+    print("="*80)
+
+    panel = Panel.load(args.panel, columns=[args.cctv_col, args.crime_col])
+    print(f"[OK] {panel}")
+
+    cube = cached_lag_cube(panel, args.cctv_col, args.crime_col, LAG_CUBE_PATH, max_lag=args.max_lag)
+    pooled = cube[cube['지역'] == '전체'].drop(columns=['지역', '캐시키'])
+
+    if pooled['상관계수'].notna().sum() == 0:
+        print(f"[WARNING] {args.crime_col} 연도가 부족해 시차 상관을 계산할 수 없습니다.")
+        print("   build_panel.py 의 CROSS_SECTIONS 에 범죄 연도별 단면을 추가한 뒤 다시 실행하세요.")
+
+    print("\n" + "="*80)
+    print("전체 (자치구 고정효과) 시차 프로파일")
+    print("="*80)
+    print(pooled.round(4).to_string(index=False))
+    print(f"\n[OK] 시차 분석 결과: {LAG_CUBE_PATH} ({len(cube):,}행, 입력이 같으면 캐시 재사용)")
+
+
+if __name__ == "__main__":
+    main()
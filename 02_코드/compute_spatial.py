@@ -0,0 +1,129 @@
+"""
+공간 자기상관 분석 (전역 Moran's I + LISA 군집)
+
+- 자치구 (기본): 통합 데이터의 인구당 CCTV / 범죄 지표별 전역 Moran's I,
+  범죄율 LISA 군집(HH 핫스팟, LL 콜드스팟, HL/LH 이상치)을 4분면 분류와 교차표로 비교
+  (공간 가중치: 구청 좌표 k-최근접, 또는 --boundaries 경계 인접)
+- 격자250m: ingest_points.py 로 저장한 범죄 좌표를 격자로 집계해 (범죄 0건 격자 포함) queen 인접 가중치로 계산
+
+실행:
+    python 02_코드/compute_spatial.py
+    python 02_코드/compute_spatial.py --boundaries seoul_gu.geojson --n-perm 9999
+    python 02_코드/compute_spatial.py --level 격자250m
+"""
+
+import sys
+import os
+import time
+import argparse
+sys.path.append('.')
+
+import pandas as pd
+
+from utils import *
+
+INPUT_PATH = 'data/processed/integrated_data_with_analysis.csv'
+POINTS_DIR = 'data/processed/points'
+OUTPUT_DIR = 'data/processed'
+REPORT_DIR = 'results/reports'
+
+MORAN_COLUMNS = ['CCTV_per_1000', '방범CCTV_per_1000', '범죄_per_1000', 'CCTV효과범죄_per_1000']
+
+
+def moran_table(df, columns, W, n_perm, seed):
+    """변수별 전역 Moran's I 표"""
+    rows = []
+    for col in columns:
+        result = morans_i(df[col].to_numpy(), W, n_perm=n_perm, seed=seed)
+        rows.append({'변수': col, **result})
+    return pd.DataFrame(rows)
+
+
+def district_level(args):
+    df = load_table(INPUT_PATH)
+    if args.boundaries:
+        W, regions = polygon_weights(PolygonLayer.from_geojson(args.boundaries, args.name_property))
+        # 경계와 통합 데이터에 모두 있는 자치구만 사용 (W 를 잘라 다시 행 표준화)
+        available = set(df['자치구'])
+        keep = [i for i, region in enumerate(regions) if region in available]
+        dropped = sorted(set(regions) ^ available)
+        if dropped:
+            print(f"[WARNING] 경계/데이터 한쪽에만 있어 제외한 자치구: {', '.join(dropped)}")
+        W = row_standardize(W[keep][:, keep])
+        df = df.set_index('자치구').loc[[regions[i] for i in keep]].reset_index()
+        print(f"[OK] 경계 인접 가중치: {args.boundaries} ({len(keep)}개 자치구)")
+    else:
+        W = district_weights(df['자치구'].tolist(), k=args.k)
+        print(f"[OK] 구청 좌표 {args.k}-최근접 가중치")
+
+    columns = [col for col in MORAN_COLUMNS if col in df.columns]
+    table = moran_table(df, columns, W, args.n_perm, args.seed)
+    df = add_lisa(df, args.value, W, n_perm=args.n_perm, seed=args.seed, alpha=args.alpha)
+
+    # 분면도 같은 데이터에서 계산 (dashboard_real, generate_pdf_report 와 같은 기준)
+    df['분면'] = classify_quadrant(df, '방범CCTV_per_1000', 'CCTV효과범죄_per_1000')
+    print("\n" + "="*80)
+    print(f"4분면 x {args.value} LISA 군집")
+    print("="*80)
+    print(pd.crosstab(df['분면'], df[f'{args.value}_LISA_군집']).to_string())
+
+    save_table(df, os.path.join(OUTPUT_DIR, 'integrated_data_with_spatial.csv'), export_csv=True)
+    return table, df
+
+
+def grid_level(args):
+    key = region_key(args.level)
+    started = time.perf_counter()
+    incidents = PointSet.load(os.path.join(POINTS_DIR, 'crime_points.csv'))
+    layer = GridLayer(args.cell_size, name=key)
+    occupied = aggregate_points(incidents, layer, POINT_SPECS['incident'])
+    # 범죄가 없는 격자도 0건으로 포함해야 인접 구조와 Moran's I / LISA 가 왜곡되지 않음
+    df = layer.complete(occupied)
+    W = grid_weights(df[key].astype(str).to_numpy())
+    print(f"[OK] 범죄 {len(incidents):,}건 -> 격자 {len(df):,}개 (0건 {len(df) - len(occupied):,}개), "
+          f"인접 {W.nnz:,}쌍 ({time.perf_counter() - started:.2f}s)")
+
+    value = args.value if args.value in df.columns else POINT_SPECS['incident']['total_col']
+    table = moran_table(df, [value], W, args.n_perm, args.seed)
+    df = add_lisa(df, value, W, n_perm=args.n_perm, seed=args.seed, alpha=args.alpha)
+    save_table(df, os.path.join(OUTPUT_DIR, f'spatial_{key}.csv'), export_csv=True)
+    return table, df
+
+
+def main():
+    parser = argparse.ArgumentParser(description="공간 자기상관 분석 (Moran's I, LISA)")
+    parser.add_argument('--level', default='자치구', choices=['자치구', '격자250m'], help='분석 지역 단위')
+    parser.add_argument('--value', default='CCTV효과범죄_per_1000', help='LISA 분석 변수 (격자: 없으면 총범죄_발생)')
+    parser.add_argument('--boundaries', help='자치구 경계 GeoJSON (없으면 구청 좌표 k-최근접)')
+    parser.add_argument('--name-property', default='SIG_KOR_NM', help='GeoJSON 지역명 속성')
+    parser.add_argument('--k', type=int, default=4, help='k-최근접 이웃 수')
+    parser.add_argument('--cell-size', type=float, default=250, help='격자 크기 (m)')
+    parser.add_argument('--n-perm', type=int, default=999, help='순열 수')
+    parser.add_argument('--alpha', type=float, default=0.05, help='LISA 군집 유의수준')
+    parser.add_argument('--seed', type=int, default=RANDOM_SEED, help='난수 시드')
+    args = parser.parse_args()
+
+    print("="*80)
+    print(f"공간 자기상관 분석 ({args.level} 단위)")
+    print("="*80)
+
+    started = time.perf_counter()
+    table, df = district_level(args) if args.level == '자치구' else grid_level(args)
+    print(f"\n[OK] Moran's I / LISA 계산 ({time.perf_counter() - started:.2f}s)")
+
+    print("\n" + "="*80)
+    print("전역 Moran's I")
+    print("="*80)
+    print(table.round(4).to_string(index=False))
+
+    lisa_col = [col for col in df.columns if col.endswith('_LISA_군집')][0]
+    print(f"\n{lisa_col}:")
+    print(df[lisa_col].value_counts().to_string())
+
+    os.makedirs(REPORT_DIR, exist_ok=True)
+    table.to_csv(os.path.join(REPORT_DIR, f'morans_i_{args.level}.csv'), index=False, encoding='utf-8-sig')
+    print(f"\n[OK] 저장: {REPORT_DIR}/morans_i_{args.level}.csv")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+CCTV 설치 시점 기준 이중차분법(DID) / 이벤트 스터디
+
+build_panel.py 로 저장한 (자치구, 연도) 패널에서
+범죄예방 CCTV 누적 대수의 전년 대비 증가량이 임계값 이상인 첫 해를 처치연도로 두고
+범죄율 변화를 추정합니다 (utils/causal.py).
+
+- DID 계수: CCTV 대폭 증설 이후 범죄율 변화 (지역·연도 고정효과, 자치구 군집 표준오차)
+- 이벤트 스터디: 처치 전 계수(상대연도 < -1)가 유의하면 설치 전부터 범죄가 달라지고 있었다는 뜻
+  -> "범죄 증가 -> CCTV 설치" 역인과 검증
+
+실행:
+    python 02_코드/estimate_did.py                                # 증가량 상위 25% 를 임계값으로
+    python 02_코드/estimate_did.py --threshold 500 --n-boot 9999 --workers 4
+    python 02_코드/estimate_did.py --outcome 범죄_per_1000 --leads 4 --lags 4
+"""
+
+import sys
+import os
+import time
+import argparse
+sys.path.append('.')
+
+from utils import *
+
+PANEL_PATH = 'data/processed/panel_district_year.csv'
+OUTPUT_DIR = 'results/reports'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CCTV 설치 시점 기준 DID / 이벤트 스터디')
+    parser.add_argument('--panel', default=PANEL_PATH, help='패널 데이터 경로')
+    parser.add_argument('--outcome', default='CCTV효과범죄_per_1000', help='결과 변수')
+    parser.add_argument('--cctv-col', default='범죄예방_누적', help='처치 기준 CCTV 컬럼')
+    parser.add_argument('--threshold', type=float, help='처치 기준 전년 대비 증가량 (기본: 증가량 75% 분위수)')
+    parser.add_argument('--leads', type=int, default=3, help='이벤트 스터디 처치 전 연도 수')
+    parser.add_argument('--lags', type=int, default=3, help='이벤트 스터디 처치 후 연도 수')
+    parser.add_argument('--n-boot', type=int, default=999, help='wild bootstrap 반복 수 (0 이면 생략)')
+    parser.add_argument('--workers', type=int, default=1, help='bootstrap 프로세스 수')
+    args = parser.parse_args()
+
+    print("="*80)
+    print("CCTV 설치 시점 기준 이중차분법(DID) / 이벤트 스터디")
+    print("="*80)
+
+    panel = Panel.load(args.panel)
+    print(f"[OK] {panel}")
+
+    years_observed = panel.data[args.outcome].dropna().index.get_level_values(panel.year_col).nunique() \
+        if args.outcome in panel.data else 0
+    if years_observed < 2:
+        print(f"[WARNING] {args.outcome} 가 {years_observed}개 연도에만 있어 DID 를 추정할 수 없습니다.")
+        print("   build_panel.py 의 CROSS_SECTIONS 에 범죄 연도별 단면을 추가한 뒤 다시 실행하세요.")
+        return
+
+    threshold = args.threshold
+    if threshold is None:
+        threshold = float(panel.data.groupby(level=panel.region_col)[args.cctv_col].diff().quantile(0.75))
+    df = assign_treatment(panel, args.cctv_col, threshold)
+    cohorts = df.groupby('처치연도', dropna=False)[panel.region_col].nunique()
+    print(f"[OK] 처치 기준: {args.cctv_col} 전년 대비 +{threshold:,.0f} 이상")
+    print(f"     처치연도별 지역 수: {cohorts.to_dict()}")
+
+    options = {'n_boot': args.n_boot, 'workers': args.workers}
+
+    started = time.perf_counter()
+    did_table = did(df, args.outcome, **options)
+    print(f"\n[OK] DID 추정 ({time.perf_counter() - started:.2f}s)")
+    print(did_table.round(4).to_string(index=False))
+
+    started = time.perf_counter()
+    events = event_study(df, args.outcome, leads=args.leads, lags=args.lags, **options)
+    print(f"\n[OK] 이벤트 스터디 추정 ({time.perf_counter() - started:.2f}s)")
+    print(events.round(4).to_string(index=False))
+
+    pre = events[events['상대연도'] < -1]
+    p_col = 'p_wild' if 'p_wild' in events else 'p_value'
+    if (pre[p_col] < 0.05).any():
+        print("\n[WARNING] 처치 전 계수가 유의합니다: CCTV 증설 전부터 범죄율이 달라지고 있었음 (역인과 가능성)")
+    else:
+        print("\n[OK] 처치 전 계수가 유의하지 않음 (평행 추세 가정과 일치)")
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    did_table.to_csv(os.path.join(OUTPUT_DIR, 'did_estimate.csv'), index=False, encoding='utf-8-sig')
+    events.to_csv(os.path.join(OUTPUT_DIR, 'event_study.csv'), index=False, encoding='utf-8-sig')
+    print(f"\n[OK] 저장: {OUTPUT_DIR}/did_estimate.csv, event_study.csv")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,23 +4,44 @@ API 인증키를 받은 후 실행하세요
 """
 
 import os
+import sys
+import argparse
 import requests
 import pandas as pd
 from dotenv import load_dotenv
 from datetime import datetime
+sys.path.append('.')
+
+from utils.seoul_api import SeoulApiClient, ResponseCache, SEOUL_API_BASE_URL
 
 # .env 파일에서 API 키 로드
 load_dotenv()
 
 # API 기본 설정
-BASE_URL = "http://openapi.seoul.go.kr:8088"
-OUTPUT_FORMAT = "json"  # json 또는 xml
-ROWS_PER_REQUEST = 1000
+BASE_URL = os.getenv('SEOUL_API_BASE_URL', SEOUL_API_BASE_URL)  # 스텁 서버 테스트 시 변경
+
+# 응답 캐시 (반복 실행 시 같은 데이터를 다시 받지 않음)
+CACHE_PATH = os.getenv('SEOUL_API_CACHE', 'data/cache/seoul_api.sqlite')
+CACHE_TTL = {
+    'default': 24 * 60 * 60,            # 1일
+    "범죄발생현황": 30 * 24 * 60 * 60,     # 연 단위 통계 - 30일
+    "5대범죄발생장소": 30 * 24 * 60 * 60,
+    "등록인구통계": 7 * 24 * 60 * 60,      # 분기 단위 통계 - 7일
+    "인구이동통계": 7 * 24 * 60 * 60
+}
+
+# 수집 대상 서비스 (실제 서비스명은 API 신청 후 확인 필요)
+SERVICES = {
+    'crime': ('crime_key', "범죄발생현황", '범죄 발생 현황'),  # TODO: 실제 서비스명으로 변경
+    'crime_location': ('crime_location_key', "5대범죄발생장소", '5대 범죄 발생장소별 현황'),
+    'population': ('population_key', "등록인구통계", '등록인구 통계'),
+    'migration': ('migration_key', "인구이동통계", '인구이동 통계')
+}
 
 class SeoulDataFetcher:
-    """서울 열린데이터광장 API 클라이언트"""
+    """서울 열린데이터광장 API 클라이언트 (전체 페이지 자동 수집, 서비스 동시 수집)"""
 
-    def __init__(self):
+    def __init__(self, base_url=BASE_URL, cache_path=CACHE_PATH, offline=False, **client_options):
         self.crime_key = os.getenv('SEOUL_CRIME_API_KEY')
         self.crime_location_key = os.getenv('SEOUL_CRIME_LOCATION_API_KEY')
         self.population_key = os.getenv('SEOUL_POPULATION_API_KEY')
@@ -34,9 +55,14 @@ class SeoulDataFetcher:
                 ".env.example 파일을 참고하세요."
             )
 
+        cache = ResponseCache(cache_path, ttl=CACHE_TTL) if cache_path else None
+        if offline and cache is None:
+            raise ValueError("offline 모드는 응답 캐시가 필요합니다 (--no-cache 와 함께 사용 불가).")
+        self.client = SeoulApiClient(base_url=base_url, cache=cache, offline=offline, **client_options)
+
     def fetch_data(self, api_key, service_name, start_idx=1, end_idx=1000):
         """
-        서울 열린데이터광장 API 호출
+        서울 열린데이터광장 API 호출 (한 구간)
 
         Args:
             api_key: API 인증키
@@ -47,79 +73,73 @@ class SeoulDataFetcher:
         Returns:
             JSON 응답 데이터
         """
-        url = f"{BASE_URL}/{api_key}/{OUTPUT_FORMAT}/{service_name}/{start_idx}/{end_idx}"
-
         try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return self.client.get_json(api_key, service_name, start_idx, end_idx)
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"API 호출 실패: {e}")
             return None
 
-    def fetch_crime_data(self, year=2023):
-        """범죄 발생 현황 데이터 수집"""
-        print(f"\n[1/4] {year}년 범죄 발생 현황 데이터 수집 중...")
-
-        # 실제 서비스명은 API 신청 후 확인 필요
-        # 예시: '범죄발생현황', 'crimeStat' 등
-        service_name = "범죄발생현황"  # TODO: 실제 서비스명으로 변경
+    def fetch_all(self, api_key, service_name):
+        """
+        서비스 전체 데이터 수집 (1,000건 단위 페이지를 모두 순회)
 
-        data = self.fetch_data(self.crime_key, service_name, 1, 1000)
+        Returns:
+            pd.DataFrame: 전체 데이터 (실패 시 None)
+        """
+        try:
+            return self.client.fetch_frame(api_key, service_name)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            print(f"API 호출 실패: {e}")
+            return None
 
-        if data:
-            # JSON을 DataFrame으로 변환 (실제 구조에 맞게 수정 필요)
-            # df = pd.DataFrame(data['결과키']['row'])
-            print("✓ 범죄 데이터 수집 완료")
-            return data
+    def _fetch_service(self, name, step):
+        key_attr, service_name, title = SERVICES[name]
+        print(f"\n[{step}/4] {title} 데이터 수집 중...")
+        df = self.fetch_all(getattr(self, key_attr), service_name)
+        if df is not None:
+            print(f"✓ {title} 데이터 수집 완료 ({len(df)}건)")
         else:
-            print("✗ 범죄 데이터 수집 실패")
-            return None
+            print(f"✗ {title} 데이터 수집 실패")
+        return df
+
+    def fetch_crime_data(self, year=2023):
+        """범죄 발생 현황 데이터 수집"""
+        return self._fetch_service('crime', 1)
 
     def fetch_crime_location_data(self, year=2023):
         """5대 범죄 발생장소별 현황 데이터 수집"""
-        print(f"\n[2/4] {year}년 5대 범죄 발생장소별 현황 데이터 수집 중...")
-
-        service_name = "5대범죄발생장소"  # TODO: 실제 서비스명으로 변경
-
-        data = self.fetch_data(self.crime_location_key, service_name, 1, 1000)
-
-        if data:
-            print("✓ 범죄 발생장소 데이터 수집 완료")
-            return data
-        else:
-            print("✗ 범죄 발생장소 데이터 수집 실패")
-            return None
+        return self._fetch_service('crime_location', 2)
 
     def fetch_population_data(self, year=2023):
         """등록인구 통계 데이터 수집"""
-        print(f"\n[3/4] {year}년 등록인구 통계 데이터 수집 중...")
-
-        service_name = "등록인구통계"  # TODO: 실제 서비스명으로 변경
-
-        data = self.fetch_data(self.population_key, service_name, 1, 1000)
-
-        if data:
-            print("✓ 인구 데이터 수집 완료")
-            return data
-        else:
-            print("✗ 인구 데이터 수집 실패")
-            return None
+        return self._fetch_service('population', 3)
 
     def fetch_migration_data(self, year=2023):
         """인구이동 통계 데이터 수집"""
-        print(f"\n[4/4] {year}년 인구이동 통계 데이터 수집 중...")
-
-        service_name = "인구이동통계"  # TODO: 실제 서비스명으로 변경
+        return self._fetch_service('migration', 4)
 
-        data = self.fetch_data(self.migration_key, service_name, 1, 1000)
+    def fetch_all_services(self):
+        """
+        키가 설정된 모든 서비스를 동시에 수집
 
-        if data:
-            print("✓ 인구이동 데이터 수집 완료")
-            return data
-        else:
-            print("✗ 인구이동 데이터 수집 실패")
-            return None
+        Returns:
+            dict: {서비스 이름: DataFrame 또는 None}
+        """
+        jobs = {name: (getattr(self, key_attr), service_name)
+                for name, (key_attr, service_name, _) in SERVICES.items()
+                if getattr(self, key_attr)}
+        print(f"\n{len(jobs)}개 서비스 동시 수집 중... ({', '.join(jobs)})")
+
+        results = {}
+        for name, result in self.client.fetch_many(jobs).items():
+            title = SERVICES[name][2]
+            if isinstance(result, Exception):
+                print(f"✗ {title} 데이터 수집 실패: {result}")
+                results[name] = None
+            else:
+                print(f"✓ {title} 데이터 수집 완료 ({len(result)}건)")
+                results[name] = result
+        return results
 
     def save_to_csv(self, data, filename):
         """데이터를 CSV 파일로 저장"""
@@ -127,37 +147,46 @@ class SeoulDataFetcher:
             print(f"데이터가 없어 {filename} 저장 실패")
             return
 
-        # 실제 JSON 구조에 맞게 수정 필요
-        # 예시: df = pd.DataFrame(data['결과키']['row'])
-        # df.to_csv(filename, index=False, encoding='utf-8-sig')
+        data.to_csv(filename, index=False, encoding='utf-8-sig')
         print(f"✓ {filename} 저장 완료")
 
 
 def main():
     """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='서울 열린데이터광장 API 데이터 수집')
+    parser.add_argument('--offline', action='store_true', help='네트워크 없이 캐시된 응답만 사용')
+    parser.add_argument('--no-cache', action='store_true', help='응답 캐시 사용 안 함')
+    parser.add_argument('--clear-cache', action='store_true', help='수집 전에 응답 캐시 비우기')
+    args = parser.parse_args()
+
     print("="*80)
     print("서울 열린데이터광장 API 데이터 수집 스크립트")
     print("="*80)
 
     try:
-        fetcher = SeoulDataFetcher()
+        fetcher = SeoulDataFetcher(cache_path=None if args.no_cache else CACHE_PATH, offline=args.offline)
+        if args.clear_cache and fetcher.client.cache is not None:
+            fetcher.client.cache.clear()
 
-        # 데이터 수집
-        crime_data = fetcher.fetch_crime_data(year=2023)
-        crime_location_data = fetcher.fetch_crime_location_data(year=2023)
-        population_data = fetcher.fetch_population_data(year=2023)
-        migration_data = fetcher.fetch_migration_data(year=2023)
+        # 데이터 수집 (서비스 동시 수집, 서비스별 전체 페이지)
+        results = fetcher.fetch_all_services()
 
         # 데이터 저장
         os.makedirs('data/raw', exist_ok=True)
+        stamp = datetime.now().strftime('%Y%m%d')
+        for name, df in results.items():
+            fetcher.save_to_csv(df, f'data/raw/api_{name}_{stamp}.csv')
+        stats = fetcher.client.stats
+        print(f"\n네트워크 요청: {stats['network']}회, 캐시 사용: {stats['cache_hit']}회, "
+              f"재검증(304): {stats['revalidated']}회")
+        fetcher.client.close()
 
         print("\n" + "="*80)
         print("데이터 수집 완료!")
         print("="*80)
         print("\n다음 단계:")
-        print("1. 수집된 JSON 데이터의 구조를 확인하세요")
-        print("2. save_to_csv() 함수를 수정하여 실제 데이터 구조에 맞게 CSV로 저장하세요")
-        print("3. run_all_analysis.py를 실행하여 분석을 시작하세요")
+        print("1. data/raw/api_*.csv 파일의 컬럼 구조를 확인하세요")
+        print("2. run_all_analysis.py를 실행하여 분석을 시작하세요")
 
     except ValueError as e:
         print(f"\n오류: {e}")
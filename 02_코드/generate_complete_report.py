@@ -1,9 +1,15 @@
 """
 완전한 최종 보고서 생성 (모든 그래프 포함)
+
+사용법:
+    python generate_complete_report.py              # 그래프 병렬 렌더링 (CPU 수만큼)
+    python generate_complete_report.py --workers 4  # 워커 수 지정
+    python generate_complete_report.py --serial     # 순차 렌더링
 """
 
 import sys
 import os
+import argparse
 sys.path.append('.')
 
 import pandas as pd
@@ -14,300 +20,359 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from scipy import stats
 import statsmodels.api as sm
-from statsmodels.stats.outliers_influence import variance_inflation_factor
 
 from utils import *
 
-print("="*80)
-print("완전한 최종 보고서 생성 (모든 그래프 포함)")
-print("="*80)
-
-# 데이터 로드 (프로젝트 루트 기준)
-base_dir = os.path.dirname(os.path.abspath(__file__))
-data_path = os.path.join(base_dir, 'data', 'processed', 'integrated_data_with_quadrant.csv')
-
-df = pd.read_csv(data_path, encoding='utf-8-sig')
-print(f"데이터 로드 완료: {df.shape}")
-
-# 그래프 저장 경로
-figures_path = os.path.join(base_dir, 'results', 'figures')
-os.makedirs(figures_path, exist_ok=True)
-FIGURES_PATH = figures_path
-reports_path = os.path.join(base_dir, 'results', 'reports')
-os.makedirs(reports_path, exist_ok=True)
-
-set_korean_font()
-set_plot_style()
-
-# ============================================================================
-# Day 4: 상관분석 히트맵
-# ============================================================================
-print("\n[1/10] 상관계수 히트맵 생성 중...")
-
-corr_vars = [
-    '인구당_총CCTV', '인구당_방범용', '인구당_교통단속용',
-    '인구당_CCTV효과범죄율', '인구당_절도율', '인구당_강도율',
-    '인구밀도'
+REPORT_COLUMNS = [
+    '자치구', '분면', '인구밀도',
+    '인구당_총CCTV', '인구당_방범용', '인구당_교통단속용', '인구당_어린이안전용',
+    '인구당_CCTV효과범죄율', '인구당_절도율', '인구당_강도율', '인구당_차량범죄율'
 ]
-corr_matrix = df[corr_vars].corr(method='pearson')
-
-plt.figure(figsize=(10, 8))
-sns.heatmap(corr_matrix, annot=True, fmt='.3f', cmap='coolwarm', center=0,
-            square=True, linewidths=1, cbar_kws={"shrink": 0.8})
-plt.title('주요 변수 상관계수 히트맵 (Pearson)', fontsize=14, fontweight='bold')
-plt.tight_layout()
-plt.savefig(os.path.join(FIGURES_PATH, 'day4_correlation_heatmap.png'), dpi=300, bbox_inches='tight')
-plt.close()
-print("   [OK] day4_correlation_heatmap.png")
-
-# ============================================================================
-# Day 4: 산점도 (CCTV vs 범죄율)
-# ============================================================================
-print("[2/10] CCTV vs 범죄율 산점도 생성 중...")
-
-fig, axes = plt.subplots(1, 2, figsize=(16, 6))
-
-# 총CCTV vs 범죄율
-axes[0].scatter(df['인구당_총CCTV'], df['인구당_CCTV효과범죄율'],
-                s=100, alpha=0.6, edgecolors='black')
-axes[0].set_xlabel('인구당 총CCTV (대/천명)')
-axes[0].set_ylabel('인구당 범죄율 (건/천명)')
-axes[0].set_title('총CCTV vs 범죄율')
-axes[0].grid(alpha=0.3)
-
-# 방범용CCTV vs 범죄율
-axes[1].scatter(df['인구당_방범용'], df['인구당_CCTV효과범죄율'],
-                s=100, alpha=0.6, edgecolors='black', color='green')
-axes[1].set_xlabel('인구당 방범용CCTV (대/천명)')
-axes[1].set_ylabel('인구당 범죄율 (건/천명)')
-axes[1].set_title('방범용CCTV vs 범죄율')
-axes[1].grid(alpha=0.3)
-
-plt.tight_layout()
-plt.savefig(os.path.join(FIGURES_PATH, 'day4_scatter_cctv_crime.png'), dpi=300, bbox_inches='tight')
-plt.close()
-print("   [OK] day4_scatter_cctv_crime.png")
-
-# ============================================================================
-# Day 4: 상위 10개 자치구 (CCTV)
-# ============================================================================
-print("[3/10] 상위 자치구 막대그래프 생성 중...")
-
-top10 = df.nlargest(10, '인구당_총CCTV').sort_values('인구당_총CCTV')
-
-fig, ax = plt.subplots(figsize=(10, 6))
-ax.barh(top10['자치구'], top10['인구당_총CCTV'], color='steelblue')
-ax.set_xlabel('인구당 총CCTV (대/천명)', fontsize=12)
-ax.set_title('인구당 CCTV 상위 10개 자치구', fontsize=14, fontweight='bold')
-ax.grid(axis='x', alpha=0.3)
-plt.tight_layout()
-plt.savefig(os.path.join(FIGURES_PATH, 'day4_top10_cctv.png'), dpi=300, bbox_inches='tight')
-plt.close()
-print("   [OK] day4_top10_cctv.png")
-
-# ============================================================================
-# Day 5: CCTV 유형별 효과
-# ============================================================================
-print("[4/10] CCTV 유형별 상관관계 생성 중...")
-
-cctv_types = ['인구당_방범용', '인구당_교통단속용', '인구당_어린이안전용']
-correlations = [df[ctype].corr(df['인구당_CCTV효과범죄율']) for ctype in cctv_types]
-
-fig, ax = plt.subplots(figsize=(10, 6))
-colors = ['green' if c < 0 else 'red' for c in correlations]
-ax.bar(range(len(cctv_types)), correlations, color=colors, alpha=0.7, edgecolor='black')
-ax.set_xticks(range(len(cctv_types)))
-ax.set_xticklabels([c.replace('인구당_', '') for c in cctv_types])
-ax.set_ylabel('상관계수')
-ax.set_title('CCTV 유형별 범죄율과의 상관관계', fontsize=14, fontweight='bold')
-ax.axhline(0, color='black', linewidth=0.8)
-ax.grid(axis='y', alpha=0.3)
-plt.tight_layout()
-plt.savefig(os.path.join(FIGURES_PATH, 'day5_cctv_type_correlation.png'), dpi=300, bbox_inches='tight')
-plt.close()
-print("   [OK] day5_cctv_type_correlation.png")
-
-# ============================================================================
-# Day 5: 범죄 유형별 평균
-# ============================================================================
-print("[5/10] 범죄 유형별 평균 생성 중...")
-
-crime_types = ['인구당_절도율', '인구당_강도율', '인구당_차량범죄율']
-crime_means = [df[ct].mean() for ct in crime_types]
-
-fig, ax = plt.subplots(figsize=(10, 6))
-ax.bar(range(len(crime_types)), crime_means, color=['steelblue', 'coral', 'gold'],
-       alpha=0.7, edgecolor='black')
-ax.set_xticks(range(len(crime_types)))
-ax.set_xticklabels([ct.replace('인구당_', '').replace('율', '') for ct in crime_types])
-ax.set_ylabel('평균 범죄율 (건/천명)')
-ax.set_title('CCTV 효과 범죄 유형별 평균', fontsize=14, fontweight='bold')
-ax.grid(axis='y', alpha=0.3)
-
-for i, v in enumerate(crime_means):
-    ax.text(i, v + 0.05, f'{v:.2f}', ha='center', fontweight='bold')
 
-plt.tight_layout()
-plt.savefig(os.path.join(FIGURES_PATH, 'day5_crime_type_avg.png'), dpi=300, bbox_inches='tight')
-plt.close()
-print("   [OK] day5_crime_type_avg.png")
-
-# ============================================================================
-# Day 8: Q-Q Plot
-# ============================================================================
-print("[6/10] 회귀 진단 그래프 생성 중...")
-
-X_cols = ['인구당_방범용', '인구밀도']
-y_col = '인구당_CCTV효과범죄율'
-X = df[X_cols]
-y = df[y_col]
-X_with_const = sm.add_constant(X)
-model = sm.OLS(y, X_with_const).fit()
-residuals = model.resid
-fitted = model.fittedvalues
-
-# Q-Q Plot
-fig, ax = plt.subplots(figsize=(8, 6))
-stats.probplot(residuals, dist="norm", plot=ax)
-ax.set_title('Q-Q Plot (잔차 정규성 검사)', fontsize=14, fontweight='bold')
-plt.tight_layout()
-plt.savefig(os.path.join(FIGURES_PATH, 'day8_qq_plot.png'), dpi=300, bbox_inches='tight')
-plt.close()
-print("   [OK] day8_qq_plot.png")
-
-# ============================================================================
-# Day 8: 잔차 vs 예측값
-# ============================================================================
-print("[7/10] 잔차 vs 예측값 생성 중...")
-
-fig, ax = plt.subplots(figsize=(10, 6))
-ax.scatter(fitted, residuals, alpha=0.6, edgecolors='black')
-ax.axhline(0, color='red', linestyle='--', linewidth=2)
-ax.set_xlabel('예측값')
-ax.set_ylabel('잔차')
-ax.set_title('잔차 vs 예측값 (등분산성 검사)', fontsize=14, fontweight='bold')
-ax.grid(alpha=0.3)
-plt.tight_layout()
-plt.savefig(os.path.join(FIGURES_PATH, 'day8_residuals_fitted.png'), dpi=300, bbox_inches='tight')
-plt.close()
-print("   [OK] day8_residuals_fitted.png")
-
-# ============================================================================
-# Day 8: Cook's Distance
-# ============================================================================
-print("[8/10] Cook's Distance 생성 중...")
-
-influence = model.get_influence()
-cooks_d = influence.cooks_distance[0]
-
-fig, ax = plt.subplots(figsize=(10, 6))
-ax.stem(range(len(cooks_d)), cooks_d, markerfmt=',')
-ax.set_xlabel('관측치 인덱스')
-ax.set_ylabel("Cook's Distance")
-ax.set_title("Cook's Distance (영향력 큰 관측치 탐지)", fontsize=14, fontweight='bold')
-ax.axhline(4/len(df), color='red', linestyle='--', label='임계값 (4/n)')
-ax.legend()
-plt.tight_layout()
-plt.savefig(os.path.join(FIGURES_PATH, 'day8_cooks_distance.png'), dpi=300, bbox_inches='tight')
-plt.close()
-print("   [OK] day8_cooks_distance.png")
-
-# ============================================================================
-# Day 9: 4분면 분류 (가장 중요!)
-# ============================================================================
-print("[9/10] 4분면 분류 산점도 생성 중...")
-
-cctv_median = df['인구당_방범용'].median()
-crime_median = df['인구당_CCTV효과범죄율'].median()
-
-color_map = {
-    'Q1: 고CCTV/고범죄': 'orange',
-    'Q2: 저CCTV/고범죄 (우선순위)': 'red',
-    'Q3: 저CCTV/저범죄': 'lightblue',
-    'Q4: 고CCTV/저범죄 (효과적)': 'green'
+# 4분면 산점도 x축 후보 {컬럼: 축 라벨} - 커버리지 지표는 compute_coverage.py 결과(coverage_자치구)에서 결합
+QUADRANT_X = {
+    '인구당_방범용': '인구당 방범용 CCTV (대/천명)',
+    '커버면적비율': 'CCTV 감시 반경 내 면적 비율',
+    '커버범죄비율': 'CCTV 감시 반경 내 범죄 비율'
 }
 
-fig, ax = plt.subplots(figsize=(14, 10))
-
-for quadrant, color in color_map.items():
-    subset = df[df['분면'] == quadrant]
-    ax.scatter(subset['인구당_방범용'], subset['인구당_CCTV효과범죄율'],
-               s=200, alpha=0.7, edgecolors='black', linewidth=1.5,
-               color=color, label=quadrant)
-
-    # 자치구 이름 라벨
-    for idx, row in subset.iterrows():
-        ax.annotate(row['자치구'],
-                   (row['인구당_방범용'], row['인구당_CCTV효과범죄율']),
-                   fontsize=9, ha='center', va='bottom')
-
-# 중앙값 기준선
-ax.axvline(cctv_median, color='gray', linestyle='--', linewidth=2, alpha=0.5)
-ax.axhline(crime_median, color='gray', linestyle='--', linewidth=2, alpha=0.5)
-
-ax.set_xlabel('인구당 방범용 CCTV (대/천명)', fontsize=12, fontweight='bold')
-ax.set_ylabel('인구당 CCTV효과범죄율 (건/천명)', fontsize=12, fontweight='bold')
-ax.set_title('자치구 4분면 분류: CCTV 밀도 vs 범죄율', fontsize=14, fontweight='bold')
-ax.legend(loc='best', fontsize=10)
-ax.grid(alpha=0.3)
-
-plt.tight_layout()
-plt.savefig(os.path.join(FIGURES_PATH, 'day9_quadrant_classification.png'), dpi=300, bbox_inches='tight')
-plt.close()
-print("   [OK] day9_quadrant_classification.png")
 
 # ============================================================================
-# Day 6: 지역별 히트맵
+# 그래프 함수 (프로세스 풀에서 실행되므로 모듈 최상위에 정의)
+#   context: {'df', 'residuals', 'fitted', 'cooks_d', 'quadrant_x', 'quadrants'} - 읽기 전용
 # ============================================================================
-print("[10/10] 지역별 히트맵 생성 중...")
-
-heatmap_data = df[['자치구', '인구당_총CCTV', '인구당_CCTV효과범죄율']].set_index('자치구')
-heatmap_data_normalized = (heatmap_data - heatmap_data.mean()) / heatmap_data.std()
 
-fig, ax = plt.subplots(figsize=(6, 12))
-sns.heatmap(heatmap_data_normalized, annot=False, cmap='RdYlGn_r',
-            center=0, linewidths=0.5, cbar_kws={'label': '표준화 값'})
-ax.set_title('자치구별 CCTV 밀도 vs 범죄율 (표준화)', fontsize=14, fontweight='bold')
-plt.tight_layout()
-plt.savefig(os.path.join(FIGURES_PATH, 'day6_district_heatmap.png'), dpi=300, bbox_inches='tight')
-plt.close()
-print("   [OK] day6_district_heatmap.png")
-
-print("\n" + "="*80)
-print("모든 그래프 생성 완료! (10개)")
-print("="*80)
-
-# ============================================================================
-# 완전한 최종 보고서 생성
-# ============================================================================
-print("\n완전한 최종 보고서 생성 중...")
-
-stats_summary = {
-    'corr_total_cctv_crime': df['인구당_총CCTV'].corr(df['인구당_CCTV효과범죄율']),
-    'corr_security_cctv_crime': df['인구당_방범용'].corr(df['인구당_CCTV효과범죄율']),
-    'corr_density_crime': df['인구밀도'].corr(df['인구당_CCTV효과범죄율']),
-    'r_squared': model.rsquared,
-    'adj_r_squared': model.rsquared_adj,
-    'f_pvalue': model.f_pvalue,
-    'coef_intercept': model.params['const'],
-    'coef_security': model.params['인구당_방범용'],
-    'coef_density': model.params['인구밀도'],
-    'pval_security': model.pvalues['인구당_방범용'],
-    'pval_density': model.pvalues['인구밀도'],
-    'q1_count': len(df[df['분면'] == 'Q1: 고CCTV/고범죄']),
-    'q2_count': len(df[df['분면'] == 'Q2: 저CCTV/고범죄 (우선순위)']),
-    'q3_count': len(df[df['분면'] == 'Q3: 저CCTV/저범죄']),
-    'q4_count': len(df[df['분면'] == 'Q4: 고CCTV/저범죄 (효과적)']),
-    'q2_districts': ', '.join(df[df['분면'] == 'Q2: 저CCTV/고범죄 (우선순위)']['자치구'].tolist()),
-    'q4_districts': ', '.join(df[df['분면'] == 'Q4: 고CCTV/저범죄 (효과적)']['자치구'].tolist())
-}
+def plot_correlation_heatmap(context, save_path):
+    """상관계수 히트맵 (Day 4)"""
+    df = context['df']
+
+    corr_vars = [
+        '인구당_총CCTV', '인구당_방범용', '인구당_교통단속용',
+        '인구당_CCTV효과범죄율', '인구당_절도율', '인구당_강도율',
+        '인구밀도'
+    ]
+    corr_matrix = correlation_matrix(df, corr_vars, method='pearson')
+
+    plt.figure(figsize=(10, 8))
+    sns.heatmap(corr_matrix, annot=True, fmt='.3f', cmap='coolwarm', center=0,
+                square=True, linewidths=1, cbar_kws={"shrink": 0.8})
+    plt.title('주요 변수 상관계수 히트맵 (Pearson)', fontsize=14, fontweight='bold')
+    plt.tight_layout()
+    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    plt.close()
+
+
+def plot_scatter_cctv_crime(context, save_path):
+    """CCTV vs 범죄율 산점도 (Day 4)"""
+    df = context['df']
+
+    fig, axes = plt.subplots(1, 2, figsize=(16, 6))
+
+    # 총CCTV vs 범죄율
+    axes[0].scatter(df['인구당_총CCTV'], df['인구당_CCTV효과범죄율'],
+                    s=100, alpha=0.6, edgecolors='black')
+    axes[0].set_xlabel('인구당 총CCTV (대/천명)')
+    axes[0].set_ylabel('인구당 범죄율 (건/천명)')
+    axes[0].set_title('총CCTV vs 범죄율')
+    axes[0].grid(alpha=0.3)
+
+    # 방범용CCTV vs 범죄율
+    axes[1].scatter(df['인구당_방범용'], df['인구당_CCTV효과범죄율'],
+                    s=100, alpha=0.6, edgecolors='black', color='green')
+    axes[1].set_xlabel('인구당 방범용CCTV (대/천명)')
+    axes[1].set_ylabel('인구당 범죄율 (건/천명)')
+    axes[1].set_title('방범용CCTV vs 범죄율')
+    axes[1].grid(alpha=0.3)
+
+    plt.tight_layout()
+    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    plt.close()
+
+
+def plot_top10_cctv(context, save_path):
+    """인구당 CCTV 상위 10개 자치구 (Day 4)"""
+    df = context['df']
+
+    top10 = df.nlargest(10, '인구당_총CCTV').sort_values('인구당_총CCTV')
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.barh(top10['자치구'], top10['인구당_총CCTV'], color='steelblue')
+    ax.set_xlabel('인구당 총CCTV (대/천명)', fontsize=12)
+    ax.set_title('인구당 CCTV 상위 10개 자치구', fontsize=14, fontweight='bold')
+    ax.grid(axis='x', alpha=0.3)
+    plt.tight_layout()
+    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    plt.close()
+
+
+def plot_cctv_type_correlation(context, save_path):
+    """CCTV 유형별 범죄율 상관계수 (Day 5)"""
+    df = context['df']
+
+    cctv_types = ['인구당_방범용', '인구당_교통단속용', '인구당_어린이안전용']
+    correlations = [df[ctype].corr(df['인구당_CCTV효과범죄율']) for ctype in cctv_types]
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    colors = ['green' if c < 0 else 'red' for c in correlations]
+    ax.bar(range(len(cctv_types)), correlations, color=colors, alpha=0.7, edgecolor='black')
+    ax.set_xticks(range(len(cctv_types)))
+    ax.set_xticklabels([c.replace('인구당_', '') for c in cctv_types])
+    ax.set_ylabel('상관계수')
+    ax.set_title('CCTV 유형별 범죄율과의 상관관계', fontsize=14, fontweight='bold')
+    ax.axhline(0, color='black', linewidth=0.8)
+    ax.grid(axis='y', alpha=0.3)
+    plt.tight_layout()
+    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    plt.close()
+
+
+def plot_crime_type_avg(context, save_path):
+    """CCTV 효과 범죄 유형별 평균 (Day 5)"""
+    df = context['df']
+
+    crime_types = ['인구당_절도율', '인구당_강도율', '인구당_차량범죄율']
+    crime_means = [df[ct].mean() for ct in crime_types]
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.bar(range(len(crime_types)), crime_means, color=['steelblue', 'coral', 'gold'],
+           alpha=0.7, edgecolor='black')
+    ax.set_xticks(range(len(crime_types)))
+    ax.set_xticklabels([ct.replace('인구당_', '').replace('율', '') for ct in crime_types])
+    ax.set_ylabel('평균 범죄율 (건/천명)')
+    ax.set_title('CCTV 효과 범죄 유형별 평균', fontsize=14, fontweight='bold')
+    ax.grid(axis='y', alpha=0.3)
+
+    for i, v in enumerate(crime_means):
+        ax.text(i, v + 0.05, f'{v:.2f}', ha='center', fontweight='bold')
+
+    plt.tight_layout()
+    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    plt.close()
+
+
+def plot_qq(context, save_path):
+    """잔차 Q-Q Plot (Day 8)"""
+    residuals = context['residuals']
+
+    fig, ax = plt.subplots(figsize=(8, 6))
+    stats.probplot(residuals, dist="norm", plot=ax)
+    ax.set_title('Q-Q Plot (잔차 정규성 검사)', fontsize=14, fontweight='bold')
+    plt.tight_layout()
+    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    plt.close()
+
+
+def plot_residuals_fitted(context, save_path):
+    """잔차 vs 예측값 (Day 8)"""
+    residuals = context['residuals']
+    fitted = context['fitted']
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.scatter(fitted, residuals, alpha=0.6, edgecolors='black')
+    ax.axhline(0, color='red', linestyle='--', linewidth=2)
+    ax.set_xlabel('예측값')
+    ax.set_ylabel('잔차')
+    ax.set_title('잔차 vs 예측값 (등분산성 검사)', fontsize=14, fontweight='bold')
+    ax.grid(alpha=0.3)
+    plt.tight_layout()
+    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    plt.close()
+
+
+def plot_cooks_distance(context, save_path):
+    """Cook's Distance (Day 8)"""
+    df = context['df']
+    cooks_d = context['cooks_d']
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.stem(range(len(cooks_d)), cooks_d, markerfmt=',')
+    ax.set_xlabel('관측치 인덱스')
+    ax.set_ylabel("Cook's Distance")
+    ax.set_title("Cook's Distance (영향력 큰 관측치 탐지)", fontsize=14, fontweight='bold')
+    ax.axhline(4/len(df), color='red', linestyle='--', label='임계값 (4/n)')
+    ax.legend()
+    plt.tight_layout()
+    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    plt.close()
+
+
+def plot_quadrant_classification(context, save_path):
+    """자치구 4분면 분류 산점도 (Day 9) - x축은 context['quadrant_x'], 분면은 context['quadrants']"""
+    df = context['df']
+    x_col = context['quadrant_x']
+    y_col = '인구당_CCTV효과범죄율'
+    quadrants = context['quadrants']
+
+    cctv_median = df[x_col].median()
+    crime_median = df[y_col].median()
+
+    color_map = {
+        'Q1: 고CCTV/고범죄': 'orange',
+        'Q2: 저CCTV/고범죄 (우선순위)': 'red',
+        'Q3: 저CCTV/저범죄': 'lightblue',
+        'Q4: 고CCTV/저범죄 (효과적)': 'green'
+    }
+
+    fig, ax = plt.subplots(figsize=(14, 10))
+
+    for quadrant, color in color_map.items():
+        subset = df[quadrants == quadrant]
+        ax.scatter(subset[x_col], subset[y_col],
+                   s=200, alpha=0.7, edgecolors='black', linewidth=1.5,
+                   color=color, label=quadrant)
+
+        # 자치구 이름 라벨
+        for idx, row in subset.iterrows():
+            ax.annotate(row['자치구'],
+                       (row[x_col], row[y_col]),
+                       fontsize=9, ha='center', va='bottom')
+
+    # 중앙값 기준선
+    ax.axvline(cctv_median, color='gray', linestyle='--', linewidth=2, alpha=0.5)
+    ax.axhline(crime_median, color='gray', linestyle='--', linewidth=2, alpha=0.5)
+
+    ax.set_xlabel(QUADRANT_X[x_col], fontsize=12, fontweight='bold')
+    ax.set_ylabel('인구당 CCTV효과범죄율 (건/천명)', fontsize=12, fontweight='bold')
+    ax.set_title(f'자치구 4분면 분류: {QUADRANT_X[x_col]} vs 범죄율', fontsize=14, fontweight='bold')
+    ax.legend(loc='best', fontsize=10)
+    ax.grid(alpha=0.3)
+
+    plt.tight_layout()
+    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    plt.close()
+
+
+def plot_district_heatmap(context, save_path):
+    """자치구별 CCTV 밀도 vs 범죄율 표준화 히트맵 (Day 6)"""
+    df = context['df']
+
+    heatmap_data = df[['자치구', '인구당_총CCTV', '인구당_CCTV효과범죄율']].set_index('자치구')
+    heatmap_data_normalized = (heatmap_data - heatmap_data.mean()) / heatmap_data.std()
+
+    fig, ax = plt.subplots(figsize=(6, 12))
+    sns.heatmap(heatmap_data_normalized, annot=False, cmap='RdYlGn_r',
+                center=0, linewidths=0.5, cbar_kws={'label': '표준화 값'})
+    ax.set_title('자치구별 CCTV 밀도 vs 범죄율 (표준화)', fontsize=14, fontweight='bold')
+    plt.tight_layout()
+    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    plt.close()
+
+FIGURES = [
+    ('day4_correlation_heatmap.png', plot_correlation_heatmap),
+    ('day4_scatter_cctv_crime.png', plot_scatter_cctv_crime),
+    ('day4_top10_cctv.png', plot_top10_cctv),
+    ('day5_cctv_type_correlation.png', plot_cctv_type_correlation),
+    ('day5_crime_type_avg.png', plot_crime_type_avg),
+    ('day8_qq_plot.png', plot_qq),
+    ('day8_residuals_fitted.png', plot_residuals_fitted),
+    ('day8_cooks_distance.png', plot_cooks_distance),
+    ('day9_quadrant_classification.png', plot_quadrant_classification),
+    ('day6_district_heatmap.png', plot_district_heatmap),
+]
 
-# VIF 계산
-vif_data = pd.DataFrame()
-vif_data['변수'] = X_cols
-vif_data['VIF'] = [variance_inflation_factor(X.values, i) for i in range(len(X_cols))]
 
-final_report = f"""# 서울시 CCTV 설치 현황과 범죄 발생 상관 분석
+def main():
+    parser = argparse.ArgumentParser(description='완전한 최종 보고서 생성 (모든 그래프 포함)')
+    parser.add_argument('--workers', type=int, default=None, help='그래프 렌더링 프로세스 수 (기본: CPU 수)')
+    parser.add_argument('--serial', action='store_true', help='그래프를 순차적으로 렌더링')
+    parser.add_argument('--quadrant-x', default='인구당_방범용', choices=list(QUADRANT_X),
+                        help='4분면 산점도 x축 (커버리지 지표는 compute_coverage.py 실행 필요)')
+    args = parser.parse_args()
+
+    print("="*80)
+    print("완전한 최종 보고서 생성 (모든 그래프 포함)")
+    print("="*80)
+
+    # 데이터 로드 (프로젝트 루트 기준)
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    data_path = os.path.join(base_dir, 'data', 'processed', 'integrated_data_with_quadrant.csv')
+
+    df = load_table(data_path, columns=REPORT_COLUMNS)
+    if args.quadrant_x not in df.columns:
+        coverage_path = os.path.join(base_dir, 'data', 'processed', 'coverage_자치구.csv')
+        coverage = load_table(coverage_path) if os.path.exists(coverage_path) else None
+        if coverage is None or args.quadrant_x not in coverage.columns:
+            print(f"[ERROR] '{args.quadrant_x}' 컬럼이 없습니다: {coverage_path}")
+            print("   python 02_코드/compute_coverage.py --boundaries <경계 GeoJSON> 을 먼저 실행해주세요.")
+            sys.exit(1)
+        df = df.merge(coverage[['자치구', args.quadrant_x]], on='자치구', how='left')
+    print(f"데이터 로드 완료: {df.shape}")
+
+    # 4분면 분류 - x축이 바뀌면 같은 중앙값 기준으로 재분류 (산점도와 보고서 표에서 함께 사용)
+    if args.quadrant_x == '인구당_방범용':
+        quadrants = df['분면']
+    else:
+        quadrants = classify_quadrant(df, args.quadrant_x, '인구당_CCTV효과범죄율')
+
+    # 그래프 저장 경로
+    figures_path = os.path.join(base_dir, 'results', 'figures')
+    os.makedirs(figures_path, exist_ok=True)
+    reports_path = os.path.join(base_dir, 'results', 'reports')
+    os.makedirs(reports_path, exist_ok=True)
+
+    set_korean_font()
+    set_plot_style()
+
+    # ============================================================================
+    # Day 8: 회귀 모형 (진단 그래프 및 보고서에서 사용)
+    # ============================================================================
+    X_cols = ['인구당_방범용', '인구밀도']
+    y_col = '인구당_CCTV효과범죄율'
+    X = df[X_cols]
+    y = df[y_col]
+    X_with_const = sm.add_constant(X)
+    model = sm.OLS(y, X_with_const).fit()
+
+    diagnostics = regression_diagnostics(df, y_col, X_cols)
+    context = {
+        'df': df,
+        'residuals': diagnostics['잔차'],
+        'fitted': diagnostics['적합값'],
+        'cooks_d': diagnostics['쿡거리'].to_numpy(),
+        'quadrant_x': args.quadrant_x,
+        'quadrants': quadrants
+    }
+
+    # ============================================================================
+    # 그래프 렌더링 (독립적인 10개 그래프를 병렬 생성)
+    # ============================================================================
+    print(f"\n그래프 {len(FIGURES)}개 생성 중...")
+    render_figures(FIGURES, context, figures_path,
+                   workers=args.workers, parallel=not args.serial)
+
+    print("\n" + "="*80)
+    print("모든 그래프 생성 완료! (10개)")
+    print("="*80)
+
+    # ============================================================================
+    # 완전한 최종 보고서 생성
+    # ============================================================================
+    print("\n완전한 최종 보고서 생성 중...")
+
+    stats_summary = {
+        'corr_total_cctv_crime': df['인구당_총CCTV'].corr(df['인구당_CCTV효과범죄율']),
+        'corr_security_cctv_crime': df['인구당_방범용'].corr(df['인구당_CCTV효과범죄율']),
+        'corr_density_crime': df['인구밀도'].corr(df['인구당_CCTV효과범죄율']),
+        'r_squared': model.rsquared,
+        'adj_r_squared': model.rsquared_adj,
+        'f_pvalue': model.f_pvalue,
+        'coef_intercept': model.params['const'],
+        'coef_security': model.params['인구당_방범용'],
+        'coef_density': model.params['인구밀도'],
+        'pval_security': model.pvalues['인구당_방범용'],
+        'pval_density': model.pvalues['인구밀도'],
+        'q1_count': int((quadrants == 'Q1: 고CCTV/고범죄').sum()),
+        'q2_count': int((quadrants == 'Q2: 저CCTV/고범죄 (우선순위)').sum()),
+        'q3_count': int((quadrants == 'Q3: 저CCTV/저범죄').sum()),
+        'q4_count': int((quadrants == 'Q4: 고CCTV/저범죄 (효과적)').sum()),
+        'q2_districts': ', '.join(df.loc[quadrants == 'Q2: 저CCTV/고범죄 (우선순위)', '자치구'].tolist()),
+        'q4_districts': ', '.join(df.loc[quadrants == 'Q4: 고CCTV/저범죄 (효과적)', '자치구'].tolist())
+    }
+
+    # VIF 계산
+    vif_data = vif_table(df, X_cols)
+
+    final_report = f"""# 서울시 CCTV 설치 현황과 범죄 발생 상관 분석
 
 **분석 기간**: 2025년 7월 4일 ~ 7월 15일
 **데이터 기준**: 서울시 25개 자치구 (2023년)
@@ -668,25 +733,29 @@ CCTV 설치는 범죄 예방의 필요조건이지 충분조건은 아니다. 
 **문의**: [GitHub Issues]
 """
 
-report_file = os.path.join(reports_path, 'COMPLETE_FINAL_REPORT.md')
-with open(report_file, 'w', encoding='utf-8') as f:
-    f.write(final_report)
-
-print("\n" + "="*80)
-print("완전한 최종 보고서 생성 완료!")
-print("="*80)
-print("\n파일 위치:")
-print(f"  - {report_file}")
-print(f"  - {FIGURES_PATH} (그래프 10개)")
-print("\n생성된 그래프:")
-print("  1. day4_correlation_heatmap.png - 상관계수 히트맵")
-print("  2. day4_scatter_cctv_crime.png - CCTV vs 범죄율 산점도")
-print("  3. day4_top10_cctv.png - 상위 자치구")
-print("  4. day5_cctv_type_correlation.png - CCTV 유형별 효과")
-print("  5. day5_crime_type_avg.png - 범죄 유형별 평균")
-print("  6. day8_qq_plot.png - Q-Q Plot (정규성)")
-print("  7. day8_residuals_fitted.png - 잔차 vs 예측값")
-print("  8. day8_cooks_distance.png - Cook's Distance")
-print("  9. day9_quadrant_classification.png - 4분면 분류 ([STAR] 핵심)")
-print(" 10. day6_district_heatmap.png - 지역별 히트맵")
-print("="*80)
+    report_file = os.path.join(reports_path, 'COMPLETE_FINAL_REPORT.md')
+    with open(report_file, 'w', encoding='utf-8') as f:
+        f.write(final_report)
+
+    print("\n" + "="*80)
+    print("완전한 최종 보고서 생성 완료!")
+    print("="*80)
+    print("\n파일 위치:")
+    print(f"  - {report_file}")
+    print(f"  - {figures_path} (그래프 10개)")
+    print("\n생성된 그래프:")
+    print("  1. day4_correlation_heatmap.png - 상관계수 히트맵")
+    print("  2. day4_scatter_cctv_crime.png - CCTV vs 범죄율 산점도")
+    print("  3. day4_top10_cctv.png - 상위 자치구")
+    print("  4. day5_cctv_type_correlation.png - CCTV 유형별 효과")
+    print("  5. day5_crime_type_avg.png - 범죄 유형별 평균")
+    print("  6. day8_qq_plot.png - Q-Q Plot (정규성)")
+    print("  7. day8_residuals_fitted.png - 잔차 vs 예측값")
+    print("  8. day8_cooks_distance.png - Cook's Distance")
+    print("  9. day9_quadrant_classification.png - 4분면 분류 ([STAR] 핵심)")
+    print(" 10. day6_district_heatmap.png - 지역별 히트맵")
+    print("="*80)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ PDF 보고서 자동 생성 스크립트
 
 import os
 import sys
+sys.path.append('.')
 from datetime import datetime
 import pandas as pd
 import numpy as np
@@ -32,6 +33,8 @@ from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
 
+from utils import classify_quadrant, load_table, zscore, correlation_matrix, CCTV_UNIT_COST
+
 print("="*80)
 print("PDF 보고서 자동 생성 시작")
 print("="*80)
@@ -67,7 +70,10 @@ base_dir = os.path.dirname(os.path.abspath(__file__))
 data_path = os.path.join(base_dir, 'data', 'processed', 'integrated_data_with_analysis.csv')
 
 try:
-    df = pd.read_csv(data_path, encoding='utf-8-sig')
+    df = load_table(data_path, columns=[
+        '자치구', 'CCTV_총계', '총범죄_발생', '총인구',
+        'CCTV_per_1000', '범죄_per_1000', '방범CCTV_per_1000', 'CCTV효과범죄_per_1000'
+    ])
     print(f"✓ 데이터 로드 완료: {df.shape[0]}개 자치구")
 except FileNotFoundError:
     print(f"❌ 데이터 파일을 찾을 수 없습니다: {data_path}")
@@ -78,9 +84,11 @@ except FileNotFoundError:
 print("\n[2/5] 통계 분석 중...")
 
 # 상관계수 계산
-corr_cctv_crime = df['CCTV_per_1000'].corr(df['범죄_per_1000'])
-corr_security_crime = df['방범CCTV_per_1000'].corr(df['CCTV효과범죄_per_1000'])
-corr_pop_cctv = df['총인구'].corr(df['CCTV_총계'])
+corr = correlation_matrix(df, ['CCTV_per_1000', '범죄_per_1000', '방범CCTV_per_1000',
+                               'CCTV효과범죄_per_1000', '총인구', 'CCTV_총계'])
+corr_cctv_crime = corr.loc['CCTV_per_1000', '범죄_per_1000']
+corr_security_crime = corr.loc['방범CCTV_per_1000', 'CCTV효과범죄_per_1000']
+corr_pop_cctv = corr.loc['총인구', 'CCTV_총계']
 
 # 선형회귀 R²
 from scipy.stats import linregress
@@ -93,17 +101,8 @@ r_squared = r_value ** 2
 cctv_median = df['방범CCTV_per_1000'].median()
 crime_median = df['CCTV효과범죄_per_1000'].median()
 
-def classify_quadrant(row):
-    if row['방범CCTV_per_1000'] >= cctv_median and row['CCTV효과범죄_per_1000'] >= crime_median:
-        return 'Q1'
-    elif row['방범CCTV_per_1000'] < cctv_median and row['CCTV효과범죄_per_1000'] >= crime_median:
-        return 'Q2'
-    elif row['방범CCTV_per_1000'] < cctv_median and row['CCTV효과범죄_per_1000'] < crime_median:
-        return 'Q3'
-    else:
-        return 'Q4'
-
-df['Quadrant'] = df.apply(classify_quadrant, axis=1)
+df['Quadrant'] = classify_quadrant(df, '방범CCTV_per_1000', 'CCTV효과범죄_per_1000',
+                                   labels=['Q1', 'Q2', 'Q3', 'Q4'])
 
 q1_districts = df[df['Quadrant'] == 'Q1']['자치구'].tolist()
 q2_districts = df[df['Quadrant'] == 'Q2']['자치구'].tolist()
@@ -111,8 +110,8 @@ q3_districts = df[df['Quadrant'] == 'Q3']['자치구'].tolist()
 q4_districts = df[df['Quadrant'] == 'Q4']['자치구'].tolist()
 
 # 위험도 점수 (Z-score)
-df['범죄_zscore'] = (df['범죄_per_1000'] - df['범죄_per_1000'].mean()) / df['범죄_per_1000'].std()
-df['CCTV_zscore'] = (df['CCTV_per_1000'] - df['CCTV_per_1000'].mean()) / df['CCTV_per_1000'].std()
+df['범죄_zscore'] = zscore(df['범죄_per_1000'])
+df['CCTV_zscore'] = zscore(df['CCTV_per_1000'])
 df['위험도점수'] = df['범죄_zscore'] - df['CCTV_zscore']
 df_sorted = df.sort_values('위험도점수', ascending=False)
 
@@ -452,17 +451,31 @@ story.append(Spacer(1, 0.1*inch))
 
 # Q2 상세 테이블
 q2_df = df[df['Quadrant'] == 'Q2'][['자치구', '방범CCTV_per_1000', 'CCTV효과범죄_per_1000', '총인구']].copy()
-q2_df['부족분'] = cctv_median - q2_df['방범CCTV_per_1000']
-q2_df['필요대수'] = (q2_df['부족분'] * q2_df['총인구'] / 1000).round(0).astype(int)
-q2_df['필요예산'] = (q2_df['필요대수'] * 1.5).round(0).astype(int)  # 대당 150만원
 
-q2_data = [['자치구', '방범CCTV', 'CCTV효과범죄', '부족분', '필요대수', '필요예산']]
+# 설치 위치 최적화 결과(optimize_placement.py)가 있으면 사용, 없으면 중앙값 격차 기준
+placement_path = os.path.join(base_dir, 'data', 'processed', 'placement_summary.csv')
+try:
+    placement = load_table(placement_path)
+    q2_df = q2_df.merge(placement, on='자치구', how='left').fillna({'신규설치': 0, '추가커버': 0, '필요예산': 0})
+    q2_df['필요대수'] = q2_df['신규설치'].astype(int)
+    q2_df['필요예산'] = q2_df['필요예산'].round(0).astype(int)
+    gap_col, gap_header, gap_format = '추가커버', '추가커버범죄', "{:,.0f}건"
+    budget_basis = "설치 위치 최적화"
+    print("✓ 설치 위치 최적화 결과 사용")
+except FileNotFoundError:
+    q2_df['부족분'] = cctv_median - q2_df['방범CCTV_per_1000']
+    q2_df['필요대수'] = (q2_df['부족분'] * q2_df['총인구'] / 1000).round(0).astype(int)
+    q2_df['필요예산'] = (q2_df['필요대수'] * CCTV_UNIT_COST).round(0).astype(int)
+    gap_col, gap_header, gap_format = '부족분', '부족분', "{:.2f}대"
+    budget_basis = "중앙값 격차"
+
+q2_data = [['자치구', '방범CCTV', 'CCTV효과범죄', gap_header, '필요대수', '필요예산']]
 for idx, row in q2_df.iterrows():
     q2_data.append([
         row['자치구'],
         f"{row['방범CCTV_per_1000']:.2f}대",
         f"{row['CCTV효과범죄_per_1000']:.2f}건",
-        f"{row['부족분']:.2f}대",
+        gap_format.format(row[gap_col]),
         f"{row['필요대수']:,}대",
         f"{row['필요예산']:,}백만원"
     ])
@@ -485,7 +498,7 @@ story.append(Spacer(1, 0.1*inch))
 total_needed = q2_df['필요대수'].sum()
 total_budget = q2_df['필요예산'].sum()
 story.append(Paragraph(f"<b>총 필요 CCTV:</b> {total_needed:,}대", body_style))
-story.append(Paragraph(f"<b>총 필요 예산:</b> 약 {total_budget/100:.0f}억원 (대당 150만원 기준)", body_style))
+story.append(Paragraph(f"<b>총 필요 예산:</b> 약 {total_budget/100:.0f}억원 (대당 {CCTV_UNIT_COST*100:.0f}만원, {budget_basis} 기준)", body_style))
 story.append(Paragraph(f"<b>예상 효과:</b> 연간 약 320건 범죄 감소 (-20%)", body_style))
 story.append(PageBreak())
 
@@ -0,0 +1,82 @@
+"""
+좌표(점) 데이터 수집 -> 지역별 표
+
+CCTV 설치 지점 / 지오코딩된 범죄 발생 지점 CSV 를 읽어 압축 저장(Parquet)하고,
+지정한 지역 레이어로 집계해 run_real_data_analysis.py 와 같은 컬럼
+(CCTV_총계, 방범용, ... / 총범죄_발생, 절도_발생, ...)의 표를 만듭니다.
+
+실행:
+    # 점 데이터의 '자치구' 컬럼으로 집계
+    python 02_코드/ingest_points.py --cctv cctv_points.csv --incidents incidents.csv
+
+    # 경계 폴리곤으로 집계 (행정동)
+    python 02_코드/ingest_points.py --cctv cctv_points.csv --incidents incidents.csv \\
+        --layer 행정동 --boundaries seoul_dong.geojson --name-property adm_cd
+
+    # 250m 격자
+    python 02_코드/ingest_points.py --cctv cctv_points.csv --incidents incidents.csv --layer 격자250m
+
+    # 집계 결과로 분석 실행
+    CCTV_TABLE=data/processed/points/cctv_자치구.csv CRIME_TABLE=data/processed/points/crime_자치구.csv \\
+        python 02_코드/run_real_data_analysis.py
+"""
+
+import sys
+import os
+import time
+import argparse
+sys.path.append('.')
+
+from utils import *
+
+OUTPUT_DIR = 'data/processed/points'
+
+
+def ingest(path, spec, layer, name, encoding, extra_cols):
+    """점 데이터 로드 -> Parquet 저장 -> 지역별 집계"""
+    started = time.perf_counter()
+    points = load_points(path, spec, encoding=encoding, extra_cols=extra_cols)
+    points.save(os.path.join(OUTPUT_DIR, f'{name}_points.csv'))
+    print(f"[OK] {name}: {points} ({time.perf_counter() - started:.2f}s)")
+
+    started = time.perf_counter()
+    table = aggregate_points(points, layer, spec)
+    region = layer if isinstance(layer, str) else layer.name
+    save_table(table, os.path.join(OUTPUT_DIR, f'{name}_{region}.csv'), export_csv=True)
+    print(f"[OK] {name}: {len(table):,}개 {region} 집계 ({time.perf_counter() - started:.2f}s)")
+    return table
+
+
+def main():
+    parser = argparse.ArgumentParser(description='좌표 데이터 수집 및 지역별 집계')
+    parser.add_argument('--cctv', help='CCTV 설치 지점 CSV')
+    parser.add_argument('--incidents', help='범죄 발생 지점 CSV')
+    parser.add_argument('--layer', default='자치구', choices=list(REGION_LEVELS), help='집계 지역 단위')
+    parser.add_argument('--boundaries', help='경계 GeoJSON (없으면 점 데이터의 지역 컬럼 사용)')
+    parser.add_argument('--name-property', default='SIG_KOR_NM', help='GeoJSON 지역명 속성')
+    parser.add_argument('--cell-size', type=float, default=250, help='격자 크기 (m)')
+    parser.add_argument('--encoding', default='utf-8-sig', help='CSV 인코딩 (원본이 cp949 면 cp949)')
+    args = parser.parse_args()
+
+    if not (args.cctv or args.incidents):
+        parser.error('--cctv 또는 --incidents 중 하나 이상 지정하세요')
+
+    print("="*80)
+    print(f"좌표 데이터 수집 ({args.layer} 단위 집계)")
+    print("="*80)
+
+    layer = region_layer(args.layer, args.boundaries, args.name_property, args.cell_size)
+    extra_cols = (layer,) if isinstance(layer, str) else ()
+
+    if args.cctv:
+        ingest(args.cctv, POINT_SPECS['cctv'], layer, 'cctv', args.encoding, extra_cols)
+    if args.incidents:
+        ingest(args.incidents, POINT_SPECS['incident'], layer, 'crime', args.encoding, extra_cols)
+
+    print("\n" + "="*80)
+    print(f"저장 위치: {OUTPUT_DIR}")
+    print("="*80)
+
+
+if __name__ == "__main__":
+    main()
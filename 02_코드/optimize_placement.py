@@ -0,0 +1,95 @@
+"""
+CCTV 신규 설치 위치 최적화 (Q2 지역)
+
+ingest_points.py 로 저장한 CCTV/범죄 좌표에서 기존 카메라 감시 반경 밖의 범죄를 찾고,
+Q2(저CCTV/고범죄) 자치구 안의 후보 지점 중 예산 안에서 커버되지 않은 범죄를
+가장 많이 커버하는 설치 위치를 고릅니다 (lazy greedy, utils/placement.py).
+
+결과(placement_summary)는 generate_pdf_report.py 의 Q2 예산표에 사용됩니다.
+
+실행:
+    python 02_코드/optimize_placement.py                   # 중앙값 기준 필요 예산과 같은 예산으로 배치
+    python 02_코드/optimize_placement.py --budget 3000     # 예산 30억원
+    python 02_코드/optimize_placement.py --k 500 --candidates streetlights.csv
+"""
+
+import sys
+import os
+import time
+import argparse
+sys.path.append('.')
+
+from utils import *
+
+POINTS_DIR = 'data/processed/points'
+ANALYSIS_PATH = 'data/processed/integrated_data_with_analysis.csv'
+OUTPUT_DIR = 'data/processed'
+
+
+def q2_targets():
+    """Q2 자치구와 중앙값 기준 필요 예산 (generate_pdf_report.py 와 같은 기준)"""
+    df = load_table(ANALYSIS_PATH, columns=['자치구', '총인구', '방범CCTV_per_1000', 'CCTV효과범죄_per_1000'])
+    df['Quadrant'] = classify_quadrant(df, '방범CCTV_per_1000', 'CCTV효과범죄_per_1000', labels=['Q1', 'Q2', 'Q3', 'Q4'])
+    q2 = df[df['Quadrant'] == 'Q2']
+    shortfall = (df['방범CCTV_per_1000'].median() - q2['방범CCTV_per_1000']) * q2['총인구'] / 1000
+    return q2['자치구'].tolist(), float(shortfall.round(0).sum() * CCTV_UNIT_COST)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CCTV 신규 설치 위치 최적화 (Q2 지역)')
+    parser.add_argument('--budget', type=float, help='예산 (백만원, 기본: 중앙값 기준 필요 예산)')
+    parser.add_argument('--k', type=int, help='최대 설치 대수')
+    parser.add_argument('--radius', type=float, default=COVERAGE_RADIUS['방범용'], help='신규 카메라 감시 반경 (m)')
+    parser.add_argument('--candidates', help='후보 지점 CSV (위도, 경도, 자치구) - 없으면 미커버 범죄 격자 중심')
+    parser.add_argument('--cell-size', type=float, default=25, help='후보 격자 크기 (m)')
+    parser.add_argument('--districts', nargs='+', help='대상 자치구 (기본: Q2 자치구)')
+    parser.add_argument('--boundaries', help='자치구 경계 GeoJSON (범죄 좌표에 자치구 컬럼이 없을 때)')
+    args = parser.parse_args()
+
+    print("="*80)
+    print("CCTV 신규 설치 위치 최적화")
+    print("="*80)
+
+    districts, heuristic_budget = q2_targets()
+    districts = args.districts or districts
+    budget = args.budget if args.budget is not None or args.k is not None else heuristic_budget
+    print(f"[OK] 대상 자치구: {', '.join(districts)}")
+    if budget is not None:
+        print(f"[OK] 예산: {budget:,.0f}백만원 (대당 {CCTV_UNIT_COST}백만원)")
+
+    # 1. 좌표 데이터 / 기존 커버리지
+    started = time.perf_counter()
+    cameras = PointSet.load(os.path.join(POINTS_DIR, 'cctv_points.csv'))
+    incidents = PointSet.load(os.path.join(POINTS_DIR, 'crime_points.csv'))
+    if '자치구' not in incidents.attrs:
+        incidents.attrs['자치구'] = incidents.assign(region_layer('자치구', args.boundaries))
+    covered = CoverageEngine(cameras).covered(incidents)
+    print(f"[OK] 기존 감시 반경 내 범죄: {covered.mean():.1%} ({time.perf_counter() - started:.2f}s)")
+
+    # 2. 후보 지점 (대상 자치구만)
+    if args.candidates:
+        candidates = load_points(args.candidates, {'lat_col': '위도', 'lon_col': '경도', 'category_col': '자치구'})
+    else:
+        candidates = grid_candidates(incidents, ~covered, cell_size=args.cell_size, region_col='자치구')
+    keep = candidates.attrs['자치구'].isin(districts).to_numpy()
+    candidates = PointSet(candidates.lat[keep], candidates.lon[keep], candidates.attrs[keep])
+    print(f"[OK] 후보 지점: {len(candidates):,}개")
+
+    # 3. 최적화
+    started = time.perf_counter()
+    optimizer = PlacementOptimizer(candidates, incidents, radius=args.radius, covered=covered)
+    sites = optimizer.solve(k=args.k, budget=budget)
+    print(f"[OK] {optimizer}")
+    print(f"[OK] {len(sites):,}곳 선정, 추가 커버 범죄 {sites['추가커버'].sum():,.0f}건 ({time.perf_counter() - started:.2f}s)")
+
+    summary = summarize_sites(sites)
+    save_table(sites, os.path.join(OUTPUT_DIR, 'placement_sites.csv'), export_csv=True)
+    save_table(summary, os.path.join(OUTPUT_DIR, 'placement_summary.csv'), export_csv=True)
+
+    print("\n" + "="*80)
+    print(summary.to_string(index=False))
+    print("="*80)
+
+
+if __name__ == "__main__":
+    main()
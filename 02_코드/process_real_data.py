@@ -1,16 +1,26 @@
 """
-cctvdataset 폴더의 실제 데이터를 정리하여 분석 가능한 형태로 변환
+01_데이터셋/raw 폴더의 실제 데이터를 정리하여 분석 가능한 형태로 변환
+
+시트 구조(헤더 오프셋, 컬럼 위치, 합계/각주 행)는 utils/constants.py 의 SHEET_SPECS 에 선언하고
+utils.sheets.load_sheet() 로 컬럼 단위 일괄 추출합니다.
 """
 
 import pandas as pd
 import numpy as np
 import sys
 import io
+import os
+sys.path.append('.')
+
+from utils import SHEET_SPECS, load_sheet, load_sheets, check_districts
 
 # Windows 인코딩 설정
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
+# 원본 파일 폴더
+SOURCE_DIR = '01_데이터셋/raw'
+
 print("="*80)
 print("실제 데이터 처리 및 정리")
 print("="*80)
@@ -18,32 +28,9 @@ print("="*80)
 # 1. CCTV 데이터 처리
 print("\n[1/3] CCTV 데이터 처리 중...")
 try:
-    cctv_df = pd.read_excel('cctvdataset/서울시 자치구 (목적별) CCTV 설치현황(\'25.6.30 기준).xlsx',
-                            header=None)
-
-    # 헤더 스킵하고 데이터 추출
-    cctv_data = []
-    for i in range(5, len(cctv_df)):  # 5번째 줄부터 데이터 시작
-        row = cctv_df.iloc[i]
-        district = row[1]
-        if pd.isna(district) or district == '자치구':
-            continue
-
-        cctv_data.append({
-            '자치구': district,
-            'CCTV_총계': row[2],
-            '범죄예방_총계': row[3],
-            '방범용': row[4],
-            '어린이보호구역': row[5],
-            '공원놀이터': row[6],
-            '쓰레기무단투기': row[7] if str(row[7]) != '-' else 0,
-            '시설안전_화재예방': row[8],
-            '교통단속': row[9],
-            '교통정보수집_분석': row[10],
-            '기타': row[11]
-        })
-
-    cctv_clean = pd.DataFrame(cctv_data)
+    cctv_clean = load_sheet(os.path.join(SOURCE_DIR, '서울시 자치구 (목적별) CCTV 설치현황(\'25.6.30 기준).xlsx'),
+                            SHEET_SPECS['cctv_purpose'])
+    check_districts(cctv_clean, 'CCTV')
     print(f"[OK] CCTV 데이터: {len(cctv_clean)}개 자치구")
     print(f"     컬럼: {list(cctv_clean.columns)}")
 
@@ -54,39 +41,9 @@ except Exception as e:
 # 2. 5대 범죄 데이터 처리
 print("\n[2/3] 5대 범죄 발생현황 데이터 처리 중...")
 try:
-    crime_df = pd.read_csv('cctvdataset/5대+범죄+발생현황_20251210202928.csv', encoding='utf-8-sig')
-
-    # 헤더 스킵하고 데이터 추출 (5번째 줄부터)
-    crime_data = []
-    for i in range(5, len(crime_df)):
-        row = crime_df.iloc[i]
-        district = row[1]
-        if pd.isna(district) or district == '소계':
-            continue
-
-        crime_data.append({
-            '자치구': district,
-            '총범죄_발생': row[2],
-            '총범죄_검거': row[3],
-            '살인_발생': row[4],
-            '살인_검거': row[5],
-            '강도_발생': row[6],
-            '강도_검거': row[7],
-            '강간강제추행_발생': row[8],
-            '강간강제추행_검거': row[9],
-            '절도_발생': row[10],
-            '절도_검거': row[11],
-            '폭력_발생': row[12],
-            '폭력_검거': row[13]
-        })
-
-    crime_clean = pd.DataFrame(crime_data)
-
-    # '-' 값을 0으로 변환
-    for col in crime_clean.columns:
-        if col != '자치구':
-            crime_clean[col] = pd.to_numeric(crime_clean[col].replace('-', 0), errors='coerce').fillna(0)
-
+    crime_clean = load_sheet(os.path.join(SOURCE_DIR, '5대+범죄+발생현황_20251210202928.csv'),
+                             SHEET_SPECS['crime_5major'])
+    check_districts(crime_clean, '범죄')
     print(f"[OK] 범죄 데이터: {len(crime_clean)}개 자치구")
     print(f"     컬럼: {list(crime_clean.columns)}")
 
@@ -97,35 +54,9 @@ except Exception as e:
 # 3. 인구 데이터 처리
 print("\n[3/3] 등록인구 데이터 처리 중...")
 try:
-    pop_df = pd.read_csv('cctvdataset/등록인구_20251210203438.csv', encoding='utf-8-sig')
-
-    # 헤더 스킵하고 데이터 추출 (4번째 줄부터)
-    pop_data = []
-    for i in range(4, len(pop_df)):
-        row = pop_df.iloc[i]
-        district = row[1]
-        if pd.isna(district) or district == '소계':
-            continue
-
-        # 자치구명에서 '구' 추출
-        if '구' in district:
-            district_name = district
-        else:
-            continue
-
-        pop_data.append({
-            '자치구': district_name,
-            '세대수': row[2],
-            '총인구': row[3],
-            '남자': row[4],
-            '여자': row[5],
-            '한국인_총계': row[6],
-            '등록외국인_총계': row[9],
-            '세대당인구': row[12],
-            '고령자수': row[13]
-        })
-
-    pop_clean = pd.DataFrame(pop_data)
+    pop_clean = load_sheet(os.path.join(SOURCE_DIR, '등록인구_20251210203438.csv'),
+                           SHEET_SPECS['population'])
+    check_districts(pop_clean, '인구')
     print(f"[OK] 인구 데이터: {len(pop_clean)}개 자치구")
     print(f"     컬럼: {list(pop_clean.columns)}")
 
@@ -133,6 +64,17 @@ except Exception as e:
     print(f"[FAIL] 인구 데이터 처리 실패: {e}")
     pop_clean = None
 
+# 범죄예방 수사용 CCTV 연도별 누적 (기준일별 워크북 전체)
+print("\n[추가] 범죄예방 수사용 CCTV 연도별 누적 데이터 처리 중...")
+try:
+    cctv_yearly = load_sheets(os.path.join(SOURCE_DIR, '*(범죄예방 수사용)*.xlsx'),
+                              SHEET_SPECS['cctv_prevention_yearly'])
+    print(f"[OK] 연도별 CCTV 데이터: {cctv_yearly['파일'].nunique()}개 파일, {len(cctv_yearly)}행")
+
+except Exception as e:
+    print(f"[FAIL] 연도별 CCTV 데이터 처리 실패: {e}")
+    cctv_yearly = None
+
 # 4. 데이터 통합
 print("\n" + "="*80)
 print("데이터 통합 중...")
@@ -161,12 +103,16 @@ if cctv_clean is not None and crime_clean is not None and pop_clean is not None:
 
     # 통합 데이터 저장
     merged.to_csv('data/raw/merged_real_data.csv', index=False, encoding='utf-8-sig')
+    if cctv_yearly is not None:
+        cctv_yearly.to_csv('data/raw/cctv_prevention_yearly.csv', index=False, encoding='utf-8-sig')
 
     print("\n[OK] 저장 완료:")
     print("  - data/raw/cctv_real_2025.csv")
     print("  - data/raw/crime_real_2024.csv")
     print("  - data/raw/population_real_2025.csv")
     print("  - data/raw/merged_real_data.csv")
+    if cctv_yearly is not None:
+        print("  - data/raw/cctv_prevention_yearly.csv")
 
     print("\n" + "="*80)
     print("데이터 요약")
@@ -1,203 +1,251 @@
 """
 전체 분석 파이프라인 실행 스크립트
-Day 2부터 Day 12까지 순차 실행
+Day 2부터 Day 12까지 단계별 Task 로 실행 (변경된 단계만 재실행)
+
+사용법:
+    python run_all_analysis.py               # 입력/파라미터가 바뀐 단계만 실행
+    python run_all_analysis.py --level 행정동  # 지역 단위 지정 (기본: 자치구, 상위 지역 합계도 저장)
+    python run_all_analysis.py --only day9   # 지정 단계만 실행
+    python run_all_analysis.py --from day9   # 지정 단계부터 끝까지 실행
+    python run_all_analysis.py --force       # 전체 강제 실행
+    python run_all_analysis.py --list        # 단계 목록 및 최신 여부 확인
 """
 
 import sys
 import os
+import json
+import argparse
 sys.path.append('.')
 
 import pandas as pd
 import numpy as np
-import matplotlib
-matplotlib.use('Agg')  # Non-interactive backend
-import matplotlib.pyplot as plt
-import seaborn as sns
-from scipy import stats
-import statsmodels.api as sm
-from statsmodels.stats.outliers_influence import variance_inflation_factor
 
 from utils import *
 
-print("="*80)
-print("서울시 CCTV 분석 프로젝트 - 전체 파이프라인 실행")
-print("="*80)
+RAW = {
+    'cctv': os.path.join(DATA_PATHS['raw'], 'cctv_seoul_2023_sample.csv'),
+    'crime': os.path.join(DATA_PATHS['raw'], 'crime_seoul_2023_sample.csv'),
+    'population': os.path.join(DATA_PATHS['raw'], 'population_seoul_2023_sample.csv')
+}
+PROCESSED = {
+    'cctv': os.path.join(DATA_PATHS['processed'], 'cctv_cleaned.csv'),
+    'crime': os.path.join(DATA_PATHS['processed'], 'crime_cleaned.csv'),
+    'population': os.path.join(DATA_PATHS['processed'], 'population_cleaned.csv'),
+    'integrated': os.path.join(DATA_PATHS['processed'], 'integrated_data.csv'),
+    'quadrant': os.path.join(DATA_PATHS['processed'], 'integrated_data_with_quadrant.csv')
+}
+REPORTS = {
+    'regression': os.path.join(DATA_PATHS['reports'], 'day8_regression_summary.json'),
+    'policy': os.path.join(DATA_PATHS['reports'], 'day10_policy_summary.csv'),
+    'final': os.path.join(DATA_PATHS['reports'], 'FINAL_REPORT.md')
+}
+# 인구 천 명당 비율 {새 컬럼: 분자 컬럼} (Day 3)
+PER_CAPITA_COLUMNS = {
+    '인구당_총CCTV': '총_CCTV',
+    '인구당_방범용': '방범용',
+    '인구당_교통단속용': '교통단속용',
+    '인구당_어린이안전용': '어린이안전용',
+    '인구당_CCTV효과범죄율': 'CCTV효과범죄_합계',
+    '인구당_절도율': '절도',
+    '인구당_강도율': '강도',
+    '인구당_차량범죄율': '차량범죄'
+}
+STATE_PATH = os.path.join(DATA_PATHS['logs'], 'pipeline_state.json')
+
+
+def parent_path(level):
+    """상위 지역 합계 파일 경로 (예: 행정동 -> integrated_data_자치구.csv)"""
+    return os.path.join(DATA_PATHS['processed'], f"integrated_data_{REGION_LEVELS[level]['parent']}.csv")
+REGRESSION_CACHE = os.path.join(DATA_PATHS['logs'], 'regression_cache.json')
+
 
 # ============================================================================
 # Day 2: Data Cleaning
 # ============================================================================
-print("\n=== Day 2: Data Cleaning ===")
+def day2_cleaning(cctv_types, crime_types):
+    print("\n=== Day 2: Data Cleaning ===")
 
-# Load raw data
-df_cctv = pd.read_csv(os.path.join(DATA_PATHS['raw'], 'cctv_seoul_2023_sample.csv'), encoding='utf-8-sig')
-df_crime = pd.read_csv(os.path.join(DATA_PATHS['raw'], 'crime_seoul_2023_sample.csv'), encoding='utf-8-sig')
-df_population = pd.read_csv(os.path.join(DATA_PATHS['raw'], 'population_seoul_2023_sample.csv'), encoding='utf-8-sig')
+    # Load raw data
+    df_cctv = pd.read_csv(RAW['cctv'], encoding='utf-8-sig')
+    df_crime = pd.read_csv(RAW['crime'], encoding='utf-8-sig')
+    df_population = pd.read_csv(RAW['population'], encoding='utf-8-sig')
 
-# Standardize district names
-for df in [df_cctv, df_crime, df_population]:
-    df['자치구'] = df['자치구'].apply(standardize_district_name)
+    # Standardize district names (하위 지역 단위 데이터도 상위 자치구 컬럼이 있으면 표준화)
+    for df in [df_cctv, df_crime, df_population]:
+        if '자치구' in df.columns:
+            df['자치구'] = df['자치구'].apply(standardize_district_name)
 
-# Calculate ratios for CCTV
-cctv_types = ['방범용', '교통단속용', '어린이안전용', '기타']
-df_cctv = calculate_ratio_columns(df_cctv, cctv_types, '총_CCTV')
+    # Calculate ratios for CCTV / Crime
+    df_cctv = calculate_ratio_columns(df_cctv, cctv_types, '총_CCTV')
+    df_crime = calculate_ratio_columns(df_crime, crime_types, '총_범죄')
 
-# Calculate ratios for Crime
-crime_types = ['절도', '강도', '차량범죄', '공공장소폭력', '성범죄']
-df_crime = calculate_ratio_columns(df_crime, crime_types, '총_범죄')
+    # Save cleaned data
+    save_table(df_cctv, PROCESSED['cctv'], export_csv=True)
+    save_table(df_crime, PROCESSED['crime'], export_csv=True)
+    save_table(df_population, PROCESSED['population'], export_csv=True)
 
-# Save cleaned data
-os.makedirs(DATA_PATHS['processed'], exist_ok=True)
-df_cctv.to_csv(os.path.join(DATA_PATHS['processed'], 'cctv_cleaned.csv'), index=False, encoding='utf-8-sig')
-df_crime.to_csv(os.path.join(DATA_PATHS['processed'], 'crime_cleaned.csv'), index=False, encoding='utf-8-sig')
-df_population.to_csv(os.path.join(DATA_PATHS['processed'], 'population_cleaned.csv'), index=False, encoding='utf-8-sig')
+    print("[OK] Day 2 completed - cleaned data saved")
 
-print("[OK] Day 2 completed - cleaned data saved")
 
 # ============================================================================
 # Day 3: Data Integration
 # ============================================================================
-print("\n=== Day 3: Data Integration ===")
+def _add_rates(df):
+    """인구 천 명당 CCTV / 범죄율 (지역 단위와 상위 지역 합계에 공통)"""
+    return per_capita(df, PER_CAPITA_COLUMNS, '인구수', decimals=2)
+
+
+def day3_integration(effect_crimes, level):
+    print(f"\n=== Day 3: Data Integration ({level}) ===")
 
-# Merge data
-merged = df_cctv.merge(df_crime, on='자치구', how='inner')
-merged = merged.merge(df_population, on='자치구', how='inner')
+    # Merge data
+    key = region_key(level)
+    merged = integrate([load_table(PROCESSED[name]) for name in ('cctv', 'crime', 'population')], key=key)
+    validate_regions(merged, key=key)
 
-# Calculate per-capita metrics
-merged['인구당_총CCTV'] = (merged['총_CCTV'] / merged['인구수'] * 1000).round(2)
-merged['인구당_방범용'] = (merged['방범용'] / merged['인구수'] * 1000).round(2)
-merged['인구당_교통단속용'] = (merged['교통단속용'] / merged['인구수'] * 1000).round(2)
-merged['인구당_어린이안전용'] = (merged['어린이안전용'] / merged['인구수'] * 1000).round(2)
+    # Calculate per-capita metrics
+    merged['CCTV효과범죄_합계'] = merged[effect_crimes].sum(axis=1)
+    merged = _add_rates(merged)
 
-merged['CCTV효과범죄_합계'] = merged[['절도', '강도', '차량범죄']].sum(axis=1)
-merged['인구당_CCTV효과범죄율'] = (merged['CCTV효과범죄_합계'] / merged['인구수'] * 1000).round(2)
-merged['인구당_절도율'] = (merged['절도'] / merged['인구수'] * 1000).round(2)
-merged['인구당_강도율'] = (merged['강도'] / merged['인구수'] * 1000).round(2)
-merged['인구당_차량범죄율'] = (merged['차량범죄'] / merged['인구수'] * 1000).round(2)
+    # Create categorical variables
+    merged['CCTV밀도_등급'] = pd.qcut(merged['인구당_총CCTV'], q=4, labels=['하', '중하', '중상', '상'])
+    merged['범죄율_등급'] = pd.qcut(merged['인구당_CCTV효과범죄율'], q=4, labels=['하', '중하', '중상', '상'])
 
-# Create categorical variables
-merged['CCTV밀도_등급'] = pd.qcut(merged['인구당_총CCTV'], q=4, labels=['하', '중하', '중상', '상'])
-merged['범죄율_등급'] = pd.qcut(merged['인구당_CCTV효과범죄율'], q=4, labels=['하', '중하', '중상', '상'])
+    save_table(merged, PROCESSED['integrated'], export_csv=True)
 
-merged.to_csv(os.path.join(DATA_PATHS['processed'], 'integrated_data.csv'), index=False, encoding='utf-8-sig')
+    # 상위 지역 합계 (예: 행정동 -> 자치구), 비율은 합계로 다시 계산
+    parent = REGION_LEVELS[level]['parent']
+    if parent is not None and parent in merged.columns:
+        sum_cols = list(dict.fromkeys(PER_CAPITA_COLUMNS.values())) + ['인구수']
+        save_table(_add_rates(rollup(merged, parent, sum_cols)), parent_path(level), export_csv=True)
+        print(f"[OK] 상위 지역({parent}) 합계 저장: {parent_path(level)}")
+
+    print(f"[OK] Day 3 completed - integrated data saved ({merged.shape})")
 
-print(f"[OK] Day 3 completed - integrated data saved ({merged.shape})")
 
 # ============================================================================
 # Day 4-8: Analysis (without plots for speed)
 # ============================================================================
-print("\n=== Day 4-8: Running Analysis ===")
+def day4_8_analysis(x_cols, y_col):
+    print("\n=== Day 4-8: Running Analysis ===")
+
+    merged = load_table(PROCESSED['integrated'], columns=['인구당_총CCTV', '인구당_방범용', '인구당_CCTV효과범죄율', '인구밀도'])
 
-# Correlation analysis
-corr_matrix = merged[['인구당_총CCTV', '인구당_방범용', '인구당_CCTV효과범죄율', '인구밀도']].corr()
-print(f"Correlation (방범용 vs 범죄율): {merged['인구당_방범용'].corr(merged['인구당_CCTV효과범죄율']):.4f}")
+    # Correlation analysis
+    print(f"Correlation (방범용 vs 범죄율): {merged['인구당_방범용'].corr(merged['인구당_CCTV효과범죄율']):.4f}")
 
-# Regression analysis
-X_cols = ['인구당_방범용', '인구밀도']
-y_col = '인구당_CCTV효과범죄율'
-X = merged[X_cols]
-y = merged[y_col]
-X_with_const = sm.add_constant(X)
-model = sm.OLS(y, X_with_const).fit()
+    # Regression analysis (같은 데이터·모형식이면 캐시된 결과 사용)
+    model = RegressionRegistry(merged, REGRESSION_CACHE).fit(y_col, x_cols)
+
+    print(f"R-squared: {model['rsquared']:.4f}")
+    print(f"Adj R-squared: {model['rsquared_adj']:.4f}")
+
+    # 다음 단계(Day 12)에서 사용할 회귀 결과 저장
+    summary = {key: model[key] for key in ['x_cols', 'y_col', 'rsquared', 'rsquared_adj', 'f_pvalue', 'params', 'pvalues']}
+    os.makedirs(DATA_PATHS['reports'], exist_ok=True)
+    with open(REPORTS['regression'], 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+
+    print("[OK] Regression model completed")
 
-print(f"R-squared: {model.rsquared:.4f}")
-print(f"Adj R-squared: {model.rsquared_adj:.4f}")
-print("[OK] Regression model completed")
 
 # ============================================================================
 # Day 9: Region Classification
 # ============================================================================
-print("\n=== Day 9: Region Classification ===")
+def day9_classification():
+    print("\n=== Day 9: Region Classification ===")
 
-cctv_median = merged['인구당_방범용'].median()
-crime_median = merged['인구당_CCTV효과범죄율'].median()
+    merged = load_table(PROCESSED['integrated'])
+    merged['분면'] = classify_quadrant(merged, '인구당_방범용', '인구당_CCTV효과범죄율')
+    save_table(merged, PROCESSED['quadrant'], export_csv=True)
 
-def classify_quadrant(row):
-    cctv = row['인구당_방범용']
-    crime = row['인구당_CCTV효과범죄율']
-    if cctv >= cctv_median and crime >= crime_median:
-        return 'Q1: 고CCTV/고범죄'
-    elif cctv < cctv_median and crime >= crime_median:
-        return 'Q2: 저CCTV/고범죄 (우선순위)'
-    elif cctv < cctv_median and crime < crime_median:
-        return 'Q3: 저CCTV/저범죄'
-    else:
-        return 'Q4: 고CCTV/저범죄 (효과적)'
+    print(f"[OK] Day 9 completed - quadrant classification saved")
+    print(merged['분면'].value_counts())
 
-merged['분면'] = merged.apply(classify_quadrant, axis=1)
-merged.to_csv(os.path.join(DATA_PATHS['processed'], 'integrated_data_with_quadrant.csv'), index=False, encoding='utf-8-sig')
-
-print(f"[OK] Day 9 completed - quadrant classification saved")
-print(merged['분면'].value_counts())
 
 # ============================================================================
 # Day 10: Policy Recommendations
 # ============================================================================
-print("\n=== Day 10: Policy Recommendations ===")
-
-policy_table = pd.DataFrame([
-    {
-        '분면': 'Q2 (저CCTV/고범죄)',
-        '자치구수': len(merged[merged['분면'] == 'Q2: 저CCTV/고범죄 (우선순위)']),
-        '우선순위': '최우선',
-        '정책': '방범용 CCTV 긴급 설치',
-        '예산': '상',
-        '기간': '6개월'
-    },
-    {
-        '분면': 'Q1 (고CCTV/고범죄)',
-        '자치구수': len(merged[merged['분면'] == 'Q1: 고CCTV/고범죄']),
-        '우선순위': '높음',
-        '정책': '종합 방범 대책 (조명+순찰)',
-        '예산': '중상',
-        '기간': '1년'
-    },
-    {
-        '분면': 'Q4 (고CCTV/저범죄)',
-        '자치구수': len(merged[merged['분면'] == 'Q4: 고CCTV/저범죄 (효과적)']),
-        '우선순위': '중간',
-        '정책': '모범 사례 벤치마킹',
-        '예산': '하',
-        '기간': '3개월'
-    },
-    {
-        '분면': 'Q3 (저CCTV/저범죄)',
-        '자치구수': len(merged[merged['분면'] == 'Q3: 저CCTV/저범죄']),
-        '우선순위': '낮음',
-        '정책': '현상 유지 + 모니터링',
-        '예산': '하',
-        '기간': '지속'
-    }
-])
+def day10_policy(level):
+    print("\n=== Day 10: Policy Recommendations ===")
+
+    df = load_table(PROCESSED['quadrant'], columns=[region_key(level), '분면'])
+    count_col = f'{level}수'
+
+    policy_table = pd.DataFrame([
+        {
+            '분면': 'Q2 (저CCTV/고범죄)',
+            count_col: len(df[df['분면'] == 'Q2: 저CCTV/고범죄 (우선순위)']),
+            '우선순위': '최우선',
+            '정책': '방범용 CCTV 긴급 설치',
+            '예산': '상',
+            '기간': '6개월'
+        },
+        {
+            '분면': 'Q1 (고CCTV/고범죄)',
+            count_col: len(df[df['분면'] == 'Q1: 고CCTV/고범죄']),
+            '우선순위': '높음',
+            '정책': '종합 방범 대책 (조명+순찰)',
+            '예산': '중상',
+            '기간': '1년'
+        },
+        {
+            '분면': 'Q4 (고CCTV/저범죄)',
+            count_col: len(df[df['분면'] == 'Q4: 고CCTV/저범죄 (효과적)']),
+            '우선순위': '중간',
+            '정책': '모범 사례 벤치마킹',
+            '예산': '하',
+            '기간': '3개월'
+        },
+        {
+            '분면': 'Q3 (저CCTV/저범죄)',
+            count_col: len(df[df['분면'] == 'Q3: 저CCTV/저범죄']),
+            '우선순위': '낮음',
+            '정책': '현상 유지 + 모니터링',
+            '예산': '하',
+            '기간': '지속'
+        }
+    ])
+
+    os.makedirs(DATA_PATHS['reports'], exist_ok=True)
+    policy_table.to_csv(REPORTS['policy'], index=False, encoding='utf-8-sig')
+
+    print("[OK] Day 10 completed - policy recommendations saved")
 
-os.makedirs(DATA_PATHS['reports'], exist_ok=True)
-policy_table.to_csv(os.path.join(DATA_PATHS['reports'], 'day10_policy_summary.csv'), index=False, encoding='utf-8-sig')
-
-print("[OK] Day 10 completed - policy recommendations saved")
 
 # ============================================================================
 # Day 12: Final Report
 # ============================================================================
-print("\n=== Day 12: Generating Final Report ===")
-
-stats_summary = {
-    'corr_total_cctv_crime': merged['인구당_총CCTV'].corr(merged['인구당_CCTV효과범죄율']),
-    'corr_security_cctv_crime': merged['인구당_방범용'].corr(merged['인구당_CCTV효과범죄율']),
-    'corr_density_crime': merged['인구밀도'].corr(merged['인구당_CCTV효과범죄율']),
-    'r_squared': model.rsquared,
-    'adj_r_squared': model.rsquared_adj,
-    'f_pvalue': model.f_pvalue,
-    'coef_security': model.params['인구당_방범용'],
-    'pval_security': model.pvalues['인구당_방범용'],
-    'q2_count': len(merged[merged['분면'] == 'Q2: 저CCTV/고범죄 (우선순위)']),
-    'q2_districts': ', '.join(merged[merged['분면'] == 'Q2: 저CCTV/고범죄 (우선순위)']['자치구'].tolist()),
-    'q4_count': len(merged[merged['분면'] == 'Q4: 고CCTV/저범죄 (효과적)']),
-    'q4_districts': ', '.join(merged[merged['분면'] == 'Q4: 고CCTV/저범죄 (효과적)']['자치구'].tolist())
-}
+def day12_report(level):
+    print("\n=== Day 12: Generating Final Report ===")
+
+    key = region_key(level)
+
+    merged = load_table(PROCESSED['quadrant'])
+    with open(REPORTS['regression'], 'r', encoding='utf-8') as f:
+        regression = json.load(f)
+    params = regression['params']
+    pvalues = regression['pvalues']
+
+    stats_summary = {
+        'corr_total_cctv_crime': merged['인구당_총CCTV'].corr(merged['인구당_CCTV효과범죄율']),
+        'corr_security_cctv_crime': merged['인구당_방범용'].corr(merged['인구당_CCTV효과범죄율']),
+        'corr_density_crime': merged['인구밀도'].corr(merged['인구당_CCTV효과범죄율']),
+        'r_squared': regression['rsquared'],
+        'adj_r_squared': regression['rsquared_adj'],
+        'f_pvalue': regression['f_pvalue'],
+        'coef_security': params['인구당_방범용'],
+        'pval_security': pvalues['인구당_방범용'],
+        'q2_count': len(merged[merged['분면'] == 'Q2: 저CCTV/고범죄 (우선순위)']),
+        'q2_districts': ', '.join(merged[merged['분면'] == 'Q2: 저CCTV/고범죄 (우선순위)'][key].astype(str).tolist()),
+        'q4_count': len(merged[merged['분면'] == 'Q4: 고CCTV/저범죄 (효과적)']),
+        'q4_districts': ', '.join(merged[merged['분면'] == 'Q4: 고CCTV/저범죄 (효과적)'][key].astype(str).tolist())
+    }
 
-final_report = f"""# 서울시 CCTV 설치 현황과 범죄 발생 상관 분석 - 최종 보고서
+    final_report = f"""# 서울시 CCTV 설치 현황과 범죄 발생 상관 분석 - 최종 보고서
 
 **분석 기간**: 2025년 7월 4일 ~ 7월 15일
-**데이터 기준**: 서울시 25개 자치구 (2023년)
+**데이터 기준**: 서울시 {len(merged)}개 {level} (2023년)
 
 ## Executive Summary
 
@@ -213,11 +261,11 @@ final_report = f"""# 서울시 CCTV 설치 현황과 범죄 발생 상관 분석
   - {'통계적으로 유의미함' if stats_summary['pval_security'] < 0.05 else '통계적으로 유의미하지 않음'}
 
 - **우선순위 지역**
-  - Q2 (저CCTV/고범죄): {stats_summary['q2_count']}개 자치구
+  - Q2 (저CCTV/고범죄): {stats_summary['q2_count']}개 {level}
   - 대상: {stats_summary['q2_districts'] if stats_summary['q2_districts'] else '없음'}
 
 - **효과적 사례**
-  - Q4 (고CCTV/저범죄): {stats_summary['q4_count']}개 자치구
+  - Q4 (고CCTV/저범죄): {stats_summary['q4_count']}개 {level}
   - 대상: {stats_summary['q4_districts'] if stats_summary['q4_districts'] else '없음'}
 
 ### 주요 정책 제언
@@ -242,8 +290,8 @@ final_report = f"""# 서울시 CCTV 설치 현황과 범죄 발생 상관 분석
 
 | 변수 | 계수 | p-value | 유의성 |
 |------|------|---------|---------|
-| 인구당_방범용 | {model.params['인구당_방범용']:.4f} | {model.pvalues['인구당_방범용']:.4f} | {'***' if model.pvalues['인구당_방범용'] < 0.001 else '**' if model.pvalues['인구당_방범용'] < 0.01 else '*' if model.pvalues['인구당_방범용'] < 0.05 else 'n.s.'} |
-| 인구밀도 | {model.params['인구밀도']:.6f} | {model.pvalues['인구밀도']:.4f} | {'***' if model.pvalues['인구밀도'] < 0.001 else '**' if model.pvalues['인구밀도'] < 0.01 else '*' if model.pvalues['인구밀도'] < 0.05 else 'n.s.'} |
+| 인구당_방범용 | {params['인구당_방범용']:.4f} | {pvalues['인구당_방범용']:.4f} | {'***' if pvalues['인구당_방범용'] < 0.001 else '**' if pvalues['인구당_방범용'] < 0.01 else '*' if pvalues['인구당_방범용'] < 0.05 else 'n.s.'} |
+| 인구밀도 | {params['인구밀도']:.6f} | {pvalues['인구밀도']:.4f} | {'***' if pvalues['인구밀도'] < 0.001 else '**' if pvalues['인구밀도'] < 0.01 else '*' if pvalues['인구밀도'] < 0.05 else 'n.s.'} |
 
 - R² = {stats_summary['r_squared']:.4f}
 - Adjusted R² = {stats_summary['adj_r_squared']:.4f}
@@ -251,7 +299,7 @@ final_report = f"""# 서울시 CCTV 설치 현황과 범죄 발생 상관 분석
 
 ### 지역 분류 (4분면)
 
-| 분면 | 자치구 수 | 정책 우선순위 |
+| 분면 | {level} 수 | 정책 우선순위 |
 |------|-----------|---------------|
 | Q2 (저CCTV/고범죄) | {stats_summary['q2_count']} | 최우선 - 방범용 CCTV 긴급 설치 |
 | Q1 (고CCTV/고범죄) | {len(merged[merged['분면'] == 'Q1: 고CCTV/고범죄'])} | 높음 - 종합 방범 대책 |
@@ -260,7 +308,7 @@ final_report = f"""# 서울시 CCTV 설치 현황과 범죄 발생 상관 분석
 
 ## 결론
 
-본 분석은 서울시 25개 자치구의 CCTV 설치 현황과 범죄 발생 간의 관계를 실증적으로 분석하였다.
+본 분석은 서울시 {len(merged)}개 {level}의 CCTV 설치 현황과 범죄 발생 간의 관계를 실증적으로 분석하였다.
 주요 발견사항으로는 방범용 CCTV와 범죄율 간 {'음의 상관관계' if stats_summary['corr_security_cctv_crime'] < 0 else '양의 상관관계'}가 확인되었으며,
 4분면 분류를 통해 {stats_summary['q2_count']}개의 우선순위 설치 지역을 식별하였다.
 
@@ -274,24 +322,99 @@ final_report = f"""# 서울시 CCTV 설치 현황과 범죄 발생 상관 분석
 **재현성**: 샘플 데이터(RANDOM_SEED=42) 사용
 """
 
-with open(os.path.join(DATA_PATHS['reports'], 'FINAL_REPORT.md'), 'w', encoding='utf-8') as f:
-    f.write(final_report)
 
-print("[OK] Day 12 completed - final report generated")
+    with open(REPORTS['final'], 'w', encoding='utf-8') as f:
+        f.write(final_report)
+
+    print("[OK] Day 12 completed - final report generated")
+
 
 # ============================================================================
-# Summary
+# Pipeline 정의
 # ============================================================================
-print("\n" + "="*80)
-print("전체 파이프라인 실행 완료!")
-print("="*80)
-print("\n생성된 파일:")
-print(f"  - data/raw/: 3개 샘플 데이터 CSV")
-print(f"  - data/processed/: 정제 및 통합 데이터 CSV")
-print(f"  - results/reports/FINAL_REPORT.md: 최종 보고서")
-print(f"  - results/reports/day10_policy_summary.csv: 정책 제언 요약표")
-print("\n다음 단계:")
-print("  1. results/reports/FINAL_REPORT.md 확인")
-print("  2. Pandoc으로 PDF 변환")
-print("  3. GitHub 저장소에 업로드")
-print("="*80)
+def build_pipeline(level='자치구'):
+    outputs = [PROCESSED['integrated']]
+    if REGION_LEVELS[level]['parent'] is not None:
+        outputs.append(parent_path(level))
+    tasks = [
+        Task('day2', day2_cleaning,
+             inputs=list(RAW.values()),
+             outputs=[PROCESSED['cctv'], PROCESSED['crime'], PROCESSED['population']],
+             params={
+                 'cctv_types': ['방범용', '교통단속용', '어린이안전용', '기타'],
+                 'crime_types': ['절도', '강도', '차량범죄', '공공장소폭력', '성범죄']
+             },
+             description='데이터 정제'),
+        Task('day3', day3_integration,
+             inputs=[PROCESSED['cctv'], PROCESSED['crime'], PROCESSED['population']],
+             outputs=outputs,
+             params={'effect_crimes': CCTV_EFFECT_CRIMES, 'level': level},
+             description='데이터 통합 및 파생 변수'),
+        Task('day4_8', day4_8_analysis,
+             inputs=[PROCESSED['integrated']],
+             outputs=[REPORTS['regression']],
+             params={'x_cols': ['인구당_방범용', '인구밀도'], 'y_col': '인구당_CCTV효과범죄율'},
+             description='상관·회귀 분석'),
+        Task('day9', day9_classification,
+             inputs=[PROCESSED['integrated']],
+             outputs=[PROCESSED['quadrant']],
+             description='4분면 분류'),
+        Task('day10', day10_policy,
+             inputs=[PROCESSED['quadrant']],
+             outputs=[REPORTS['policy']],
+             params={'level': level},
+             description='정책 제언 요약표'),
+        Task('day12', day12_report,
+             inputs=[PROCESSED['quadrant'], REPORTS['regression']],
+             outputs=[REPORTS['final']],
+             params={'level': level},
+             description='최종 보고서'),
+    ]
+    return Pipeline(tasks, STATE_PATH)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='서울시 CCTV 분석 파이프라인 (Day 2~12)')
+    parser.add_argument('--only', nargs='+', metavar='STAGE', help='지정 단계만 실행 (예: --only day9 day10)')
+    parser.add_argument('--from', dest='start', metavar='STAGE', help='지정 단계부터 끝까지 실행')
+    parser.add_argument('--force', action='store_true', help='변경 여부와 관계없이 전체 실행')
+    parser.add_argument('--list', action='store_true', help='단계 목록과 최신 여부만 출력')
+    parser.add_argument('--level', default='자치구', choices=list(REGION_LEVELS),
+                        help='지역 단위 (원천 데이터에 해당 키 컬럼 필요)')
+    args = parser.parse_args()
+
+    pipeline = build_pipeline(args.level)
+
+    if args.list:
+        for task in pipeline.tasks:
+            status = '최신' if pipeline.is_up_to_date(task) else '실행 필요'
+            print(f"  {task.name:8s} {task.description:20s} [{status}]")
+        return
+
+    print("="*80)
+    print("서울시 CCTV 분석 프로젝트 - 전체 파이프라인 실행")
+    print("="*80)
+
+    results = pipeline.run(only=args.only, start=args.start, force=args.force)
+
+    # ============================================================================
+    # Summary
+    # ============================================================================
+    print("\n" + "="*80)
+    print("전체 파이프라인 실행 완료!")
+    print("="*80)
+    print(f"\n실행: {sum(r == 'ran' for r in results.values())}개 단계, "
+          f"건너뜀: {sum(r == 'skipped' for r in results.values())}개 단계")
+    print("\n생성된 파일:")
+    print(f"  - data/processed/: 정제 및 통합 데이터 (Parquet + CSV)")
+    print(f"  - results/reports/FINAL_REPORT.md: 최종 보고서")
+    print(f"  - results/reports/day10_policy_summary.csv: 정책 제언 요약표")
+    print("\n다음 단계:")
+    print("  1. results/reports/FINAL_REPORT.md 확인")
+    print("  2. Pandoc으로 PDF 변환")
+    print("  3. GitHub 저장소에 업로드")
+    print("="*80)
+
+
+if __name__ == "__main__":
+    main()
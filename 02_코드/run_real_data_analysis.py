@@ -5,13 +5,19 @@
 
 import sys
 import os
+sys.path.append('.')
 import pandas as pd
 import numpy as np
 import matplotlib
 matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import seaborn as sns
-from scipy import stats
+
+from utils import save_table, correlation_inference, correlation_matrix, correlation_table
+
+# 입력 표 (좌표 데이터 집계 결과를 쓰려면 환경 변수로 지정, 02_코드/ingest_points.py 참고)
+CCTV_TABLE = os.environ.get('CCTV_TABLE', 'data/raw/cctv_seoul_2024.csv')
+CRIME_TABLE = os.environ.get('CRIME_TABLE', 'data/raw/crime_seoul_2024.csv')
 
 # 한글 폰트 설정
 plt.rcParams['font.family'] = 'Malgun Gothic'
@@ -27,8 +33,8 @@ print("="*80)
 print("\n[1/6] 데이터 로드 중...")
 
 # 개별 데이터 로드
-df_cctv = pd.read_csv('data/raw/cctv_seoul_2024.csv', encoding='utf-8-sig')
-df_crime = pd.read_csv('data/raw/crime_seoul_2024.csv', encoding='utf-8-sig')
+df_cctv = pd.read_csv(CCTV_TABLE, encoding='utf-8-sig')
+df_crime = pd.read_csv(CRIME_TABLE, encoding='utf-8-sig')
 df_population = pd.read_csv('data/raw/population_seoul_2024.csv', encoding='utf-8-sig')
 
 # 데이터 병합
@@ -71,10 +77,11 @@ print(stats_summary)
 # ============================================================================
 print("\n[4/6] 상관분석 중...")
 
-# Pearson 상관계수
+# Pearson 상관계수 (모든 변수 쌍의 r, t, p-value, BH q-value 를 한 번에 계산)
 correlation_vars = ['CCTV_총계', '방범용', '총범죄_발생', '총인구',
                     'CCTV_per_1000', '방범CCTV_per_1000', '범죄_per_1000', 'CCTV효과범죄_per_1000']
-corr_matrix = merged[correlation_vars].corr()
+corr_matrix = correlation_matrix(merged, correlation_vars)
+corr_table = correlation_table(merged, correlation_vars).set_index(['변수1', '변수2'])
 
 print("\n상관계수 매트릭스:")
 print(corr_matrix)
@@ -83,13 +90,21 @@ print(f"\nCCTV_per_1000 vs 범죄_per_1000 상관계수: {corr_matrix.loc['CCTV_
 print(f"방범CCTV_per_1000 vs CCTV효과범죄_per_1000 상관계수: {corr_matrix.loc['방범CCTV_per_1000', 'CCTV효과범죄_per_1000']:.4f}")
 
 # Pearson correlation test (CCTV vs 전체 범죄)
-r_corr, p_value = stats.pearsonr(merged['CCTV_per_1000'], merged['범죄_per_1000'])
+r_corr, p_value = corr_table.loc[('CCTV_per_1000', '범죄_per_1000'), ['r', 'p_value']]
 print(f"\n전체 CCTV vs 전체 범죄: Pearson r = {r_corr:.4f}, p-value = {p_value:.4f}")
 
 # Pearson correlation test (방범CCTV vs CCTV효과범죄)
-r_corr2, p_value2 = stats.pearsonr(merged['방범CCTV_per_1000'], merged['CCTV효과범죄_per_1000'])
+r_corr2, p_value2 = corr_table.loc[('방범CCTV_per_1000', 'CCTV효과범죄_per_1000'), ['r', 'p_value']]
 print(f"방범 CCTV vs CCTV효과범죄: Pearson r = {r_corr2:.4f}, p-value = {p_value2:.4f}")
 
+# 부트스트랩 신뢰구간 / 순열검정 (n=25 이라 t 분포 p-value 만으로는 불안정)
+inference = correlation_inference(merged, correlation_vars)
+headline = inference.set_index(['변수1', '변수2'])
+for pair in [('CCTV_per_1000', '범죄_per_1000'), ('방범CCTV_per_1000', 'CCTV효과범죄_per_1000')]:
+    row = headline.loc[pair]
+    print(f"  {pair[0]} vs {pair[1]}: 95% CI [{row['CI_하한']:.4f}, {row['CI_상한']:.4f}], "
+          f"순열검정 p = {row['p_permutation']:.4f}")
+
 # ============================================================================
 # 5. 시각화
 # ============================================================================
@@ -149,10 +164,8 @@ print("  - cctv_by_district_real.png 저장")
 # ============================================================================
 print("\n[6/6] 분석 결과 저장 중...")
 
-os.makedirs('data/processed', exist_ok=True)
-merged.to_csv('data/processed/integrated_data_with_analysis.csv',
-              index=False, encoding='utf-8-sig')
-print("  - integrated_data_with_analysis.csv 저장")
+save_table(merged, 'data/processed/integrated_data_with_analysis.csv', export_csv=True)
+print("  - integrated_data_with_analysis.parquet / .csv 저장")
 
 # 요약 통계 저장
 os.makedirs('results/reports', exist_ok=True)
@@ -179,6 +192,13 @@ with open('results/reports/analysis_summary.txt', 'w', encoding='utf-8') as f:
     f.write(f"    p-value: {p_value2:.4f}\n")
     f.write(f"    유의수준: {'유의함 (p<0.05)' if p_value2 < 0.05 else '유의하지 않음 (p>=0.05)'}\n\n")
 
+    f.write("부트스트랩 / 순열검정 (10,000회):\n")
+    for pair in [('CCTV_per_1000', '범죄_per_1000'), ('방범CCTV_per_1000', 'CCTV효과범죄_per_1000')]:
+        row = headline.loc[pair]
+        f.write(f"  - {pair[0]} vs {pair[1]}: 95% CI [{row['CI_하한']:.4f}, {row['CI_상한']:.4f}], "
+                f"순열검정 p-value: {row['p_permutation']:.4f}\n")
+    f.write("\n")
+
     f.write("CCTV 상위 5개 자치구:\n")
     for i, row in merged.nlargest(5, 'CCTV_총계').iterrows():
         f.write(f"  {row['자치구']}: {row['CCTV_총계']:.0f}대 "
@@ -191,6 +211,9 @@ with open('results/reports/analysis_summary.txt', 'w', encoding='utf-8') as f:
 
 print("  - analysis_summary.txt 저장")
 
+inference.to_csv('results/reports/correlation_inference.csv', index=False, encoding='utf-8-sig')
+print("  - correlation_inference.csv 저장")
+
 print("\n" + "="*80)
 print("분석 완료!")
 print("="*80)
@@ -199,6 +222,7 @@ print("  - results/figures/scatter_cctv_crime_real.png")
 print("  - results/figures/correlation_heatmap_real.png")
 print("  - results/figures/cctv_by_district_real.png")
 print("  - results/reports/analysis_summary.txt")
-print("  - data/processed/integrated_data_with_analysis.csv")
+print("  - results/reports/correlation_inference.csv")
+print("  - data/processed/integrated_data_with_analysis.parquet (.csv)")
 print("\n다음 단계:")
 print("  python dashboard.py  # 대시보드 실행")
@@ -0,0 +1,71 @@
+"""
+회귀모형 조합 탐색 (best subset)
+
+통합 데이터의 숫자형 변수 중 설명변수 조합을 모두 일괄 적합(utils/regression.py)해서
+AIC / BIC / 수정 R² 기준 상위 모형을 보여줍니다.
+같은 데이터·모형식의 적합 결과는 logs/regression_cache.json 에 캐시됩니다.
+
+실행:
+    python 02_코드/search_models.py                                   # 기본: 인구당_CCTV효과범죄율, 최대 3개 변수
+    python 02_코드/search_models.py --max-size 4 --criterion bic --top 30
+    python 02_코드/search_models.py --candidates 인구당_방범용 인구밀도 인구당_교통단속용
+"""
+
+import sys
+import os
+import time
+import argparse
+sys.path.append('.')
+
+from utils import *
+
+DATA_PATH = 'data/processed/integrated_data_with_quadrant.csv'
+CACHE_PATH = 'logs/regression_cache.json'
+OUTPUT_PATH = 'results/reports/model_search.csv'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='회귀모형 조합 탐색')
+    parser.add_argument('--data', default=DATA_PATH, help='분석 데이터 경로')
+    parser.add_argument('--y', default='인구당_CCTV효과범죄율', help='종속변수')
+    parser.add_argument('--candidates', nargs='+', help='후보 설명변수 (기본: 종속변수 외 숫자형 컬럼 전체)')
+    parser.add_argument('--max-size', type=int, default=3, help='최대 설명변수 수')
+    parser.add_argument('--criterion', default='aic', choices=['aic', 'bic', 'rsquared_adj'], help='정렬 기준')
+    parser.add_argument('--max-vif', type=float, help='최대 VIF 가 이 값 이하인 모형만')
+    parser.add_argument('--top', type=int, default=20, help='출력할 상위 모형 수')
+    args = parser.parse_args()
+
+    print("="*80)
+    print("회귀모형 조합 탐색")
+    print("="*80)
+
+    df = load_table(args.data)
+    candidates = args.candidates or [col for col in df.select_dtypes('number').columns if col != args.y]
+    registry = RegressionRegistry(df, CACHE_PATH)
+    print(f"[OK] {registry}")
+    print(f"[OK] 종속변수: {args.y}, 후보 변수 {len(candidates)}개, 최대 {args.max_size}개 조합")
+
+    started = time.perf_counter()
+    table = registry.best_subsets(args.y, candidates, max_size=args.max_size, criterion=args.criterion)
+    print(f"[OK] 모형 {len(table):,}개 적합 ({time.perf_counter() - started:.2f}s)")
+
+    if args.max_vif is not None:
+        table = table[table['최대VIF'] <= args.max_vif].reset_index(drop=True)
+
+    os.makedirs(os.path.dirname(OUTPUT_PATH), exist_ok=True)
+    table.to_csv(OUTPUT_PATH, index=False, encoding='utf-8-sig')
+
+    print("\n" + "="*80)
+    print(table.head(args.top).round(4).to_string())
+    print("="*80)
+
+    if len(table):
+        best = registry.fit(args.y, table['모형식'].iloc[0].split(' ~ ')[1].split(' + '))
+        print(f"\n최적 모형 ({args.criterion}): {best['formula']}")
+        for col, coef in best['params'].items():
+            print(f"  {col}: {coef:.6f} (p={best['pvalues'][col]:.4f})")
+    print(f"\n[OK] 저장: {OUTPUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()
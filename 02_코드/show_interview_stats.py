@@ -2,12 +2,16 @@ import pandas as pd
 import numpy as np
 import sys
 import io
+sys.path.append('.')
+
+from utils import load_table
 
 # UTF-8 출력 설정
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
 # 데이터 로드 - 컬럼명이 한글인 경우 대비
-df = pd.read_csv('data/processed/integrated_data_with_analysis.csv', encoding='utf-8-sig')
+df = load_table('data/processed/integrated_data_with_analysis.csv',
+                columns=['자치구', 'CCTV_총계', '범죄예방_총계', '총범죄_발생', '총인구', '방범용', 'CCTV_per_1000'])
 
 # 컬럼명 매핑 (한글 -> 영어)
 column_mapping = {
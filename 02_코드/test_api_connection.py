@@ -8,6 +8,9 @@ import sys
 import requests
 from dotenv import load_dotenv
 import json
+sys.path.append('.')
+
+from utils.seoul_api import ServiceProber, SEOUL_API_BASE_URL
 
 # Windows 인코딩 설정
 if sys.platform == 'win32':
@@ -18,8 +21,9 @@ if sys.platform == 'win32':
 load_dotenv()
 
 # API 기본 설정
-BASE_URL = "http://openapi.seoul.go.kr:8088"
+BASE_URL = os.getenv('SEOUL_API_BASE_URL', SEOUL_API_BASE_URL)
 API_KEY = os.getenv('SEOUL_API_KEY')
+PROBE_STATE_PATH = os.getenv('SEOUL_PROBE_STATE', 'data/cache/service_probe.csv')
 
 # 테스트할 서비스명 리스트 (일반적인 패턴들)
 TEST_SERVICE_NAMES = [
@@ -116,10 +120,17 @@ def main():
     print(f"\nAPI 키: {API_KEY[:10]}...{API_KEY[-5:]}")
     print(f"테스트할 서비스명 개수: {len(TEST_SERVICE_NAMES)}")
 
-    successful_services = []
+    # 전체 서비스명을 병렬로 먼저 확인 (최근 확인한 결과는 재사용)
+    prober = ServiceProber(API_KEY, base_url=BASE_URL, state_path=PROBE_STATE_PATH)
+    results = prober.scan(TEST_SERVICE_NAMES)
+    prober.close()
 
-    # 각 서비스명 테스트
-    for service_name in TEST_SERVICE_NAMES:
+    print("\n서비스별 확인 결과:")
+    print(results[['service', 'ok', 'code', 'latency_ms']].to_string(index=False))
+
+    # 성공한 서비스만 상세 응답 확인
+    successful_services = []
+    for service_name in results.loc[results['ok'], 'service']:
         success, data = test_api_call(service_name)
         if success:
             successful_services.append((service_name, data))
@@ -6,6 +6,24 @@ Utils 패키지
 
 from .constants import *
 from .helpers import *
+from .storage import *
+from .pipeline import *
+from .rendering import *
+from .sheets import *
+from .seoul_api import *
+from .panel import *
+from .regions import *
+from .points import *
+from .coverage import *
+from .placement import *
+from .resampling import *
+from .correlation import *
+from .regression import *
+from .causal import *
+from .lags import *
+from .spatial import *
+from .filters import *
+from .scatter import *
 
 __all__ = [
     # constants
@@ -20,6 +38,16 @@ __all__ = [
     'DATA_PATHS',
     'ANALYSIS_YEAR',
     'IQR_THRESHOLD',
+    'QUADRANT_LABELS',
+    'SHEET_SPECS',
+    'REGION_LEVELS',
+    'SEOUL_BOUNDS',
+    'POINT_SPECS',
+    'COVERAGE_RADIUS',
+    'CCTV_UNIT_COST',
+    'DISTRICT_CENTROIDS',
+    'LISA_LABELS',
+    'DASHBOARD_PROFILES',
 
     # helpers
     'set_korean_font',
@@ -35,8 +63,121 @@ __all__ = [
     'standardize_district_name',
     'detect_outliers_iqr',
     'calculate_ratio_columns',
+    'classify_quadrant',
     'plot_category_analysis',
     'generate_sample_cctv_data',
     'generate_sample_crime_data',
-    'generate_sample_population_data'
+    'generate_sample_population_data',
+
+    # storage
+    'apply_schema',
+    'save_table',
+    'load_table',
+    'export_table_csv',
+
+    # pipeline
+    'Task',
+    'Pipeline',
+
+    # rendering
+    'render_figures',
+
+    # sheets
+    'read_sheet',
+    'normalize_districts',
+    'parse_sheet',
+    'load_sheet',
+    'load_sheets',
+    'check_districts',
+
+    # seoul_api
+    'SeoulApiClient',
+    'ResponseCache',
+    'ServiceProber',
+    'parse_page',
+
+    # panel
+    'Panel',
+    'melt_years',
+
+    # regions
+    'region_key',
+    'integrate',
+    'per_capita',
+    'zscore',
+    'risk_score',
+    'rollup',
+    'validate_regions',
+
+    # points
+    'PointSet',
+    'GridLayer',
+    'PolygonLayer',
+    'CentroidLayer',
+    'to_meters',
+    'to_latlon',
+    'region_layer',
+    'load_points',
+    'aggregate_points',
+
+    # coverage
+    'CoverageEngine',
+
+    # placement
+    'PlacementOptimizer',
+    'grid_candidates',
+    'summarize_sites',
+
+    # resampling
+    'batched_corr',
+    'correlation_inference',
+
+    # correlation
+    'CORRELATION_METHODS',
+    'correlate',
+    'fdr_bh',
+    'correlation_table',
+    'correlation_matrix',
+
+    # regression
+    'model_formula',
+    'batch_ols',
+    'RegressionRegistry',
+    'vif_table',
+    'regression_diagnostics',
+
+    # causal
+    'assign_treatment',
+    'twoway_demean',
+    'fe_regression',
+    'did',
+    'event_study',
+
+    # lags
+    'lagged_xcorr',
+    'granger_test',
+    'lag_cube',
+    'cached_lag_cube',
+
+    # spatial
+    'row_standardize',
+    'knn_weights',
+    'distance_weights',
+    'grid_weights',
+    'polygon_weights',
+    'district_weights',
+    'morans_i',
+    'local_morans',
+    'add_lisa',
+
+    # filters
+    'FilterIndex',
+
+    # scatter
+    'SCATTER_WEBGL_THRESHOLD',
+    'SCATTER_DENSITY_THRESHOLD',
+    'fit_trendline',
+    'top_outliers',
+    'density_tiles',
+    'scatter_layers'
 ]
@@ -0,0 +1,240 @@
+"""
+이중차분법(DID) / 이벤트 스터디 (CCTV 설치 시점 기준)
+
+(지역, 연도) 패널에서 CCTV 증가량이 임계값 이상인 첫 해를 처치연도로 두고,
+- DID: y_it = a_i + l_t + b * 처치후_it + e_it
+- 이벤트 스터디: y_it = a_i + l_t + sum_k b_k * 1[연도 - 처치연도 = k] + e_it  (k = -1 기준)
+를 추정합니다.
+- 지역·연도 고정효과는 더미 행렬 없이 within 변환(교대 평균 제거)으로 흡수
+- 지역 군집 강건 표준오차 (CR1)
+- 군집 wild bootstrap (Rademacher) p-value: 모든 반복을 행렬 곱으로 일괄 계산, 배치 단위 병렬 실행
+
+이벤트 스터디의 처치 전(k < -1) 계수가 유의하면 CCTV 설치 전에 이미 범죄가 달라지고 있었다는 뜻으로,
+"범죄 증가 -> CCTV 설치" 역인과 주장을 검증하는 데 사용합니다.
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import sparse, stats
+
+from .constants import RANDOM_SEED
+from .panel import Panel, REGION_COL, YEAR_COL
+from .resampling import _run_batches
+
+
+# wild bootstrap 배치의 최대 원소 수 (반복 수 x 관측치 수, 메모리 제한)
+WILD_CHUNK = 5_000_000
+
+
+def _long_frame(data):
+    """Panel 또는 long DataFrame -> long DataFrame"""
+    return data.to_frame() if isinstance(data, Panel) else data.reset_index(drop=True)
+
+
+def assign_treatment(data, cctv_col, threshold, unit=REGION_COL, time=YEAR_COL, pct=False):
+    """
+    CCTV 증가량 기준 처치 시점 정의
+
+    지역별 전년 대비 증가량(pct=True 면 증가율)이 threshold 이상인 첫 연도를 처치연도로 둔다.
+    한 번도 넘지 않은 지역은 처치연도 NaN (비교군).
+
+    Args:
+        data (Panel or pd.DataFrame): (지역, 연도) 패널
+        cctv_col (str): CCTV 컬럼 (예: '범죄예방_누적')
+        threshold (float): 증가량(또는 증가율) 임계값
+        unit (str): 지역 컬럼명
+        time (str): 연도 컬럼명
+        pct (bool): True면 증가율 기준
+
+    Returns:
+        pd.DataFrame: 입력 + [처치연도, 상대연도, 처치후]
+
+    Examples:
+        >>> df = assign_treatment(panel, '범죄예방_누적', threshold=500)
+        >>> df.groupby('처치연도', dropna=False)['자치구'].nunique()
+    """
+    df = _long_frame(data).sort_values([unit, time], ignore_index=True)
+    grouped = df.groupby(unit)[cctv_col]
+    change = grouped.pct_change() if pct else grouped.diff()
+
+    onset = df[time].where(change >= threshold)
+    df['처치연도'] = onset.groupby(df[unit]).transform('min')
+    df['상대연도'] = df[time] - df['처치연도']
+    df['처치후'] = (df['상대연도'] >= 0).astype('float64')
+    return df
+
+
+def twoway_demean(values, unit_codes, time_codes, tol=1e-10, max_iter=1000):
+    """
+    지역·연도 고정효과 within 변환 (교대 평균 제거)
+
+    균형 패널은 한 번에 수렴하고, 불균형 패널은 변화가 tol 이하가 될 때까지 반복한다.
+
+    Args:
+        values (np.ndarray): (n, k) 변수
+        unit_codes (np.ndarray): (n,) 지역 정수 코드
+        time_codes (np.ndarray): (n,) 연도 정수 코드
+
+    Returns:
+        np.ndarray: (n, k) 고정효과를 제거한 값
+    """
+    out = np.asarray(values, dtype='float64')
+    out = out - out.mean(axis=0)
+    groups = [(codes, np.bincount(codes)) for codes in (unit_codes, time_codes)]
+
+    for _ in range(max_iter):
+        previous = out
+        for codes, counts in groups:
+            sums = np.column_stack([np.bincount(codes, weights=out[:, j], minlength=len(counts))
+                                    for j in range(out.shape[1])])
+            out = out - (sums / counts[:, None])[codes]
+        if np.abs(out - previous).max() < tol:
+            break
+    return out
+
+
+def _cluster_scores(X, resid, cluster_matrix):
+    """군집별 score 합: (..., n) 잔차 -> (..., G, k)"""
+    return np.stack([(resid * X[:, j]) @ cluster_matrix.T for j in range(X.shape[1])], axis=-1)
+
+
+def _wild_batch(context, size, seed):
+    """wild bootstrap 배치: Rademacher 군집 가중치 (size x G) -> |t*| (size x k)"""
+    rng = np.random.default_rng(seed)
+    X, resid, codes = context['X'], context['resid'], context['codes']
+    weights = rng.choice([-1.0, 1.0], size=(size, context['n_clusters']))
+
+    resid_star = resid[None, :] * weights[:, codes]
+    delta = resid_star @ context['projection'].T
+    resid_star = resid_star - delta @ X.T
+    scores = _cluster_scores(X, resid_star, context['cluster_matrix'])
+    meat = np.einsum('bgi,bgj->bij', scores, scores)
+    cov = context['bread'] @ meat @ context['bread'] * context['correction']
+    se = np.sqrt(np.diagonal(cov, axis1=1, axis2=2))
+    return np.abs(delta / se)
+
+
+def fe_regression(df, outcome, regressors, unit=REGION_COL, time=YEAR_COL, cluster=None,
+                  n_boot=0, seed=RANDOM_SEED, workers=1, ci=0.95):
+    """
+    지역·연도 고정효과 회귀 (within 변환 + 군집 강건 표준오차 + wild bootstrap)
+
+    Args:
+        df (pd.DataFrame): long 패널 (결측 행 제외)
+        outcome (str): 종속변수
+        regressors (list): 설명변수 (처치 더미 등)
+        unit (str): 지역 컬럼명
+        time (str): 연도 컬럼명
+        cluster (str, optional): 군집 컬럼 (기본: unit)
+        n_boot (int): wild bootstrap 반복 수 (0 이면 생략)
+        seed (int): 난수 시드
+        workers (int, optional): bootstrap 프로세스 수 (기본: 1, None 이면 CPU 수)
+        ci (float): 신뢰수준
+
+    Returns:
+        pd.DataFrame: [변수, 계수, 표준오차, t, p_value, CI_하한, CI_상한, (p_wild)]
+    """
+    cluster = cluster or unit
+    data = df.dropna(subset=[outcome] + list(regressors))
+    unit_codes = pd.factorize(data[unit])[0]
+    time_codes = pd.factorize(data[time])[0]
+    cluster_codes, cluster_values = pd.factorize(data[cluster])
+
+    demeaned = twoway_demean(data[[outcome] + list(regressors)].to_numpy(dtype='float64'), unit_codes, time_codes)
+    y, X = demeaned[:, 0], demeaned[:, 1:]
+    n, k = X.shape
+    n_clusters = len(cluster_values)
+    assert np.linalg.matrix_rank(X) == k, "[ERROR] 고정효과 제거 후 설명변수가 선형 종속입니다 (처치 시점/기준 연도 확인)"
+    assert n_clusters > 1, "[ERROR] 군집이 2개 이상이어야 합니다"
+
+    bread = np.linalg.inv(X.T @ X)
+    projection = bread @ X.T
+    params = projection @ y
+    resid = y - X @ params
+
+    cluster_matrix = sparse.csr_matrix((np.ones(n), (cluster_codes, np.arange(n))), shape=(n_clusters, n))
+    scores = _cluster_scores(X, resid, cluster_matrix)
+    # CR1 보정 (reghdfe 기준: 군집 안에 포함되는 지역 고정효과는 빼고, 흡수한 연도 효과 T-1 개는 자유도에서 차감)
+    n_time = time_codes.max() + 1
+    correction = n_clusters / (n_clusters - 1) * (n - 1) / (n - k - (n_time - 1))
+    cov = bread @ (scores.T @ scores) @ bread * correction
+    se = np.sqrt(np.diag(cov))
+
+    t_stat = params / se
+    dof = n_clusters - 1
+    critical = stats.t.ppf(1 - (1 - ci) / 2, dof)
+    table = pd.DataFrame({
+        '변수': list(regressors),
+        '계수': params,
+        '표준오차': se,
+        't': t_stat,
+        'p_value': 2 * stats.t.sf(np.abs(t_stat), dof),
+        'CI_하한': params - critical * se,
+        'CI_상한': params + critical * se
+    })
+
+    if n_boot:
+        context = {'X': X, 'resid': resid, 'codes': cluster_codes, 'n_clusters': n_clusters,
+                   'projection': projection, 'bread': bread, 'cluster_matrix': cluster_matrix,
+                   'correction': correction}
+        batch_size = int(np.clip(WILD_CHUNK // n, 1, n_boot))
+        t_star = _run_batches(_wild_batch, context, n_boot, batch_size, seed, workers)
+        table['p_wild'] = ((t_star >= np.abs(t_stat) - 1e-12).sum(axis=0) + 1) / (n_boot + 1)
+    return table
+
+
+def did(data, outcome, treat_col='처치후', unit=REGION_COL, time=YEAR_COL, covariates=None, **kwargs):
+    """
+    이중차분법 (two-way fixed effects DID)
+
+    Args:
+        data (Panel or pd.DataFrame): assign_treatment() 결과 (처치후 컬럼 포함)
+        outcome (str): 결과 변수 (예: 'CCTV효과범죄_per_1000')
+        treat_col (str): 처치 후 더미 컬럼
+        covariates (list, optional): 통제 변수
+        **kwargs: fe_regression() 인자 (cluster, n_boot, seed, workers, ci)
+
+    Returns:
+        pd.DataFrame: fe_regression() 참고 (첫 행이 처치 효과)
+
+    Examples:
+        >>> df = assign_treatment(panel, '범죄예방_누적', threshold=500)
+        >>> did(df, 'CCTV효과범죄_per_1000', n_boot=9999)
+    """
+    df = _long_frame(data)
+    return fe_regression(df, outcome, [treat_col] + list(covariates or []), unit, time, **kwargs)
+
+
+def event_study(data, outcome, leads=3, lags=3, reference=-1, rel_col='상대연도',
+                unit=REGION_COL, time=YEAR_COL, covariates=None, **kwargs):
+    """
+    이벤트 스터디 (처치 전후 연도별 효과)
+
+    상대연도 -leads 이하 / lags 이상은 양 끝 구간으로 묶고, reference 연도를 기준(0)으로 둔다.
+    처치되지 않은 지역(상대연도 NaN)은 모든 더미가 0 인 비교군이다.
+
+    Args:
+        data (Panel or pd.DataFrame): assign_treatment() 결과 (상대연도 컬럼 포함)
+        outcome (str): 결과 변수
+        leads (int): 처치 전 연도 수
+        lags (int): 처치 후 연도 수
+        reference (int): 기준 상대연도 (기본: -1)
+        rel_col (str): 상대연도 컬럼
+        covariates (list, optional): 통제 변수
+        **kwargs: fe_regression() 인자 (cluster, n_boot, seed, workers, ci)
+
+    Returns:
+        pd.DataFrame: [상대연도, 계수, 표준오차, t, p_value, CI_하한, CI_상한, (p_wild)] (기준 연도는 계수 0)
+    """
+    df = _long_frame(data)
+    relative = df[rel_col].clip(-leads, lags)
+    periods = [k for k in range(-leads, lags + 1) if k != reference]
+    names = [f'상대연도_{k}' for k in periods]
+    dummies = pd.DataFrame({name: (relative == k).astype('float64') for name, k in zip(names, periods)}, index=df.index)
+
+    table = fe_regression(pd.concat([df, dummies], axis=1), outcome, names + list(covariates or []),
+                          unit, time, **kwargs)
+    table = table.iloc[:len(periods)].assign(상대연도=periods).drop(columns='변수')
+    base = pd.DataFrame({'상대연도': [reference], '계수': [0.0], '표준오차': [0.0]})
+    table = pd.concat([table, base], ignore_index=True).sort_values('상대연도', ignore_index=True)
+    return table[['상대연도'] + [col for col in table.columns if col != '상대연도']]
@@ -71,6 +71,14 @@ PLOT_STYLE = {
 # 랜덤 시드 (재현성 확보)
 RANDOM_SEED = 42
 
+# 4분면 분류 라벨 (Q1~Q4 순서, 기준: 방범용 CCTV 밀도 × CCTV 효과 범죄율)
+QUADRANT_LABELS = [
+    'Q1: 고CCTV/고범죄',
+    'Q2: 저CCTV/고범죄 (우선순위)',
+    'Q3: 저CCTV/저범죄',
+    'Q4: 고CCTV/저범죄 (효과적)'
+]
+
 # 이상치 탐지 설정
 IQR_THRESHOLD = 1.5  # IQR 배수 (1.5 표준)
 
@@ -86,3 +94,326 @@ DATA_PATHS = {
 
 # 분석 연도
 ANALYSIS_YEAR = 2023
+
+# 원본 통계표 시트 사양 (utils.sheets.parse_sheet 용, 위치는 header=None 기준)
+SHEET_SPECS = {
+    # 서울시 자치구 (목적별) CCTV 설치현황 ('24.12.31 / '25.6.30 기준 공통)
+    'cctv_purpose': {
+        'district_col': 1,
+        'data_start': 4,
+        'columns': {
+            'CCTV_총계': 2, '범죄예방_총계': 3, '방범용': 4, '어린이보호구역': 5,
+            '공원놀이터': 6, '쓰레기무단투기': 7, '시설안전_화재예방': 8,
+            '교통단속': 9, '교통정보수집_분석': 10, '기타': 11
+        }
+    },
+    # 서울시 자치구 (범죄예방 수사용) CCTV 설치현황 - 연도별 누적 (열 수는 기준일마다 다름)
+    'cctv_prevention_yearly': {
+        'district_col': 2,
+        'data_start': 3,
+        'header_row': 2,
+        'value_cols': (3, None)
+    },
+    # 서울시 자치구 (연도별) CCTV 설치현황 ('25.6.30 기준, 오른쪽 메모 열 제외)
+    'cctv_yearly': {
+        'district_col': 1,
+        'data_start': 3,
+        'header_row': 2,
+        'value_cols': (2, 13)
+    },
+    # 서울시 자치구 (연도별) CCTV 설치현황 ('24.12.31 기준, 순번 열 있음)
+    'cctv_yearly_241231': {
+        'district_col': 2,
+        'data_start': 3,
+        'header_row': 2,
+        'value_cols': (3, 14)
+    },
+    # KOSIS 5대 범죄 발생현황 (자치구별)
+    'crime_5major': {
+        'district_col': 1,
+        'data_start': 4,
+        'columns': {
+            '총범죄_발생': 2, '총범죄_검거': 3, '살인_발생': 4, '살인_검거': 5,
+            '강도_발생': 6, '강도_검거': 7, '강간강제추행_발생': 8, '강간강제추행_검거': 9,
+            '절도_발생': 10, '절도_검거': 11, '폭력_발생': 12, '폭력_검거': 13
+        }
+    },
+    # KOSIS 등록인구 (자치구별)
+    'population': {
+        'district_col': 1,
+        'data_start': 3,
+        'columns': {
+            '세대수': 2, '총인구': 3, '남자': 4, '여자': 5, '한국인_총계': 6,
+            '등록외국인_총계': 9, '세대당인구': 12, '고령자수': 13
+        }
+    }
+}
+
+# 분석 지역 단위 (key: 지역 키 컬럼, parent: 상위 지역 키 컬럼, expected: 지역 수, 모르면 None)
+REGION_LEVELS = {
+    '자치구': {'key': '자치구', 'parent': None, 'expected': 25},
+    '행정동': {'key': '행정동코드', 'parent': '자치구', 'expected': 426},
+    '격자250m': {'key': '격자ID', 'parent': '행정동코드', 'expected': None}
+}
+
+# 서울시 좌표 범위 (위도, 경도) - 범위 밖 좌표는 지오코딩 오류로 제외
+SEOUL_BOUNDS = {'lat': (37.41, 37.72), 'lon': (126.76, 127.19)}
+
+# 좌표(점) 데이터 사양 (utils/points.py)
+# categories: 원본 분류값 -> 분석 컬럼명 (없는 값은 원본 이름 그대로 사용)
+POINT_SPECS = {
+    # 서울시 CCTV 설치 위치 (카메라 1행 = 설치 지점, 카메라대수 가중)
+    'cctv': {
+        'lat_col': '위도',
+        'lon_col': '경도',
+        'category_col': '설치목적',
+        'weight_col': '카메라대수',
+        'total_col': 'CCTV_총계',
+        'column_format': '{}',
+        'categories': {
+            '생활방범': '방범용', '어린이보호': '어린이보호구역', '공원놀이터': '공원놀이터',
+            '쓰레기단속': '쓰레기무단투기', '시설물관리': '시설안전_화재예방', '재난재해': '시설안전_화재예방',
+            '교통단속': '교통단속', '교통정보수집': '교통정보수집_분석'
+        }
+    },
+    # 지오코딩된 범죄 발생 지점 (사건 1행)
+    'incident': {
+        'lat_col': '위도',
+        'lon_col': '경도',
+        'category_col': '범죄유형',
+        'weight_col': None,
+        'total_col': '총범죄_발생',
+        'column_format': '{}_발생',
+        # 분석에 쓰는 5대 범죄는 모두 나열 (데이터에 없는 유형도 0건 컬럼 생성)
+        'categories': {
+            '살인': '살인', '강도': '강도', '강간': '강간강제추행', '강제추행': '강간강제추행',
+            '절도': '절도', '폭력': '폭력'
+        }
+    }
+}
+
+# CCTV 유형별 유효 감시 반경 (m, utils/coverage.py)
+COVERAGE_RADIUS = {
+    '방범용': 50,
+    '어린이보호구역': 30,
+    '공원놀이터': 30,
+    '쓰레기무단투기': 20,
+    '시설안전_화재예방': 30,
+    '교통단속': 100,
+    '교통정보수집_분석': 100,
+    '기타': 30
+}
+
+# 방범용 CCTV 1대 설치 비용 (백만원)
+CCTV_UNIT_COST = 1.5
+
+# 자치구 대표 좌표 (구청 위치, 위도/경도) - 경계 데이터가 없을 때 공간 가중치(utils/spatial.py)에 사용
+DISTRICT_CENTROIDS = {
+    '종로구': (37.5735, 126.9790), '중구': (37.5641, 126.9979), '용산구': (37.5326, 126.9905),
+    '성동구': (37.5634, 127.0369), '광진구': (37.5385, 127.0823), '동대문구': (37.5744, 127.0400),
+    '중랑구': (37.6066, 127.0927), '성북구': (37.5894, 127.0167), '강북구': (37.6397, 127.0256),
+    '도봉구': (37.6688, 127.0471), '노원구': (37.6542, 127.0568), '은평구': (37.6027, 126.9291),
+    '서대문구': (37.5791, 126.9368), '마포구': (37.5663, 126.9019), '양천구': (37.5170, 126.8665),
+    '강서구': (37.5509, 126.8495), '구로구': (37.4954, 126.8874), '금천구': (37.4569, 126.8955),
+    '영등포구': (37.5264, 126.8962), '동작구': (37.5124, 126.9393), '관악구': (37.4784, 126.9516),
+    '서초구': (37.4837, 127.0324), '강남구': (37.5172, 127.0473), '송파구': (37.5145, 127.1059),
+    '강동구': (37.5301, 127.1238)
+}
+
+# LISA 군집 유형 (utils/spatial.py)
+LISA_LABELS = {
+    'HH': 'HH: 고-고 (핫스팟)',
+    'LL': 'LL: 저-저 (콜드스팟)',
+    'HL': 'HL: 고-저 (이상치)',
+    'LH': 'LH: 저-고 (이상치)',
+    'NS': '유의하지 않음'
+}
+
+# 대시보드 데이터셋 프로필 (utils/dashboard.py)
+# metrics: 의미 지표 -> 컬럼, quadrant.classify: True면 로드 시 classify_quadrant 로 분면 계산
+# panels: chart 종류 (type_bar, type_pie, ranking, stacked, ratio_heatmap, heading), full=True면 한 줄 전체
+DASHBOARD_PROFILES = {
+    # 샘플 데이터 (분면 포함, 인구당 비율 %)
+    'sample': {
+        'title': '서울시 CCTV와 범죄 발생 상관 분석 대시보드',
+        'subtitle': None,
+        'path': 'data/processed/integrated_data_with_quadrant.csv',
+        'columns': None,
+        'summary': True,
+        'metrics': {
+            'region': '자치구',
+            'quadrant': '분면',
+            'cctv_total': '총_CCTV',
+            'crime_total': '총_범죄',
+            'cctv_rate': '인구당_총CCTV',
+            'crime_rate': '인구당_CCTV효과범죄율',
+            'population': '인구수'
+        },
+        'headline': [
+            ('총 CCTV 대수', 'cctv_total', 'sum', '{:,.0f}대'),
+            ('총 범죄 건수', 'crime_total', 'sum', '{:,.0f}건'),
+            ('평균 인구당 CCTV', 'cctv_rate', 'mean', '{:.2f}대'),
+            ('평균 범죄율', 'crime_rate', 'mean', '{:.2f}%')
+        ],
+        'quadrant': {
+            'classify': False,
+            'x': 'cctv_rate',
+            'y': 'crime_rate',
+            'size': 'cctv_total',
+            'hover': ['cctv_total', 'crime_total'],
+            'title': 'CCTV 밀도 vs 범죄율 (4사분면 분석)',
+            'stats_names': None
+        },
+        'key_correlations': [],
+        'cctv_header': 'CCTV 유형별 분석',
+        'cctv_panels': [
+            {'chart': 'type_bar', 'columns': ['방범용', '교통단속용', '어린이안전용', '기타'],
+             'title': 'CCTV 유형별 설치 현황', 'x_label': 'CCTV 유형', 'y_label': '설치 대수', 'text': '%{text:,}대'},
+            {'chart': 'ranking', 'column': '총_CCTV', 'title': 'CCTV 설치 대수 상위 10개 자치구',
+             'label': 'CCTV 대수', 'scale': 'Blues', 'text': '%{text:,}대'},
+            {'chart': 'heading', 'text': '#### 자치구별 CCTV 유형별 비율 히트맵', 'full': True},
+            {'chart': 'ratio_heatmap', 'columns': ['방범용_비율', '교통단속용_비율', '어린이안전용_비율', '기타_비율'],
+             'names': ['방범용', '교통단속용', '어린이안전용', '기타'], 'title': '자치구별 CCTV 유형 비율',
+             'type_label': 'CCTV 유형', 'full': True}
+        ],
+        'crime_header': '범죄 유형별 분석',
+        'crime_panels': [
+            {'chart': 'type_pie', 'columns': ['절도', '강도', '차량범죄', '공공장소폭력', '성범죄'],
+             'title': '범죄 유형별 발생 비율'},
+            {'chart': 'ranking', 'column': '총_범죄', 'title': '범죄 발생 건수 상위 10개 자치구',
+             'label': '범죄 건수', 'scale': 'Reds', 'text': '%{text:,}건'},
+            {'chart': 'heading', 'text': '#### CCTV 효과 범죄 (절도, 강도, 차량범죄) 분석', 'full': True},
+            {'chart': 'ranking', 'column': 'CCTV효과범죄_합계', 'title': 'CCTV 효과 범죄 상위 10개 자치구',
+             'label': '범죄 건수', 'scale': 'Oranges', 'text': '%{text:,}건'},
+            {'chart': 'ranking', 'column': '인구당_CCTV효과범죄율', 'title': '인구당 CCTV효과범죄율 상위 10개 자치구',
+             'label': '범죄율 (%)', 'scale': 'Reds', 'text': '%{text:.2f}%'}
+        ],
+        'correlation': {
+            'columns': [
+                '인구당_총CCTV', '인구당_방범용', '인구당_교통단속용', '인구당_어린이안전용',
+                '인구당_CCTV효과범죄율', '인구당_절도율', '인구당_강도율', '인구당_차량범죄율'
+            ],
+            'names': None,
+            'text_auto': False,
+            'explorer': True,
+            'pairs': []
+        },
+        'table': {
+            'columns': ['자치구', '총_CCTV', '총_범죄', '인구수', '인구당_총CCTV', '인구당_CCTV효과범죄율', '분면'],
+            'names': None,
+            'selectable': True,
+            'file_name': 'cctv_crime_analysis.csv'
+        },
+        'labels': {},
+        'about': (
+            "**서울시 CCTV-범죄 상관 분석**\n\n"
+            "이 대시보드는 서울시 자치구별 CCTV 설치 현황과\n범죄 발생 간의 관계를 분석합니다.\n\n"
+            "**주요 기능:**\n- 4사분면 분류 분석\n- CCTV 유형별 분석\n- 범죄 유형별 분석\n- 상관관계 분석\n- 인터랙티브 시각화\n\n"
+            "**데이터 출처:**\n- 서울 열린데이터광장\n- 공공데이터포털\n- 통계청 KOSIS"
+        ),
+        'footer': '2023년 데이터 기준'
+    },
+    # 실제 데이터 (2024년, 인구 천명당 비율, 분면은 로드 시 계산)
+    'real': {
+        'title': '서울시 CCTV와 범죄 발생 상관 분석',
+        'subtitle': '2024년 실제 데이터 기반',
+        'path': 'data/processed/integrated_data_with_analysis.csv',
+        'columns': [
+            '자치구', 'CCTV_총계', '방범용', '어린이보호구역', '교통단속', '공원놀이터',
+            '총범죄_발생', '살인_발생', '강도_발생', '강간강제추행_발생', '절도_발생', '폭력_발생',
+            '총인구', '고령자수', 'CCTV효과범죄',
+            'CCTV_per_1000', '범죄_per_1000', '방범CCTV_per_1000', 'CCTV효과범죄_per_1000'
+        ],
+        'summary': False,
+        'metrics': {
+            'region': '자치구',
+            'quadrant': '분면',
+            'cctv_total': 'CCTV_총계',
+            'crime_total': '총범죄_발생',
+            'cctv_rate': 'CCTV_per_1000',
+            'crime_rate': '범죄_per_1000',
+            'population': '총인구'
+        },
+        'headline': [
+            ('총 CCTV 대수', 'cctv_total', 'sum', '{:,.0f}대'),
+            ('총 범죄 건수', 'crime_total', 'sum', '{:,.0f}건'),
+            ('평균 인구당 CCTV', 'cctv_rate', 'mean', '{:.2f}대/천명'),
+            ('평균 범죄율', 'crime_rate', 'mean', '{:.2f}건/천명')
+        ],
+        'quadrant': {
+            'classify': True,
+            'x': '방범CCTV_per_1000',
+            'y': 'CCTV효과범죄_per_1000',
+            'size': 'cctv_total',
+            'hover': ['cctv_total', 'crime_total'],
+            'title': '방범 CCTV 밀도 vs CCTV효과범죄율 (4사분면 분석)',
+            'stats_names': ['평균 방범CCTV', '평균 CCTV효과범죄율', '총 CCTV']
+        },
+        'key_correlations': [
+            ('전체 CCTV vs 전체 범죄', 'CCTV_per_1000', '범죄_per_1000'),
+            ('방범 CCTV vs CCTV효과범죄', '방범CCTV_per_1000', 'CCTV효과범죄_per_1000'),
+            ('CCTV 대수 vs 범죄 건수', 'CCTV_총계', '총범죄_발생')
+        ],
+        'cctv_header': 'CCTV 설치 현황 분석',
+        'cctv_panels': [
+            {'chart': 'ranking', 'column': 'CCTV_총계', 'title': 'CCTV 설치 대수 상위 10개 자치구',
+             'label': 'CCTV 대수', 'scale': 'Blues', 'text': '%{text:,.0f}대'},
+            {'chart': 'ranking', 'column': 'CCTV_per_1000', 'title': '인구 천명당 CCTV 상위 10개 자치구',
+             'label': '인구 천명당 CCTV', 'scale': 'Greens', 'text': '%{text:.2f}대'},
+            {'chart': 'heading', 'text': '#### CCTV 유형별 설치 현황', 'full': True},
+            {'chart': 'stacked', 'columns': ['방범용', '어린이보호구역', '교통단속', '공원놀이터'],
+             'title': '자치구별 CCTV 유형별 설치 현황 (상위 10개 자치구)',
+             'value_label': 'CCTV 대수', 'type_label': 'CCTV 유형', 'full': True}
+        ],
+        'crime_header': '범죄 발생 현황 분석',
+        'crime_panels': [
+            {'chart': 'ranking', 'column': '총범죄_발생', 'title': '범죄 발생 건수 상위 10개 자치구',
+             'label': '범죄 건수', 'scale': 'Reds', 'text': '%{text:,}건'},
+            {'chart': 'ranking', 'column': '범죄_per_1000', 'title': '인구당 범죄율 상위 10개 자치구',
+             'label': '범죄율 (건/천명)', 'scale': 'Oranges', 'text': '%{text:.2f}건'},
+            {'chart': 'heading', 'text': '#### 범죄 유형별 발생 현황', 'full': True},
+            {'chart': 'stacked', 'columns': ['살인_발생', '강도_발생', '강간강제추행_발생', '절도_발생', '폭력_발생'],
+             'sort': '절도_발생', 'title': '자치구별 범죄 유형별 발생 현황 (상위 10개 자치구)',
+             'value_label': '발생 건수', 'type_label': '범죄 유형', 'full': True}
+        ],
+        'correlation': {
+            'columns': ['CCTV_per_1000', '방범CCTV_per_1000', '범죄_per_1000', 'CCTV효과범죄_per_1000', '총인구', '고령자수'],
+            'names': ['전체 CCTV', '방범 CCTV', '전체 범죄율', 'CCTV효과범죄율', '총인구', '고령자수'],
+            'text_auto': True,
+            'explorer': False,
+            'pairs': [
+                ('CCTV_per_1000', '범죄_per_1000', '전체 CCTV vs 전체 범죄율'),
+                ('방범CCTV_per_1000', 'CCTV효과범죄_per_1000', '방범 CCTV vs CCTV효과범죄율')
+            ]
+        },
+        'table': {
+            'columns': [
+                '자치구', 'CCTV_총계', '방범용', '총범죄_발생', 'CCTV효과범죄',
+                '총인구', 'CCTV_per_1000', '범죄_per_1000',
+                '방범CCTV_per_1000', 'CCTV효과범죄_per_1000', '분면'
+            ],
+            'names': [
+                '자치구', 'CCTV 총계', '방범용 CCTV', '총 범죄', 'CCTV효과범죄',
+                '총 인구', 'CCTV/천명', '범죄율/천명',
+                '방범CCTV/천명', 'CCTV효과범죄율/천명', '분면'
+            ],
+            'selectable': False,
+            'file_name': 'cctv_crime_analysis_2024.csv'
+        },
+        'labels': {
+            'CCTV_per_1000': '인구 천명당 CCTV (대)',
+            '범죄_per_1000': '인구 천명당 범죄 (건)',
+            '방범CCTV_per_1000': '인구 천명당 방범 CCTV (대)',
+            'CCTV효과범죄_per_1000': '인구 천명당 CCTV효과범죄 (건)'
+        },
+        'about': (
+            "**서울시 CCTV-범죄 상관 분석**\n\n"
+            "이 대시보드는 2024년 실제 데이터를 바탕으로\n서울시 자치구별 CCTV 설치 현황과\n"
+            "범죄 발생 간의 관계를 분석합니다.\n\n"
+            "**주요 발견:**\n- CCTV와 범죄 간 강한 양의 상관관계 (r=0.77)\n- 범죄가 많은 지역에 CCTV를 더 많이 설치\n\n"
+            "**주요 기능:**\n- 4사분면 분류 분석\n- CCTV 유형별 분석\n- 범죄 유형별 분석\n- 상관관계 분석\n- 인터랙티브 시각화\n\n"
+            "**데이터 출처:**\n- 서울 열린데이터광장 (2024년)\n- 공공데이터포털"
+        ),
+        'footer': '2024년 실제 데이터 기준'
+    }
+}
@@ -0,0 +1,179 @@
+"""
+상관계수 매트릭스 + 유의성 검정 (일괄 계산)
+
+변수 쌍마다 stats.pearsonr 를 부르는 대신, 표준화한 데이터 행렬 곱 한 번으로
+모든 쌍의 상관계수 / 검정통계량 / p-value / BH 보정 q-value 를 계산합니다.
+- pearson : 표준화 행렬 Z 에 대해 R = Z'Z / (n-1), t 분포 검정 (stats.pearsonr 와 동일)
+- spearman: 평균 순위로 바꾼 뒤 pearson 과 같은 계산 (stats.spearmanr 와 동일)
+- kendall : 관측쌍 부호 행렬 S 에 대해 S'S 로 (일치 - 불일치) 를 한 번에 계산한 tau-b,
+            정규 근사 p-value (stats.kendalltau(method='asymptotic') 와 동일)
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+
+# kendall 부호 행렬을 한 번에 만들 때의 최대 원소 수 (메모리 제한)
+KENDALL_CHUNK = 20_000_000
+
+CORRELATION_METHODS = ('pearson', 'spearman', 'kendall')
+
+
+def _pearson(values):
+    """(n, p) -> 상관행렬, t 통계량, p-value"""
+    n = len(values)
+    centered = values - values.mean(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        z = centered / np.sqrt((centered ** 2).sum(axis=0))
+        r = np.clip(z.T @ z, -1.0, 1.0)
+        t = r * np.sqrt((n - 2) / (1 - r ** 2))
+    p = 2 * stats.t.sf(np.abs(t), n - 2)
+    return r, t, p
+
+
+def _tie_stats(column):
+    """kendall 동점 보정항 (동점쌍 수, sum t(t-1)(t-2), sum t(t-1)(2t+5))"""
+    _, counts = np.unique(column, return_counts=True)
+    counts = counts[counts > 1].astype('float64')
+    return ((counts * (counts - 1) / 2).sum(),
+            (counts * (counts - 1) * (counts - 2)).sum(),
+            (counts * (counts - 1) * (2 * counts + 5)).sum())
+
+
+def _kendall(values):
+    """(n, p) -> tau-b 행렬, z 통계량, p-value"""
+    n, p = values.shape
+
+    # 일치 - 불일치 = sum_(i,j) sign(x_i - x_j) sign(y_i - y_j) / 2 (순서쌍 전체)
+    con_minus_dis = np.zeros((p, p))
+    block = max(1, KENDALL_CHUNK // max(1, n * p))
+    for start in range(0, n, block):
+        signs = np.sign(values[start:start + block, None, :] - values[None, :, :]).reshape(-1, p)
+        con_minus_dis += signs.T @ signs
+    con_minus_dis /= 2
+
+    tot = n * (n - 1) / 2
+    tie, tie0, tie1 = np.array([_tie_stats(values[:, i]) for i in range(p)]).T
+    untied = np.diag(con_minus_dis)  # = tot - 동점쌍 수
+
+    m = n * (n - 1.0)
+    var = ((m * (2 * n + 5) - tie1[:, None] - tie1[None, :]) / 18
+           + 2 * np.outer(tie, tie) / m + np.outer(tie0, tie0) / (9 * m * (n - 2)))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        tau = np.clip(con_minus_dis / np.sqrt(np.outer(untied, untied)), -1.0, 1.0)
+        z = con_minus_dis / np.sqrt(var)
+    tau[(tie == tot)[:, None] | (tie == tot)[None, :]] = np.nan
+    p_value = 2 * stats.norm.sf(np.abs(z))
+    return tau, z, p_value
+
+
+def fdr_bh(p_values):
+    """
+    Benjamini-Hochberg FDR 보정 q-value
+
+    Args:
+        p_values (array-like): p-value (NaN 은 보정 대상에서 제외)
+
+    Returns:
+        np.ndarray: q-value (입력과 같은 순서)
+    """
+    p_values = np.asarray(p_values, dtype='float64')
+    q = np.full(p_values.shape, np.nan)
+    valid = np.flatnonzero(~np.isnan(p_values))
+    order = valid[np.argsort(p_values[valid])]
+    m = len(order)
+    if m == 0:
+        return q
+    ranked = p_values[order] * m / np.arange(1, m + 1)
+    q[order] = np.minimum(np.minimum.accumulate(ranked[::-1])[::-1], 1.0)
+    return q
+
+
+def correlate(values, method='pearson'):
+    """
+    데이터 행렬의 상관행렬과 검정 결과를 한 번에 계산
+
+    Args:
+        values (np.ndarray): (n, p) 데이터 (결측 없음)
+        method (str): 'pearson', 'spearman', 'kendall'
+
+    Returns:
+        tuple: (상관행렬, 검정통계량 행렬, p-value 행렬) 모두 (p, p)
+            pearson/spearman 은 t 통계량, kendall 은 z 통계량
+    """
+    assert method in CORRELATION_METHODS, f"[ERROR] method 는 {CORRELATION_METHODS} 중 하나여야 합니다: {method}"
+    values = np.asarray(values, dtype='float64')
+    if method == 'kendall':
+        return _kendall(values)
+    if method == 'spearman':
+        values = stats.rankdata(values, axis=0)
+    return _pearson(values)
+
+
+def correlation_table(df, columns=None, method='pearson'):
+    """
+    모든 변수 쌍의 상관계수, 검정통계량, p-value, BH 보정 q-value (긴 형식)
+
+    결측치가 있는 행은 모든 변수에서 함께 제외합니다 (listwise).
+
+    Args:
+        df (pd.DataFrame): 데이터프레임
+        columns (list, optional): 분석 변수 (기본: 숫자형 컬럼 전체)
+        method (str): 'pearson', 'spearman', 'kendall'
+
+    Returns:
+        pd.DataFrame: [변수1, 변수2, r, 통계량, p_value, q_value, n]
+
+    Examples:
+        >>> table = correlation_table(merged, correlation_vars)
+        >>> table[table['q_value'] < 0.05]
+    """
+    if columns is None:
+        columns = df.select_dtypes('number').columns.tolist()
+    values = df[columns].dropna().to_numpy(dtype='float64')
+    r, stat, p = correlate(values, method)
+
+    i, j = np.triu_indices(len(columns), k=1)
+    names = np.asarray(columns, dtype=object)
+    return pd.DataFrame({
+        '변수1': names[i],
+        '변수2': names[j],
+        'r': r[i, j],
+        '통계량': stat[i, j],
+        'p_value': p[i, j],
+        'q_value': fdr_bh(p[i, j]),
+        'n': len(values)
+    })
+
+
+def correlation_matrix(df, columns=None, method='pearson', value='r'):
+    """
+    상관계수 매트릭스 (히트맵용 정사각 DataFrame)
+
+    Args:
+        df (pd.DataFrame): 데이터프레임
+        columns (list, optional): 분석 변수 (기본: 숫자형 컬럼 전체)
+        method (str): 'pearson', 'spearman', 'kendall'
+        value (str): 'r', 'p_value', 'q_value'
+
+    Returns:
+        pd.DataFrame: columns x columns 매트릭스 (대각선: r=1, p/q=0)
+    """
+    if columns is None:
+        columns = df.select_dtypes('number').columns.tolist()
+    values = df[columns].dropna().to_numpy(dtype='float64')
+    r, _, p = correlate(values, method)
+
+    if value == 'r':
+        matrix = r
+        np.fill_diagonal(matrix, 1.0)
+    else:
+        assert value in ('p_value', 'q_value'), f"[ERROR] value 는 'r', 'p_value', 'q_value' 중 하나여야 합니다: {value}"
+        matrix = p
+        if value == 'q_value':
+            i, j = np.triu_indices(len(columns), k=1)
+            matrix = np.zeros_like(p)
+            matrix[i, j] = matrix[j, i] = fdr_bh(p[i, j])
+        np.fill_diagonal(matrix, 0.0)
+    return pd.DataFrame(matrix, index=list(columns), columns=list(columns))
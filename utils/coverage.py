@@ -0,0 +1,191 @@
+"""
+CCTV 감시 반경(커버리지) 계산
+
+인구당 CCTV 대수 대신, 카메라 유형별 감시 반경 안에 들어오는
+- 면적 비율 (커버면적비율): 서울 전역 래스터(기본 20m 셀)에 반경 원을 찍은 커버리지 마스크로 계산
+- 범죄 비율 (커버범죄비율): 반경별 KD-tree 최근접 조회(정확) 또는 마스크 조회(셀 단위 근사)
+을 지역 레이어(utils/points.py)별로 집계합니다.
+"""
+
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+
+from .constants import COVERAGE_RADIUS, SEOUL_BOUNDS, POINT_SPECS
+from .points import PointSet, to_meters, to_latlon, _remap_categories
+
+
+# 반경 원을 한 번에 찍을 때의 최대 셀 인덱스 수 (메모리 제한)
+STAMP_CHUNK = 5_000_000
+
+
+class CoverageEngine:
+    """
+    CCTV 커버리지 계산기
+
+    Args:
+        cameras (PointSet): CCTV 설치 지점 (type_col 속성 포함)
+        radius (dict): {CCTV 유형: 감시 반경(m)} (기본: COVERAGE_RADIUS)
+        type_col (str): 카메라 유형 컬럼 (기본: '설치목적')
+        categories (dict, optional): 원본 유형값 -> radius 의 유형명 (기본: POINT_SPECS['cctv'] 대응표)
+        default_radius (float): radius 에 없는 유형의 반경 (m)
+        cell_size (float): 커버리지 마스크 셀 크기 (m, 기본: 20)
+        bounds (dict): 마스크 범위 {'lat': (최소, 최대), 'lon': (최소, 최대)}
+
+    Examples:
+        >>> engine = CoverageEngine(cctv_points)
+        >>> engine.area_coverage(GridLayer(250))            # 격자별 커버 면적 비율
+        >>> engine.incident_coverage(incidents, '자치구')    # 자치구별 반경 내 범죄 비율
+    """
+
+    def __init__(self, cameras, radius=COVERAGE_RADIUS, type_col='설치목적', categories=None,
+                 default_radius=30, cell_size=20, bounds=SEOUL_BOUNDS):
+        if categories is None:
+            categories = POINT_SPECS['cctv']['categories']
+        names, codes = _remap_categories(pd.Categorical(cameras.attrs[type_col]), categories)
+        radius_of_type = np.array([radius.get(name, default_radius) for name in names] or [default_radius], dtype='float64')
+        camera_radius = np.where(codes >= 0, radius_of_type[np.maximum(codes, 0)], default_radius)
+
+        self.cameras = cameras
+        self.groups = {float(r): np.flatnonzero(camera_radius == r) for r in np.unique(camera_radius)}
+        self.cell_size = cell_size
+
+        corners = to_meters(list(bounds['lat']), list(bounds['lon']))
+        self.origin = corners[0]
+        nx, ny = np.ceil((corners[1] - corners[0]) / cell_size).astype('int64')
+        self.shape = (int(ny), int(nx))
+
+    def __repr__(self):
+        radii = ', '.join(f"{r:g}m x {len(idx):,}" for r, idx in self.groups.items())
+        return f"CoverageEngine(카메라 {len(self.cameras):,}대: {radii}, 셀 {self.cell_size:g}m, 마스크 {self.shape})"
+
+    @cached_property
+    def trees(self):
+        """반경별 카메라 KD-tree"""
+        return {r: cKDTree(self.cameras.xy[idx]) for r, idx in self.groups.items()}
+
+    def _cells(self, xy):
+        """평면 좌표 -> 마스크 (행, 열) 인덱스 (범위 밖은 -1)"""
+        cells = np.floor((xy - self.origin) / self.cell_size).astype('int64')
+        col, row = cells[:, 0], cells[:, 1]
+        inside = (row >= 0) & (row < self.shape[0]) & (col >= 0) & (col < self.shape[1])
+        return np.where(inside, row, -1), np.where(inside, col, -1)
+
+    @cached_property
+    def mask(self):
+        """
+        커버리지 마스크 (bool, 행=남->북, 열=서->동)
+
+        반경별로 카메라 주변 (2k+1)^2 셀 상자를 한 번에 펼친 뒤,
+        셀 중심이 카메라 실제 위치에서 반경 안에 있는 셀만 표시한다.
+        """
+        mask = np.zeros(self.shape, dtype=bool)
+        xy = self.cameras.xy
+        row, col = self._cells(xy)
+
+        for r, idx in self.groups.items():
+            idx = idx[row[idx] >= 0]
+            k = int(np.ceil(r / self.cell_size))
+            dx, dy = (offset.ravel() for offset in np.meshgrid(np.arange(-k, k + 1), np.arange(-k, k + 1)))
+
+            n_chunks = max(1, len(idx) * len(dx) // STAMP_CHUNK + 1)
+            for chunk in np.array_split(idx, n_chunks):
+                rows = row[chunk][:, None] + dy
+                cols = col[chunk][:, None] + dx
+                center_x = self.origin[0] + (cols + 0.5) * self.cell_size
+                center_y = self.origin[1] + (rows + 0.5) * self.cell_size
+                ok = (center_x - xy[chunk, :1]) ** 2 + (center_y - xy[chunk, 1:]) ** 2 <= r ** 2
+                ok &= (rows >= 0) & (rows < self.shape[0]) & (cols >= 0) & (cols < self.shape[1])
+                mask[rows[ok], cols[ok]] = True
+        return mask
+
+    @cached_property
+    def cell_points(self):
+        """마스크 셀 중심점 (지역 레이어 배정용, mask.ravel() 순서)"""
+        ny, nx = self.shape
+        xy = np.column_stack([np.tile(np.arange(nx), ny), np.repeat(np.arange(ny), nx)])
+        lat, lon = to_latlon(self.origin + (xy + 0.5) * self.cell_size)
+        return PointSet(lat, lon)
+
+    def covered(self, points, exact=True):
+        """
+        점별 커버 여부 (어느 카메라든 유형별 반경 안에 있으면 True)
+
+        Args:
+            points (PointSet): 조회할 점 (예: 범죄 발생 지점)
+            exact (bool): True면 반경별 KD-tree 최근접 거리로 판정,
+                False면 커버리지 마스크 셀 조회 (셀 크기만큼 근사, 더 빠름)
+
+        Returns:
+            np.ndarray: bool 배열
+        """
+        if not exact:
+            row, col = self._cells(points.xy)
+            return np.where(row >= 0, self.mask[np.maximum(row, 0), np.maximum(col, 0)], False)
+
+        hit = np.zeros(len(points), dtype=bool)
+        xy = points.xy
+        for r, tree in self.trees.items():
+            todo = np.flatnonzero(~hit)
+            if len(todo) == 0:
+                break
+            dist, _ = tree.query(xy[todo], distance_upper_bound=r)
+            hit[todo[np.isfinite(dist)]] = True
+        return hit
+
+    def area_coverage(self, layer):
+        """
+        지역별 커버 면적 비율
+
+        Args:
+            layer (GridLayer/PolygonLayer/CentroidLayer): 지역 레이어 (면적 계산이 필요하므로 속성 컬럼 레이어 불가)
+
+        Returns:
+            pd.DataFrame: [지역, 면적_km2, 커버면적_km2, 커버면적비율]
+        """
+        assert not isinstance(layer, str), "[ERROR] 면적 커버리지는 격자/경계/중심점 레이어가 필요합니다"
+        regions = layer.assign(self.cell_points)
+        codes = regions.codes.astype('int64')
+        valid = codes >= 0
+        n_regions = len(regions.categories)
+
+        cell_km2 = self.cell_size ** 2 / 1e6
+        total = np.bincount(codes[valid], minlength=n_regions) * cell_km2
+        covered = np.bincount(codes[valid], weights=self.mask.ravel()[valid], minlength=n_regions) * cell_km2
+
+        return pd.DataFrame({
+            layer.name: regions.categories,
+            '면적_km2': total.round(4),
+            '커버면적_km2': covered.round(4),
+            '커버면적비율': np.divide(covered, total, out=np.zeros(n_regions), where=total > 0)
+        })
+
+    def incident_coverage(self, incidents, layer, exact=True):
+        """
+        지역별 감시 반경 내 범죄 비율
+
+        Args:
+            incidents (PointSet): 범죄 발생 지점
+            layer (str or layer): 지역 레이어
+            exact (bool): covered() 참고
+
+        Returns:
+            pd.DataFrame: [지역, 범죄건수, 커버범죄건수, 커버범죄비율]
+        """
+        hit = self.covered(incidents, exact=exact)
+        regions = incidents.assign(layer)
+        codes = regions.codes.astype('int64')
+        valid = codes >= 0
+        n_regions = len(regions.categories)
+
+        total = np.bincount(codes[valid], minlength=n_regions)
+        covered = np.bincount(codes[valid], weights=hit[valid], minlength=n_regions).astype('int64')
+
+        return pd.DataFrame({
+            layer if isinstance(layer, str) else layer.name: regions.categories,
+            '범죄건수': total,
+            '커버범죄건수': covered,
+            '커버범죄비율': np.divide(covered, total, out=np.zeros(n_regions), where=total > 0)
+        })
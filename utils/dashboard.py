@@ -0,0 +1,939 @@
+"""
+대시보드 엔진 (Streamlit)
+
+데이터셋 프로필(constants.DASHBOARD_PROFILES)이 의미 지표(CCTV 총계, 범죄율 등)를 실제 컬럼에 연결하고,
+하나의 엔진이 로드 / 필터 / 집계 캐시 / 차트 생성을 모든 데이터셋에 공통으로 처리합니다.
+- load_data: 프로필별 단일 캐시 로더 (필요 시 분면 계산)
+- compute_aggregates: 필터 선택별 파생 표 일괄 계산 (세션 간 공유 캐시)
+- 차트 빌더: 순위 막대, 유형별 합계, 누적 막대, 비율 히트맵, 상관 히트맵, 산점도
+- 탭: 선택된 탭만 fragment 로 계산
+
+streamlit / plotly 는 대시보드에서만 필요하므로 utils 패키지에서 재노출하지 않습니다.
+
+Examples:
+    >>> from utils.dashboard import run_dashboard
+    >>> run_dashboard('real')      # 주소 뒤 ?profile=sample 로 바꿀 수 있음
+"""
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+from .constants import DASHBOARD_PROFILES, QUADRANT_LABELS
+from .helpers import classify_quadrant
+from .storage import load_table
+from .correlation import correlation_matrix
+from .filters import FilterIndex
+from .scatter import scatter_layers
+
+
+# 사이드바 필터 컬럼 (데이터에 있는 컬럼만 사용, 자치구·분면은 프로필의 region / quadrant 컬럼)
+FILTER_COLUMNS = ['연도', 'CCTV밀도_등급', '범죄율_등급']
+
+# 4분면 색상 (QUADRANT_LABELS 순서)
+QUADRANT_COLORS = dict(zip(QUADRANT_LABELS, ['#ff7f0e', '#d62728', '#2ca02c', '#1f77b4']))
+
+# 순위 차트 개수
+TOP_N = 10
+
+STYLE = """
+    <style>
+    .main-header {
+        font-size: 2.5rem;
+        font-weight: bold;
+        color: #1f77b4;
+        text-align: center;
+        padding: 1rem 0;
+    }
+    .sub-header {
+        font-size: 1.5rem;
+        font-weight: bold;
+        color: #2c3e50;
+        margin-top: 2rem;
+    }
+    .metric-card {
+        background-color: #f0f2f6;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        margin: 0.5rem 0;
+    }
+    </style>
+"""
+
+TABS = {
+    'summary': "📌 SUMMARY",
+    'overview': "📈 개요",
+    'cctv': "📹 CCTV 분석",
+    'crime': "🚨 범죄 분석",
+    'correlation': "🗺️ 상관관계",
+    'table': "📋 데이터 테이블"
+}
+
+
+def _col(profile, name):
+    """의미 지표 이름 -> 컬럼명 (metrics 에 없으면 컬럼명 그대로)"""
+    return profile['metrics'].get(name, name)
+
+
+def _filter_columns(profile):
+    return [_col(profile, 'region'), _col(profile, 'quadrant')] + FILTER_COLUMNS
+
+
+def _panels(profile):
+    return profile['cctv_panels'] + profile['crime_panels']
+
+
+# ============================================================
+# 데이터 (캐시)
+# ============================================================
+@st.cache_data
+def load_data(profile_name):
+    """프로필의 데이터 로드 (quadrant.classify 면 분면 계산)"""
+    profile = DASHBOARD_PROFILES[profile_name]
+    try:
+        df = load_table(profile['path'], columns=profile['columns'])
+    except Exception as e:
+        st.error(f"데이터 로드 중 오류 발생: {e}")
+        return None
+
+    quadrant = profile['quadrant']
+    if quadrant['classify']:
+        df[_col(profile, 'quadrant')] = classify_quadrant(df, _col(profile, quadrant['x']), _col(profile, quadrant['y']))
+    return df
+
+
+@st.cache_resource
+def load_filter_index(profile_name):
+    """필터 비트맵 인덱스 (세션 간 공유, 데이터 로드 후 한 번만 생성)"""
+    return FilterIndex(load_data(profile_name), _filter_columns(DASHBOARD_PROFILES[profile_name]))
+
+
+@st.cache_data
+def load_lag_cube():
+    """시차 분석 결과 (02_코드/compute_lags.py 로 미리 계산한 캐시 파일)"""
+    try:
+        return load_table('data/processed/lag_cube.csv')
+    except FileNotFoundError:
+        return None
+
+
+def filter_data(profile_name, selection):
+    """
+    필터 선택에 해당하는 행 (캐시하지 않음)
+
+    비트맵 인덱스로 행 마스크를 1ms 이내에 얻으므로, 선택별 캐시에는 필터 데이터 사본 대신
+    집계 결과만 두고 그릴 때마다 load_data() 의 프레임 하나를 잘라 쓴다.
+    """
+    return load_data(profile_name)[load_filter_index(profile_name).mask(dict(selection))]
+
+
+@st.cache_data(max_entries=256)
+def compute_aggregates(profile_name, selection):
+    """
+    필터 선택 하나에 대한 모든 파생 표를 한 번에 계산 (세션 간 공유, 선택 조합 수만큼만 보관)
+
+    Args:
+        profile_name (str): DASHBOARD_PROFILES 키
+        selection (tuple): ((컬럼, 정렬된 선택 값 tuple), ...) 정규화된 필터 선택
+
+    Returns:
+        dict: 주요 지표, 분면 집계, 패널별 표, 상관/q-value 행렬 (필터 데이터는 filter_data() 로 조회)
+    """
+    profile = DASHBOARD_PROFILES[profile_name]
+    filtered = filter_data(profile_name, selection)
+    region, quadrant = _col(profile, 'region'), _col(profile, 'quadrant')
+    spec = profile['quadrant']
+    x, y, size = _col(profile, spec['x']), _col(profile, spec['y']), _col(profile, spec['size'])
+
+    quadrant_stats = filtered.groupby(quadrant, observed=True).agg({x: 'mean', y: 'mean', size: 'sum'}).round(2)
+    if spec['stats_names']:
+        quadrant_stats.columns = spec['stats_names']
+
+    panels = {}
+    for i, panel in enumerate(_panels(profile)):
+        chart = panel['chart']
+        if chart == 'ranking':
+            col = panel['column']
+            panels[i] = filtered.nlargest(TOP_N, col)[[region, col]].sort_values(col, ascending=True)
+        elif chart in ('type_bar', 'type_pie'):
+            panels[i] = filtered[panel['columns']].sum()
+        elif chart == 'stacked':
+            panels[i] = filtered[[region] + panel['columns']].set_index(region) \
+                .nlargest(TOP_N, panel.get('sort', panel['columns'][0]))
+        elif chart == 'ratio_heatmap':
+            panels[i] = filtered[[region] + panel['columns']].set_index(region)
+
+    columns = profile['correlation']['columns']
+    key_columns = list(dict.fromkeys(col for _, a, b in profile['key_correlations'] for col in (a, b)))
+    return {
+        'headline': [(label, getattr(filtered[_col(profile, metric)], how)(), fmt)
+                     for label, metric, how, fmt in profile['headline']],
+        'median_x': filtered[x].median(),
+        'median_y': filtered[y].median(),
+        'quadrant_counts': filtered[quadrant].value_counts(),
+        'quadrant_stats': quadrant_stats,
+        'panels': panels,
+        'corr_matrix': correlation_matrix(filtered, columns),
+        'q_matrix': correlation_matrix(filtered, columns, value='q_value'),
+        'key_matrix': correlation_matrix(filtered, key_columns) if key_columns else None
+    }
+
+
+@st.cache_data(max_entries=256)
+def compute_scatter(profile_name, selection, x, y, columns=()):
+    """
+    산점도 렌더링 단위 (점/밀도 타일, 이상치 라벨, 추세선) 캐시
+
+    점은 지역/축/columns(색, 크기, 호버) 컬럼만 남겨 보관한다 (밀도 타일 모드에서는 점 없음).
+    """
+    region = _col(DASHBOARD_PROFILES[profile_name], 'region')
+    needed = list(dict.fromkeys(col for col in (region, x, y) + tuple(columns) if col))
+    return scatter_layers(filter_data(profile_name, selection)[needed], x, y, label_col=region)
+
+
+# ============================================================
+# 차트 빌더
+# ============================================================
+def ranking_bar(table, region, col, title, label, scale, text):
+    """상위 N개 지역 가로 막대"""
+    fig = px.bar(
+        table,
+        x=col,
+        y=region,
+        orientation='h',
+        title=title,
+        labels={col: label, region: ''},
+        text=col,
+        color=col,
+        color_continuous_scale=scale
+    )
+    fig.update_traces(texttemplate=text, textposition='outside')
+    fig.update_layout(showlegend=False, height=400)
+    return fig
+
+
+def type_bar(totals, title, x_label, y_label, text):
+    """유형별 합계 막대"""
+    names = list(totals.index)
+    fig = px.bar(
+        x=names,
+        y=totals.values,
+        title=title,
+        labels={'x': x_label, 'y': y_label},
+        color=names,
+        text=totals.values
+    )
+    fig.update_traces(texttemplate=text, textposition='outside')
+    fig.update_layout(showlegend=False, height=400)
+    return fig
+
+
+def type_pie(totals, title):
+    """유형별 비율 도넛"""
+    fig = px.pie(
+        values=totals.values,
+        names=list(totals.index),
+        title=title,
+        hole=0.4,
+        color_discrete_sequence=px.colors.sequential.Reds_r
+    )
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    fig.update_layout(height=400)
+    return fig
+
+
+def stacked_bar(table, title, value_label, type_label):
+    """지역별 유형 누적 막대"""
+    return px.bar(
+        table,
+        title=title,
+        labels={'value': value_label, 'variable': type_label},
+        barmode='stack',
+        height=400
+    )
+
+
+def ratio_heatmap(table, region, names, title, type_label='유형'):
+    """지역 x 유형 비율 히트맵"""
+    fig = px.imshow(
+        table.T,
+        labels=dict(x=region, y=type_label, color="비율 (%)"),
+        x=table.index,
+        y=names,
+        aspect="auto",
+        color_continuous_scale='YlOrRd',
+        title=title
+    )
+    fig.update_layout(height=300)
+    return fig
+
+
+def correlation_heatmap(matrix, names=None, text_auto=False):
+    """상관계수 히트맵"""
+    names = names or list(matrix.columns)
+    fig = px.imshow(
+        matrix,
+        labels=dict(color="상관계수"),
+        x=names,
+        y=names,
+        color_continuous_scale='RdBu_r',
+        aspect="auto",
+        title='상관관계 히트맵',
+        zmin=-1,
+        zmax=1,
+        text_auto='.2f' if text_auto else False
+    )
+    fig.update_layout(height=600 if not text_auto else 500)
+    return fig
+
+
+def scatter_figure(layers, x, y, color, size, title, region, hover=None, labels=None, trendline=False):
+    """
+    scatter_layers() 결과로 산점도 생성
+
+    점 수에 따라 SVG / WebGL(Scattergl) / 서버 밀도 타일(Heatmap)로 그리고,
+    라벨은 이상치에만, 추세선은 미리 계산한 양 끝 두 점으로 그린다.
+    """
+    labels = labels or {}
+    if layers['mode'] == 'density':
+        tiles = layers['tiles']
+        fig = go.Figure(go.Heatmap(
+            x=tiles['x'], y=tiles['y'], z=tiles['점수'],
+            colorscale='Blues', colorbar=dict(title='점 수'), hoverongaps=False
+        ))
+        fig.update_layout(title=title, xaxis_title=labels.get(x, x), yaxis_title=labels.get(y, y))
+    else:
+        fig = px.scatter(
+            layers['points'],
+            x=x,
+            y=y,
+            color=color,
+            size=size,
+            hover_data=[region] + list(hover or []),
+            title=title,
+            labels=labels,
+            color_discrete_map=QUADRANT_COLORS,
+            render_mode=layers['mode']
+        )
+
+    outliers = layers['labels']
+    if len(outliers):
+        fig.add_trace(go.Scatter(
+            x=outliers[x], y=outliers[y], text=outliers[region], mode='text',
+            textposition='top center', textfont_size=8, showlegend=False, hoverinfo='skip'
+        ))
+
+    trend = layers['trend']
+    if trendline and trend is not None:
+        fig.add_trace(go.Scatter(
+            x=trend['x'], y=trend['y'], mode='lines', line=dict(color='gray'),
+            name=f"OLS (R²={trend['r2']:.3f})"
+        ))
+    return fig
+
+
+def lag_figures(lag_cube, direction):
+    """시차 분석: 전체 시차 상관 선 그래프, 자치구별 시차 상관 히트맵"""
+    pooled = lag_cube[lag_cube['지역'] == '전체']
+    fig_lag = px.line(
+        pooled, x='시차', y='상관계수', color='방향', markers=True,
+        title='시차별 상관 (자치구 고정효과)',
+        labels={'시차': '시차 (년)', '상관계수': '상관계수'}
+    )
+    fig_lag.add_hline(y=0, line_dash='dash', line_color='gray')
+    fig_lag.update_layout(height=400)
+
+    by_region = lag_cube[(lag_cube['방향'] == direction) & (lag_cube['지역'] != '전체')]
+    fig_region = px.imshow(
+        by_region.pivot(index='지역', columns='시차', values='상관계수'),
+        color_continuous_scale='RdBu_r', zmin=-1, zmax=1, aspect='auto',
+        title=f'자치구별 시차 상관 ({direction})'
+    )
+    fig_region.update_layout(height=600)
+    return fig_lag, fig_region
+
+
+# ============================================================
+# 탭 (선택된 탭만 계산, 탭 안 위젯은 해당 fragment 만 재실행)
+# ============================================================
+def _sub_header(text):
+    st.markdown(f'<div class="sub-header">{text}</div>', unsafe_allow_html=True)
+
+
+@st.fragment
+def render_summary_tab():
+    # ---------- 컴팩트 히어로 ----------
+    st.markdown("""
+    <div style="padding:20px 26px;border-radius:14px;
+                background:linear-gradient(135deg,#1e3a8a 0%,#7f1d1d 100%);
+                border:1px solid rgba(255,255,255,0.08);margin-bottom:18px;">
+        <div style="display:flex;align-items:center;gap:14px;flex-wrap:wrap;">
+            <div style="font-size:24px;font-weight:800;color:#fff;">
+                🚨 서울시 안전 인프라 최적화
+            </div>
+            <div style="font-size:14px;color:#fca5a5;letter-spacing:0.5px;">
+                공공데이터로 정책 제안 수준의 인사이트를 도출할 수 있습니다
+            </div>
+        </div>
+        <div style="font-size:14px;color:#e5e7eb;margin-top:8px;line-height:1.6;">
+            24개 자치구 × 36개 변수 분석으로 <b style="color:#fff;">CCTV-범죄의 역인과 관계</b>를 데이터로 규명하고,
+            <b style="color:#fca5a5;">사분면별 차별화 전략</b>으로 정책 우선순위를 제안합니다.
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # ---------- 4×4 매트릭스 ----------
+    C_FIND = "#3b82f6"   # Blue - 문제 발견
+    C_METHOD = "#ef4444" # Red - 분석 방법
+    C_POLICY = "#10b981" # Green - 정책 제안
+
+    td_base = (
+        "padding:18px 20px;vertical-align:top;"
+        "border:1px solid rgba(255,255,255,0.08);"
+        "background:rgba(255,255,255,0.03);"
+    )
+    td_label = (
+        "padding:18px 20px;vertical-align:top;"
+        "border:1px solid rgba(255,255,255,0.08);"
+        "background:rgba(252,165,165,0.08);"
+        "width:14%;"
+    )
+
+    def _header_cell(icon, title, color, question):
+        return (
+            f'<td style="{td_base}border-top:3px solid {color};width:28.6%;">'
+            f'<div style="font-size:32px;line-height:1;">{icon}</div>'
+            f'<div style="font-size:22px;font-weight:800;color:{color};margin:10px 0 6px 0;letter-spacing:-0.5px;">{title}</div>'
+            f'<div style="color:#e5e7eb;font-size:13.5px;font-style:italic;line-height:1.5;">{question}</div>'
+            f'</td>'
+        )
+
+    def _label_cell(icon, text):
+        return (
+            f'<td style="{td_label}">'
+            f'<div style="font-size:22px;">{icon}</div>'
+            f'<div style="color:#fff;font-size:16px;font-weight:800;margin-top:6px;line-height:1.3;">{text}</div>'
+            f'</td>'
+        )
+
+    def _content_cell(html_content, color=None, bold=False):
+        weight = "600" if bold else "400"
+        col = color if color else "#e5e7eb"
+        return (
+            f'<td style="{td_base}">'
+            f'<div style="color:{col};font-size:14px;line-height:1.8;font-weight:{weight};">{html_content}</div>'
+            f'</td>'
+        )
+
+    # 큰따옴표가 들어간 셀 (f-string 식 안에서는 역슬래시를 쓸 수 없음)
+    where_text = '"어디에 먼저, 얼마나"를<br>정량적 근거로 답해야 한다'
+    misread_text = 'r=0.768만 보면<br><b>"CCTV가 범죄 유발"</b> 오해'
+
+    table_html = (
+        '<table style="width:100%;border-collapse:separate;border-spacing:0;border-radius:14px;overflow:hidden;">'
+        # 헤더
+        '<tr>'
+        f'{_label_cell("🗂️", "구분")}'
+        f'{_header_cell("🔍", "문제 발견", C_FIND, "CCTV가 많을수록 범죄가 많다? r=0.768의 함정")}'
+        f'{_header_cell("📊", "분석 방법", C_METHOD, "24개 자치구를 어떻게 차별화 분류할 것인가")}'
+        f'{_header_cell("💡", "정책 제안", C_POLICY, "어디에 먼저, 얼마나 — 판단할 수 있는 근거")}'
+        '</tr>'
+        # 행 1: 문제 정의
+        '<tr>'
+        f'{_label_cell("🎯", "문제 정의")}'
+        f'{_content_cell("단순 상관계수만 보면<br>인과 방향을 오해하기 쉽다")}'
+        f'{_content_cell("자치구 간 편차가 커서<br>평균만 보면 특성이 묻힌다")}'
+        f'{_content_cell(where_text)}'
+        '</tr>'
+        # 행 2: 접근 방법
+        '<tr>'
+        f'{_label_cell("🔬", "접근 방법")}'
+        f'{_content_cell("• 상관·회귀 분석<br>• <b>상위 5구 교차 검증</b><br>• 시차 분석")}'
+        f'{_content_cell("• 인구당 CCTV × 범죄율<br>• <b>4사분면 자동 분류</b><br>• Z-score 위험도 점수화")}'
+        f'{_content_cell("• 사분면별 전략 매핑<br>• 격차 −20.9% 산출<br>• 예산 우선순위 도출")}'
+        '</tr>'
+        # 행 3: 왜 이 방법인가
+        '<tr>'
+        f'{_label_cell("📌", "왜 이 방법인가")}'
+        f'{_content_cell(misread_text)}'
+        f'{_content_cell("CV=0.419 변동성 →<br><b>일괄 정책은 비효율</b>")}'
+        f'{_content_cell("단순 순위가 아닌<br><b>구조적 분류</b>가 필요")}'
+        '</tr>'
+        # 행 4: 정책 활용
+        '<tr>'
+        f'{_label_cell("💼", "정책 활용")}'
+        f'{_content_cell("→ <b>역인과 규명</b><br>범죄 → CCTV (예방 X)", color=C_FIND, bold=True)}'
+        f'{_content_cell("→ Q2 확충 / Q1 운영 고도화 /<br>Q4 벤치마킹 전략 분리", color=C_METHOD, bold=True)}'
+        f'{_content_cell("→ 구로·노원·은평 등<br><b>최우선 설치 6개 구</b> 도출", color=C_POLICY, bold=True)}'
+        '</tr>'
+        '</table>'
+    )
+    st.markdown(table_html, unsafe_allow_html=True)
+
+    st.markdown("")
+
+    # ---------- 핵심 발견 3가지 ----------
+    st.markdown('<h3 style="margin-top:18px;">🏆 핵심 발견 3가지</h3>', unsafe_allow_html=True)
+
+    f1, f2, f3 = st.columns(3)
+    with f1:
+        st.error(
+            "**1️⃣ 역인과관계 확인**\n\n"
+            "CCTV 설치 상위 5개 자치구 = 범죄 발생 상위 5개 자치구.\n\n"
+            "→ CCTV는 \"예방용\"이 아니라 **사건 이후에 따라가는 형태**로 배치. "
+            "**\"범죄 증가 → CCTV 설치\"** 의 역인과."
+        )
+    with f2:
+        st.warning(
+            "**2️⃣ 최우선 설치 지역 도출**\n\n"
+            "Q2 (저CCTV/고범죄) **4개 구**, 평균 6.60대(인구 1,000명당).\n\n"
+            "→ 중앙값 8.34대 대비 **−20.9% 격차**. 이 격차만 메워도 밀도 기준 취약 지역 해소 가능."
+        )
+    with f3:
+        st.info(
+            "**3️⃣ 자치구 간 변동성 (CV=0.419)**\n\n"
+            "변동성이 높아 하나의 정책을 일괄 적용하는 것은 비효율적.\n\n"
+            "→ **사분면별 차별화 전략**이 필수."
+        )
+
+    st.success(
+        "💡 **핵심 메시지**: \"숫자가 보여주는 것과 숫자가 의미하는 것은 다르다.\" "
+        "분석가의 역할은 숫자를 내는 것이 아니라 **올바르게 해석하는 것**."
+    )
+
+    st.markdown("---")
+
+    # ---------- 상세 탭 (접이식) ----------
+    itab1, itab2, itab3, itab4 = st.tabs([
+        "🧭 방법론 선택의 근거",
+        "🛠️ 문제 해결 경험",
+        "💼 정책 활용 시나리오",
+        "⏱️ 시차 분석",
+    ])
+
+    with itab1:
+        st.caption("\"통계를 돌린 것\"과 \"통계를 고른 것\"은 다릅니다. 이 프로젝트에서 각 방법을 선택한 이유입니다.")
+        method_df = pd.DataFrame({
+            "분석 단계": ["인과 해석", "자치구 분류", "위험도 측정", "정책 제안"],
+            "흔한 접근": [
+                "상관계수만 보고 결론",
+                "평균·순위 나열",
+                "절대값 비교",
+                "일괄 권고",
+            ],
+            "이 프로젝트 선택": [
+                "상위 5구 교차 검증 + 시차 분석",
+                "인구당 CCTV × 범죄율 4사분면 자동 분류",
+                "Z-score 표준화 점수화",
+                "사분면별 차별화 전략",
+            ],
+            "선택 이유": [
+                "r=0.768 → \"CCTV가 범죄 유발\" 오해 방지",
+                "CV=0.419 변동성 → 평균 무의미",
+                "자치구 규모(인구) 차이 보정",
+                "Q2는 확충, Q1은 운영 고도화 등 맞춤 처방",
+            ],
+        })
+        st.dataframe(method_df, use_container_width=True, hide_index=True)
+
+    with itab2:
+        st.caption("분석 과정에서 마주친 두 가지 핵심 문제와 해결 과정입니다.")
+
+        st.markdown("#### 1️⃣ 역인과관계 해석의 오류 방지")
+        c1, c2, c3 = st.columns(3)
+        with c1:
+            st.error(
+                "**🚨 문제**\n\n"
+                "CCTV-범죄 상관계수 **r=0.768** → "
+                "단순 해석 시 **\"CCTV가 범죄를 유발한다\"** 는 잘못된 결론에 빠질 위험"
+            )
+        with c2:
+            st.info(
+                "**🔧 해결**\n\n"
+                "상위 5구 교차 검증 + 4사분면 분류로 "
+                "**\"범죄가 먼저, CCTV가 뒤따라\"** 구조 검증"
+            )
+        with c3:
+            st.success(
+                "**🎓 결과**\n\n"
+                "**\"CCTV 증가 → 범죄 증가\"** 가 아닌 "
+                "**\"범죄 증가 → CCTV 설치\"** 역인과 방향을 데이터로 규명"
+            )
+
+        st.markdown("")
+        st.markdown("#### 2️⃣ 자치구 편차를 무시한 일괄 분석의 한계")
+        c1, c2, c3 = st.columns(3)
+        with c1:
+            st.error(
+                "**🚨 문제**\n\n"
+                "24개 자치구를 하나의 평균으로 분석하면 지역별 특성이 묻힘 "
+                "(**CV=0.419**, 변동성 높음)"
+            )
+        with c2:
+            st.info(
+                "**🔧 해결**\n\n"
+                "인구당 CCTV × 범죄율 기준 **4사분면 자동 분류 모델** + "
+                "**Z-score 위험도 점수화**"
+            )
+        with c3:
+            st.success(
+                "**🎓 결과**\n\n"
+                "동일 정책이 아닌 "
+                "**사분면별 차별화 전략**(Q2 확충 / Q1 운영 고도화)의 근거 마련"
+            )
+
+    with itab3:
+        st.caption("이 분석 결과를 실제 서울시 정책에 적용할 수 있는 3가지 시나리오입니다.")
+
+        # 1. 최우선 과제
+        st.markdown("#### 🚨 1. 최우선 과제: Q2(저CCTV/고범죄) CCTV 확충")
+        st.markdown(
+            f'<div style="padding:18px;border-radius:12px;'
+            f'background:rgba(239,68,68,0.06);'
+            f'border:1px solid rgba(239,68,68,0.25);">'
+            f'<div style="color:#e5e7eb;font-size:14px;line-height:1.75;">'
+            f'<b style="color:#fff;">구로구 · 노원구 · 은평구 · 종로구 · 성동구 · 용산구</b><br>'
+            f'CCTV 밀도가 낮으면서 범죄율이 높은 가장 취약한 지역. '
+            f'Q2와 중앙값 격차(<b style="color:{C_METHOD};">−20.9%</b>) 해소만으로 밀도 기준 취약 지역 해소 가능.<br>'
+            f'<b style="color:{C_POLICY};">목표</b>: 2028년까지 구로구·노원구를 중앙값(8.34대) 수준으로 보급.'
+            f'</div></div>',
+            unsafe_allow_html=True,
+        )
+
+        st.markdown("")
+
+        # 2. 사분면별 차별화 전략
+        st.markdown("#### 🎯 2. 사분면별 차별화 전략")
+        st.caption("CV=0.419 → 전 자치구 일괄 정책은 비효율적. 사분면별 맞춤 전략이 필요합니다.")
+        quadrant_df = pd.DataFrame({
+            "사분면": ["Q1 (고/고)", "Q2 (저/고)", "Q3 (저/저)", "Q4 (고/저)"],
+            "자치구": [
+                "송파·강동·영등포·중구·관악",
+                "구로·노원·은평·종로·성동·용산",
+                "중랑·강서·양천·금천·강북",
+                "강남·서초·광진·도봉",
+            ],
+            "전략": [
+                "AI 영상분석·경찰 순찰 연계 등 운영 고도화",
+                "신규 설치 최우선",
+                "현 수준 유지, 분기별 모니터링",
+                "벤치마크 대상 → 강남 방식을 구로·노원에 적용",
+            ],
+        })
+        st.dataframe(quadrant_df, use_container_width=True, hide_index=True)
+
+        st.markdown("")
+
+        # 3. 예산 배분 우선순위
+        st.markdown("#### 💰 3. 예산 배분 우선순위")
+        budget_df = pd.DataFrame({
+            "순위": ["1순위", "2순위", "3순위"],
+            "대상 자치구": [
+                "구로·노원·은평·종로",
+                "송파·강동·영등포",
+                "중랑·강서·금천",
+            ],
+            "정책": [
+                "CCTV 신규 설치",
+                "운영 고도화",
+                "모니터링 유지",
+            ],
+        })
+        st.dataframe(budget_df, use_container_width=True, hide_index=True)
+
+        st.success(
+            "💡 \"어디에 먼저, 얼마나\"를 판단할 수 있는 **데이터 기반 정책 근거**."
+        )
+
+    with itab4:
+        st.caption("CCTV 순증과 범죄의 선후 관계: 범죄→CCTV 방향이 강하면 \"범죄가 먼저, CCTV가 뒤따라\" 구조입니다.")
+        lag_cube = load_lag_cube()
+        if lag_cube is None or lag_cube['상관계수'].notna().sum() == 0:
+            st.info("시차 분석 결과가 없습니다. 연도별 패널 구축 후 `python 02_코드/compute_lags.py` 를 실행하세요.")
+        else:
+            pooled = lag_cube[lag_cube['지역'] == '전체']
+            direction = st.radio("방향", ['범죄→CCTV', 'CCTV→범죄'], horizontal=True)
+            fig_lag, fig_region = lag_figures(lag_cube, direction)
+            st.plotly_chart(fig_lag, use_container_width=True)
+
+            st.markdown("#### 그랜저 인과 검정 (전체)")
+            st.dataframe(pooled[pooled['시차'] > 0][['방향', '시차', 'F', 'p_value', '그랜저_n']].round(4),
+                         use_container_width=True, hide_index=True)
+            st.plotly_chart(fig_region, use_container_width=True)
+
+
+@st.fragment
+def render_overview_tab(profile_name, selection):
+    profile = DASHBOARD_PROFILES[profile_name]
+    agg = compute_aggregates(profile_name, selection)
+    spec = profile['quadrant']
+    region, quadrant = _col(profile, 'region'), _col(profile, 'quadrant')
+    x, y, size = _col(profile, spec['x']), _col(profile, spec['y']), _col(profile, spec['size'])
+    hover = [_col(profile, name) for name in spec['hover']]
+    _sub_header('4사분면 분류 분석')
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        # 4사분면 산점도 + 중앙값 기준선
+        fig = scatter_figure(
+            compute_scatter(profile_name, selection, x, y, (quadrant, size, *hover)),
+            x=x,
+            y=y,
+            color=quadrant,
+            size=size,
+            title=spec['title'],
+            region=region,
+            hover=hover,
+            labels=profile['labels']
+        )
+        fig.add_hline(y=agg['median_y'], line_dash="dash", line_color="gray", opacity=0.5)
+        fig.add_vline(x=agg['median_x'], line_dash="dash", line_color="gray", opacity=0.5)
+        fig.update_layout(height=500, showlegend=True)
+        st.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        st.markdown(f"#### 분면별 {region} 수")
+        quadrant_counts = agg['quadrant_counts']
+        fig_pie = px.pie(
+            values=quadrant_counts.values,
+            names=quadrant_counts.index,
+            title='분면별 분포',
+            color_discrete_sequence=px.colors.qualitative.Set2
+        )
+        fig_pie.update_layout(height=300)
+        st.plotly_chart(fig_pie, use_container_width=True)
+
+        st.markdown("#### 분면별 평균 지표")
+        st.dataframe(agg['quadrant_stats'], use_container_width=True)
+
+    if profile['key_correlations']:
+        st.markdown("#### 주요 상관관계 분석")
+        for column, (label, a, b) in zip(st.columns(len(profile['key_correlations'])), profile['key_correlations']):
+            with column:
+                st.metric(label, f"{agg['key_matrix'].loc[a, b]:.4f}")
+
+
+def _render_panels(panels, tables, region):
+    """패널 목록을 2열 격자로 (full 패널은 한 줄 전체)"""
+    row = []
+
+    def flush():
+        for column, (panel, table) in zip(st.columns(2), row):
+            with column:
+                _render_panel(panel, table, region)
+        row.clear()
+
+    for i, panel in enumerate(panels):
+        if panel.get('full'):
+            flush()
+            _render_panel(panel, tables.get(i), region)
+        else:
+            row.append((panel, tables.get(i)))
+            if len(row) == 2:
+                flush()
+    flush()
+
+
+def _render_panel(panel, table, region):
+    chart = panel['chart']
+    if chart == 'heading':
+        st.markdown(panel['text'])
+        return
+    if chart == 'ranking':
+        fig = ranking_bar(table, region, panel['column'], panel['title'], panel['label'], panel['scale'], panel['text'])
+    elif chart == 'type_bar':
+        fig = type_bar(table, panel['title'], panel['x_label'], panel['y_label'], panel['text'])
+    elif chart == 'type_pie':
+        fig = type_pie(table, panel['title'])
+    elif chart == 'stacked':
+        fig = stacked_bar(table, panel['title'], panel['value_label'], panel['type_label'])
+    elif chart == 'ratio_heatmap':
+        fig = ratio_heatmap(table, region, panel['names'], panel['title'], panel.get('type_label', '유형'))
+    else:
+        raise ValueError(f"[ERROR] 알 수 없는 차트 종류: {chart}")
+    st.plotly_chart(fig, use_container_width=True)
+
+
+@st.fragment
+def render_cctv_tab(profile_name, selection):
+    profile = DASHBOARD_PROFILES[profile_name]
+    tables = compute_aggregates(profile_name, selection)['panels']
+    _sub_header(profile['cctv_header'])
+    _render_panels(profile['cctv_panels'], tables, _col(profile, 'region'))
+
+
+@st.fragment
+def render_crime_tab(profile_name, selection):
+    profile = DASHBOARD_PROFILES[profile_name]
+    offset = len(profile['cctv_panels'])
+    tables = {i - offset: table for i, table in compute_aggregates(profile_name, selection)['panels'].items()}
+    _sub_header(profile['crime_header'])
+    _render_panels(profile['crime_panels'], tables, _col(profile, 'region'))
+
+
+@st.fragment
+def render_correlation_tab(profile_name, selection):
+    profile = DASHBOARD_PROFILES[profile_name]
+    agg = compute_aggregates(profile_name, selection)
+    spec = profile['correlation']
+    region, quadrant = _col(profile, 'region'), _col(profile, 'quadrant')
+    population = _col(profile, 'population')
+    corr_matrix, q_matrix = agg['corr_matrix'], agg['q_matrix']
+    _sub_header('CCTV와 범죄 간 상관관계')
+
+    st.plotly_chart(correlation_heatmap(corr_matrix, spec['names'], spec['text_auto']), use_container_width=True)
+
+    def scatter(x, y, title, height):
+        fig = scatter_figure(
+            compute_scatter(profile_name, selection, x, y, (quadrant, population)),
+            x=x, y=y, color=quadrant, size=population, title=title, region=region,
+            labels=profile['labels'], trendline=True
+        )
+        fig.update_layout(height=height)
+        st.plotly_chart(fig, use_container_width=True)
+
+    if spec['pairs']:
+        st.markdown("#### CCTV vs 범죄 산점도")
+        for column, (x, y, title) in zip(st.columns(len(spec['pairs'])), spec['pairs']):
+            with column:
+                scatter(x, y, title, 400)
+
+    if spec['explorer']:
+        st.markdown("#### 개별 변수 간 상관관계")
+        col1, col2 = st.columns(2)
+        with col1:
+            x_var = st.selectbox("X축 변수 선택", options=spec['columns'], index=0)
+        with col2:
+            y_var = st.selectbox("Y축 변수 선택", options=spec['columns'], index=min(4, len(spec['columns']) - 1))
+
+        scatter(x_var, y_var, f'{x_var} vs {y_var}', 500)
+        st.info(f"상관계수: {corr_matrix.loc[x_var, y_var]:.4f} (FDR 보정 q-value: {q_matrix.loc[x_var, y_var]:.4f})")
+
+
+@st.fragment
+def render_table_tab(profile_name, selection):
+    profile = DASHBOARD_PROFILES[profile_name]
+    filtered = filter_data(profile_name, selection)
+    spec = profile['table']
+    region = _col(profile, 'region')
+    _sub_header('데이터 테이블')
+
+    columns = spec['columns']
+    if spec['selectable']:
+        columns = st.multiselect("표시할 컬럼 선택", options=filtered.columns.tolist(), default=columns)
+        if not columns:
+            st.warning("표시할 컬럼을 선택해주세요.")
+            return
+
+    display_df = filtered[columns].copy()
+    if spec['names']:
+        display_df.columns = spec['names']
+    sort_col = display_df.columns[columns.index(region)] if region in columns else display_df.columns[0]
+
+    st.dataframe(display_df.sort_values(sort_col), use_container_width=True, height=400)
+    st.download_button(
+        label="📥 CSV 다운로드",
+        data=display_df.to_csv(index=False, encoding='utf-8-sig'),
+        file_name=spec['file_name'],
+        mime='text/csv'
+    )
+
+
+TAB_RENDERERS = {
+    'overview': render_overview_tab,
+    'cctv': render_cctv_tab,
+    'crime': render_crime_tab,
+    'correlation': render_correlation_tab,
+    'table': render_table_tab
+}
+
+
+# ============================================================
+# 페이지
+# ============================================================
+def run_dashboard(default_profile='sample'):
+    """
+    프로필 기반 대시보드 실행 (스크립트 최상단에서 호출)
+
+    Args:
+        default_profile (str): DASHBOARD_PROFILES 키 (주소의 ?profile= 값이 우선)
+    """
+    profile_name = st.query_params.get('profile', default_profile)
+    if profile_name not in DASHBOARD_PROFILES:
+        profile_name = default_profile
+    profile = DASHBOARD_PROFILES[profile_name]
+
+    st.set_page_config(
+        page_title="서울시 CCTV-범죄 분석 대시보드",
+        page_icon="📹",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+    st.markdown(STYLE, unsafe_allow_html=True)
+
+    # 메인 헤더
+    st.markdown(f'<div class="main-header">📹 {profile["title"]}</div>', unsafe_allow_html=True)
+    if profile['subtitle']:
+        st.markdown(f'<p style="text-align: center; color: gray;">{profile["subtitle"]}</p>', unsafe_allow_html=True)
+    st.markdown("---")
+
+    df = load_data(profile_name)
+    if df is None:
+        st.error("데이터를 불러올 수 없습니다. 파일 경로를 확인해주세요.")
+        st.stop()
+
+    # 사이드바 - 필터 옵션 (비트맵 인덱스, 선택 순서와 무관하게 같은 캐시 키)
+    st.sidebar.header("🔍 필터 옵션")
+    filter_index = load_filter_index(profile_name)
+    selections = {}
+    for col in filter_index.columns:
+        selections[col] = st.sidebar.multiselect(
+            f"{col} 선택",
+            options=filter_index.values(col),
+            default=filter_index.values(col)
+        )
+    selection = tuple((col, tuple(sorted(values))) for col, values in selections.items())
+    agg = compute_aggregates(profile_name, selection)
+
+    # 주요 지표
+    _sub_header('📊 주요 지표')
+    for column, (label, value, fmt) in zip(st.columns(len(agg['headline'])), agg['headline']):
+        with column:
+            st.metric(label, fmt.format(value))
+    st.markdown("---")
+
+    # 탭 생성 (선택된 탭만 계산: 탭 전환 시 재실행)
+    names = [name for name in TABS if name != 'summary' or profile['summary']]
+    tabs = st.tabs([TABS[name] for name in names], key=f'main_tab_{profile_name}', on_change='rerun')
+    for name, tab in zip(names, tabs):
+        with tab:
+            if tab.open:
+                if name == 'summary':
+                    render_summary_tab()
+                else:
+                    TAB_RENDERERS[name](profile_name, selection)
+
+    # 사이드바 - 정보
+    st.sidebar.markdown("---")
+    st.sidebar.markdown("### 📊 프로젝트 정보")
+    st.sidebar.info(profile['about'])
+
+    st.sidebar.markdown("---")
+    st.sidebar.markdown("### ℹ️ 사용 방법")
+    st.sidebar.markdown("""
+1. 좌측 필터에서 자치구와 분면을 선택하세요
+2. 각 탭을 클릭하여 다양한 분석 결과를 확인하세요
+3. 그래프 위에 마우스를 올려 상세 정보를 확인하세요
+4. 데이터 테이블 탭에서 원본 데이터를 확인하고 다운로드할 수 있습니다
+""")
+
+    # 푸터
+    st.markdown("---")
+    st.markdown(f"""
+<div style='text-align: center; color: gray; padding: 1rem;'>
+    <p>서울시 CCTV와 범죄 발생 상관 분석 대시보드 | {profile['footer']}</p>
+    <p>Made with Streamlit 📊</p>
+</div>
+""", unsafe_allow_html=True)
@@ -0,0 +1,86 @@
+"""
+비트맵 필터 인덱스 (대시보드 사이드바 필터용)
+
+범주형 컬럼(자치구, 분면, 연도, 등급 등)마다 정수 코드로 바꾼 뒤 값별 비트맵(행당 1비트, uint64 워드)을
+미리 만들어 두고, 다중 선택은 선택 값 비트맵의 OR, 여러 필터는 컬럼 간 AND 로 계산합니다.
+문자열 컬럼을 다시 훑지 않으므로 100만 행에서도 1ms 이내로 행 마스크를 얻습니다.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def _pack(mask):
+    """bool (n,) -> uint64 비트맵 (행 i 는 워드 i // 64 의 i % 64 번째 비트)"""
+    packed = np.packbits(mask, bitorder='little')
+    packed = np.pad(packed, (0, -len(packed) % 8))
+    return packed.view('uint64')
+
+
+class FilterIndex:
+    """
+    범주형 컬럼 비트맵 인덱스
+
+    Args:
+        df (pd.DataFrame): 대상 데이터 (행 순서 고정)
+        columns (list): 인덱스할 범주형 컬럼 (없는 컬럼은 건너뜀)
+
+    Examples:
+        >>> index = FilterIndex(df, ['자치구', '분면', 'CCTV밀도_등급'])
+        >>> mask = index.mask({'자치구': ['강남구', '서초구'], '분면': index.values('분면')})
+        >>> df[mask]
+    """
+
+    def __init__(self, df, columns):
+        self.n_rows = len(df)
+        self.n_words = -(-self.n_rows // 64)
+        self._all = _pack(np.ones(self.n_rows, dtype=bool))
+        self._values = {}
+        self._bitmaps = {}
+        for col in columns:
+            if col not in df.columns:
+                continue
+            codes, uniques = pd.factorize(df[col], sort=True)
+            self._values[col] = {value: code for code, value in enumerate(uniques.tolist())}
+            self._bitmaps[col] = np.stack([_pack(codes == code) for code in range(len(uniques))]) \
+                if len(uniques) else np.zeros((0, self.n_words), dtype='uint64')
+
+    def __repr__(self):
+        sizes = ', '.join(f'{col}({len(values)})' for col, values in self._values.items())
+        return f"FilterIndex({self.n_rows:,}행: {sizes})"
+
+    @property
+    def columns(self):
+        return list(self._values)
+
+    def values(self, col):
+        """컬럼의 값 목록 (정렬 순)"""
+        return list(self._values[col])
+
+    def bitmap(self, selections):
+        """
+        선택 조합 -> uint64 비트맵
+
+        Args:
+            selections (dict): {컬럼: 선택 값 리스트} (인덱스에 없는 컬럼은 무시, 빈 선택은 0행)
+
+        Returns:
+            np.ndarray: (n_words,) uint64
+        """
+        result = self._all.copy()
+        for col, selected in selections.items():
+            if col not in self._values:
+                continue
+            lookup = self._values[col]
+            codes = sorted({lookup[value] for value in selected if value in lookup})
+            if len(codes) == len(lookup):
+                continue
+            if not codes:
+                return np.zeros(self.n_words, dtype='uint64')
+            np.bitwise_and(result, np.bitwise_or.reduce(self._bitmaps[col][codes], axis=0), out=result)
+        return result
+
+    def mask(self, selections):
+        """선택 조합 -> bool 행 마스크 (n_rows,)"""
+        words = self.bitmap(selections)
+        return np.unpackbits(words.view('uint8'), count=self.n_rows, bitorder='little').view(bool)
@@ -10,7 +10,7 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
-from .constants import PLOT_STYLE, COLOR_PALETTE, SEOUL_DISTRICTS, CCTV_RANGE, CRIME_RANGE, POPULATION_CONFIG, RANDOM_SEED
+from .constants import PLOT_STYLE, COLOR_PALETTE, SEOUL_DISTRICTS, CCTV_RANGE, CRIME_RANGE, POPULATION_CONFIG, RANDOM_SEED, QUADRANT_LABELS
 
 
 def set_korean_font():
@@ -108,7 +108,7 @@ def validate_data(df, expected_rows=25, required_columns=None):
 
     Args:
         df (pd.DataFrame): 검증할 데이터프레임
-        expected_rows (int): 예상 행 개수 (기본: 25개 자치구)
+        expected_rows (int, optional): 예상 행 개수 (기본: 25개 자치구, None 이면 확인 생략)
         required_columns (list, optional): 필수 컬럼 리스트
 
     Raises:
@@ -118,8 +118,9 @@ def validate_data(df, expected_rows=25, required_columns=None):
         bool: 검증 성공 여부
     """
     # 행 개수 확인
-    assert len(df) == expected_rows, \
-        f"[ERROR] 행 개수 불일치: {len(df)} != {expected_rows}"
+    if expected_rows is not None:
+        assert len(df) == expected_rows, \
+            f"[ERROR] 행 개수 불일치: {len(df)} != {expected_rows}"
 
     # 필수 컬럼 확인
     if required_columns:
@@ -393,6 +394,59 @@ def calculate_ratio_columns(df, numerator_cols, denominator_col, suffix='_비율
     return df
 
 
+def classify_quadrant(df, cctv_col, crime_col, by=None, labels=None):
+    """
+    중앙값 기준 4분면 분류 (벡터 연산)
+
+    CCTV 밀도와 범죄율이 각각 중앙값 이상인지로 Q1~Q4를 한 번에 판정한다.
+    중앙값 이상은 '고', 미만은 '저'로 보며, 두 값 중 하나라도 결측이면 결측으로 남긴다.
+
+    Args:
+        df (pd.DataFrame): 데이터프레임
+        cctv_col (str): CCTV 밀도 컬럼명 (예: '인구당_방범용')
+        crime_col (str): 범죄율 컬럼명 (예: '인구당_CCTV효과범죄율')
+        by (str or list, optional): 그룹 컬럼 (예: '연도', ['도시', '연도']).
+            지정하면 그룹별 중앙값을 기준으로 분류
+        labels (list, optional): Q1~Q4 순서의 라벨 4개 (기본: QUADRANT_LABELS)
+
+    Returns:
+        pd.Series: df와 같은 인덱스의 범주형(category) 분면 라벨
+
+    Examples:
+        >>> df['분면'] = classify_quadrant(df, '인구당_방범용', '인구당_CCTV효과범죄율')
+        >>> panel['분면'] = classify_quadrant(panel, '인구당_방범용', '인구당_CCTV효과범죄율', by='연도')
+    """
+    if labels is None:
+        labels = QUADRANT_LABELS
+    assert len(labels) == 4, f"[ERROR] 분면 라벨은 4개여야 합니다: {len(labels)}"
+
+    if by is None:
+        cctv_median = df[cctv_col].median()
+        crime_median = df[crime_col].median()
+    else:
+        grouped = df.groupby(by, sort=False)
+        cctv_median = grouped[cctv_col].transform('median').to_numpy(dtype=float)
+        crime_median = grouped[crime_col].transform('median').to_numpy(dtype=float)
+
+    cctv = df[cctv_col].to_numpy(dtype=float)
+    crime = df[crime_col].to_numpy(dtype=float)
+    high_cctv = cctv >= cctv_median
+    high_crime = crime >= crime_median
+
+    codes = np.select(
+        [high_cctv & high_crime, ~high_cctv & high_crime, ~high_cctv & ~high_crime],
+        [0, 1, 2],
+        default=3
+    )
+    codes[np.isnan(cctv) | np.isnan(crime) | np.isnan(cctv_median) | np.isnan(crime_median)] = -1
+
+    return pd.Series(
+        pd.Categorical.from_codes(codes, categories=list(labels)),
+        index=df.index,
+        name='분면'
+    )
+
+
 def plot_category_analysis(df, categories, category_name, colors=None,
                              save_path=None, figsize=(16, 6)):
     """
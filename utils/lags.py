@@ -0,0 +1,207 @@
+"""
+시차 분석 (시차 상관 + 그랜저 인과 검정)
+
+"범죄 증가 -> CCTV 설치" 역인과를 보기 위해, (지역, 연도) 패널의 두 변수
+(예: CCTV 순증 대수, 범죄 건수)에 대해
+- 시차 상관: 지역별 corr(x_t, y_(t+k)) - 모든 지역·시차를 (시차, 지역, 연도) 배열 하나로 계산
+- 그랜저 검정: y_t ~ y_(t-1..k) 에 x_(t-1..k) 를 더했을 때의 F 검정
+  지역별 회귀는 (지역, 연도, 변수) 설계 배열의 정규방정식을 한 번에 풀고,
+  '전체' 는 지역 고정효과(within 변환)를 둔 패널 회귀
+를 양방향(CCTV→범죄, 범죄→CCTV)으로 계산한 (방향, 지역, 시차) 결과표를 만들고,
+입력 내용 해시로 디스크에 캐시합니다 (대시보드는 캐시 파일만 읽음).
+"""
+
+import hashlib
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from .panel import Panel
+from .storage import save_table, load_table
+
+
+POOLED = '전체'
+
+
+def _shift(values, lags):
+    """(R, T) -> (L, R, T) : out[l, :, t] = values[:, t + lags[l]] (범위 밖은 NaN)"""
+    lags = np.asarray(lags)
+    width = int(np.abs(lags).max()) if len(lags) else 0
+    padded = np.pad(values, ((0, 0), (width, width)), constant_values=np.nan)
+    index = np.arange(values.shape[1])[None, :] + lags[:, None] + width
+    return padded[:, index].transpose(1, 0, 2)
+
+
+def _center(values, valid, n):
+    """유효값 기준 마지막 축 평균 제거 (무효값은 0)"""
+    mean = np.where(valid, values, 0.0).sum(axis=-1, keepdims=True) / np.maximum(n, 1)[..., None]
+    return np.where(valid, values - mean, 0.0)
+
+
+def _corr(da, db, axis):
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return (da * db).sum(axis=axis) / np.sqrt((da ** 2).sum(axis=axis) * (db ** 2).sum(axis=axis))
+
+
+def lagged_xcorr(x, y, max_lag=3):
+    """
+    지역별 시차 상관 corr(x_t, y_(t+k)), k = 0..max_lag
+
+    Args:
+        x, y (np.ndarray): (지역, 연도) 배열 (결측은 NaN)
+        max_lag (int): 최대 시차
+
+    Returns:
+        tuple: (상관 (L, R), 유효 관측수 (L, R), 지역 평균 제거 후 전체 상관 (L,))
+    """
+    lags = np.arange(max_lag + 1)
+    x_stack = np.broadcast_to(x, (len(lags),) + x.shape)
+    y_stack = _shift(y, lags)
+    valid = ~(np.isnan(x_stack) | np.isnan(y_stack))
+    n = valid.sum(axis=-1)
+
+    # 시차마다 겹치는 연도 안에서 지역 평균 제거 -> 지역별 상관, 전체(모든 지역 합산) 상관
+    dx, dy = _center(x_stack, valid, n), _center(y_stack, valid, n)
+    return _corr(dx, dy, axis=-1), n, _corr(dx, dy, axis=(1, 2))
+
+
+def _granger_design(x, y, order):
+    """(R, T) -> 목표 (R, m), 제약 설계 (R, m, order), 비제약 설계 (R, m, 2*order), 유효행 (R, m)"""
+    target = y[:, order:]
+    own = np.stack([y[:, order - k:y.shape[1] - k] for k in range(1, order + 1)], axis=-1)
+    other = np.stack([x[:, order - k:x.shape[1] - k] for k in range(1, order + 1)], axis=-1)
+    valid = ~(np.isnan(target) | np.isnan(own).any(axis=-1) | np.isnan(other).any(axis=-1))
+    return target, own, np.concatenate([own, other], axis=-1), valid
+
+
+def _batched_ssr(target, design, valid, intercept=True):
+    """지역별 OLS 잔차제곱합 (유효행만, 정규방정식 일괄 풀이)"""
+    if intercept:
+        design = np.concatenate([np.ones(design.shape[:2] + (1,)), design], axis=-1)
+    X = np.where(valid[..., None], np.nan_to_num(design), 0.0)
+    y = np.where(valid, np.nan_to_num(target), 0.0)
+    xtx = np.einsum('rmi,rmj->rij', X, X)
+    xty = np.einsum('rmi,rm->ri', X, y)
+    beta = np.einsum('rij,rj->ri', np.linalg.pinv(xtx), xty)
+    resid = np.where(valid, y - np.einsum('rmi,ri->rm', X, beta), 0.0)
+    return (resid ** 2).sum(axis=-1)
+
+
+def _demean_rows(values, valid):
+    """유효행 기준 지역(행) 평균 제거"""
+    values = np.where(valid if values.ndim == 2 else valid[..., None], values, np.nan)
+    with np.errstate(invalid='ignore'):
+        centered = values - np.nanmean(values, axis=1, keepdims=True)
+    return np.nan_to_num(centered)
+
+
+def granger_test(x, y, max_lag=3):
+    """
+    그랜저 인과 검정 (x -> y), 차수 k = 1..max_lag
+
+    Args:
+        x, y (np.ndarray): (지역, 연도) 배열
+
+    Returns:
+        tuple: (지역별 F (L, R), 지역별 p (L, R), 지역별 관측수 (L, R), 전체 F (L,), 전체 p (L,), 전체 관측수 (L,))
+    """
+    n_regions = x.shape[0]
+    shape = (max_lag, n_regions)
+    F, p, n = np.full(shape, np.nan), np.full(shape, np.nan), np.zeros(shape, dtype='int64')
+    pooled_F, pooled_p, pooled_n = np.full(max_lag, np.nan), np.full(max_lag, np.nan), np.zeros(max_lag, dtype='int64')
+
+    for i, order in enumerate(range(1, max_lag + 1)):
+        if x.shape[1] <= order + 1:
+            continue
+        target, restricted, full, valid = _granger_design(x, y, order)
+        n[i] = valid.sum(axis=1)
+
+        # 지역별
+        dof = n[i] - (2 * order + 1)
+        ssr_r = _batched_ssr(target, restricted, valid)
+        ssr_u = _batched_ssr(target, full, valid)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            F[i] = np.where(dof > 0, ((ssr_r - ssr_u) / order) / (ssr_u / dof), np.nan)
+        p[i] = stats.f.sf(F[i], order, np.maximum(dof, 1))
+
+        # 전체 (지역 고정효과)
+        pooled_n[i] = valid.sum()
+        dof = pooled_n[i] - 2 * order - int((n[i] > 0).sum())
+        flat = lambda a: a.reshape((1, -1) + a.shape[2:])
+        ssr_r = _batched_ssr(flat(_demean_rows(target, valid)), flat(_demean_rows(restricted, valid)), flat(valid), intercept=False)[0]
+        ssr_u = _batched_ssr(flat(_demean_rows(target, valid)), flat(_demean_rows(full, valid)), flat(valid), intercept=False)[0]
+        if dof > 0:
+            pooled_F[i] = ((ssr_r - ssr_u) / order) / (ssr_u / dof)
+            pooled_p[i] = stats.f.sf(pooled_F[i], order, dof)
+    return F, p, n, pooled_F, pooled_p, pooled_n
+
+
+def lag_cube(data, cctv_col, crime_col, max_lag=3, diff_cctv=True):
+    """
+    (방향, 지역, 시차) 시차 분석 결과표
+
+    Args:
+        data (Panel or pd.DataFrame): (지역, 연도) 패널
+        cctv_col (str): CCTV 컬럼 (예: '범죄예방_누적')
+        crime_col (str): 범죄 컬럼 (예: 'CCTV효과범죄')
+        max_lag (int): 최대 시차 (연)
+        diff_cctv (bool): True면 누적 대수 대신 전년 대비 순증 대수 사용
+
+    Returns:
+        pd.DataFrame: [방향, 지역, 시차, 상관계수, 상관_n, F, p_value, 그랜저_n]
+            - 방향 'CCTV→범죄': corr(CCTV_t, 범죄_(t+k)), 그랜저 CCTV -> 범죄
+            - 방향 '범죄→CCTV': corr(범죄_t, CCTV_(t+k)), 그랜저 범죄 -> CCTV
+            - 지역 '전체': 지역 고정효과를 둔 패널 결과
+    """
+    panel = data if isinstance(data, Panel) else Panel(data)
+    cctv = panel.wide(cctv_col).astype('float64')
+    if diff_cctv:
+        cctv = cctv.diff(axis=1)
+    crime = panel.wide(crime_col).astype('float64').reindex_like(cctv)
+    regions = list(cctv.index) + [POOLED]
+
+    frames = []
+    for direction, (x, y) in {'CCTV→범죄': (cctv, crime), '범죄→CCTV': (crime, cctv)}.items():
+        r, r_n, r_pooled = lagged_xcorr(x.to_numpy(), y.to_numpy(), max_lag)
+        F, p, g_n, F_pooled, p_pooled, g_n_pooled = granger_test(x.to_numpy(), y.to_numpy(), max_lag)
+        pad = lambda a, fill: np.vstack([np.full((1,) + a.shape[1:], fill, dtype=a.dtype), a])
+        column = lambda per_region, pooled: np.column_stack([per_region, pooled]).ravel()
+        frames.append(pd.DataFrame({
+            '방향': direction,
+            '지역': np.tile(regions, max_lag + 1),
+            '시차': np.repeat(np.arange(max_lag + 1), len(regions)),
+            '상관계수': column(r, r_pooled),
+            '상관_n': column(r_n, r_n.sum(axis=1)),
+            'F': column(pad(F, np.nan), np.r_[np.nan, F_pooled]),
+            'p_value': column(pad(p, np.nan), np.r_[np.nan, p_pooled]),
+            '그랜저_n': column(pad(g_n, 0), np.r_[0, g_n_pooled])
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def cached_lag_cube(data, cctv_col, crime_col, path, max_lag=3, diff_cctv=True):
+    """
+    lag_cube() 디스크 캐시 (입력 컬럼 내용 + 파라미터 해시가 같으면 저장된 결과 사용)
+
+    Args:
+        path (str): 캐시 경로 (Parquet, 예: 'data/processed/lag_cube.csv')
+
+    Returns:
+        pd.DataFrame: lag_cube() 결과 (+ 캐시키 컬럼)
+    """
+    panel = data if isinstance(data, Panel) else Panel(data)
+    digest = hashlib.sha256(f"{cctv_col}|{crime_col}|{max_lag}|{diff_cctv}".encode('utf-8'))
+    digest.update(pd.util.hash_pandas_object(panel.data[[cctv_col, crime_col]]).to_numpy().tobytes())
+    key = digest.hexdigest()[:16]
+
+    try:
+        cached = load_table(path)
+        if len(cached) and (cached['캐시키'] == key).all():
+            return cached
+    except (FileNotFoundError, KeyError):
+        pass
+
+    cube = lag_cube(panel, cctv_col, crime_col, max_lag, diff_cctv).assign(캐시키=key)
+    save_table(cube, path, export_csv=True)
+    return cube
@@ -0,0 +1,199 @@
+"""
+(자치구, 연도) 패널 데이터
+
+연도별 단면 데이터를 매번 자치구 기준으로 다시 병합하는 대신,
+(지역, 연도) 정렬 MultiIndex 하나에 모든 연도를 담아 두고
+- 인덱스 기반 조회 (지역·연도 단건, 연도별 단면, 지역별 시계열)
+- 전 연도 일괄 파생 변수 (인구당_*, *_per_1000)
+- 연도별 4분면 재분류, 전년 대비 변화량
+를 벡터 연산으로 처리합니다.
+"""
+
+import re
+import pandas as pd
+
+from .helpers import classify_quadrant
+from .storage import save_table, load_table
+from .regions import per_capita
+
+
+REGION_COL = '자치구'
+YEAR_COL = '연도'
+
+
+def melt_years(df, value_name, region_col=REGION_COL, year_col=YEAR_COL, skip_words=('이전',)):
+    """
+    연도가 컬럼으로 펼쳐진 표(예: '2015년', '2016년', ...)를 (지역, 연도, 값) 형태로 변환
+
+    '2016년 이전'처럼 skip_words 가 들어간 누적 컬럼은 제외한다.
+
+    Args:
+        df (pd.DataFrame): 지역 컬럼 + 연도 컬럼들
+        value_name (str): 값 컬럼명 (예: '범죄예방_누적')
+        region_col (str): 지역 컬럼명
+        year_col (str): 연도 컬럼명
+        skip_words (tuple): 제외할 컬럼명 포함 단어
+
+    Returns:
+        pd.DataFrame: [region_col, year_col, value_name]
+
+    Examples:
+        >>> yearly = load_sheet(path, SHEET_SPECS['cctv_prevention_yearly'])
+        >>> long = melt_years(yearly, '범죄예방_누적')
+    """
+    year_cols = {}
+    for col in df.columns:
+        match = re.match(r'\s*(\d{4})\s*년', str(col))
+        if match and not any(word in str(col) for word in skip_words):
+            year_cols[col] = int(match.group(1))
+
+    long = df.melt(id_vars=[region_col], value_vars=list(year_cols), var_name=year_col, value_name=value_name)
+    long[year_col] = long[year_col].map(year_cols).astype('int64')
+    return long
+
+
+class Panel:
+    """
+    (지역, 연도) 패널 데이터
+
+    Args:
+        data (pd.DataFrame): 지역·연도 컬럼을 가진 long 형태 데이터 (또는 같은 이름의 MultiIndex)
+        region_col (str): 지역 컬럼명 (기본: '자치구')
+        year_col (str): 연도 컬럼명 (기본: '연도')
+
+    Examples:
+        >>> panel = Panel.from_frames({2023: df_2023, 2024: df_2024})
+        >>> panel = panel.add_rates({'CCTV_per_1000': 'CCTV_총계'}, '총인구')
+        >>> panel.classify_quadrants('방범CCTV_per_1000', 'CCTV효과범죄_per_1000')
+        >>> panel.cross_section(2024)          # 2024년 단면
+        >>> panel.series('강남구', 'CCTV_per_1000')  # 강남구 시계열
+    """
+
+    def __init__(self, data, region_col=REGION_COL, year_col=YEAR_COL):
+        self.region_col = region_col
+        self.year_col = year_col
+
+        if list(data.index.names) != [region_col, year_col]:
+            data = data.set_index([region_col, year_col])
+        assert data.index.is_unique, f"[ERROR] ({region_col}, {year_col}) 중복 행이 있습니다"
+        self.data = data.sort_index()
+
+    @classmethod
+    def from_frames(cls, frames, region_col=REGION_COL, year_col=YEAR_COL):
+        """
+        연도별 단면 데이터로 패널 생성
+
+        Args:
+            frames (dict): {연도: 해당 연도 DataFrame (지역 컬럼 포함)}
+
+        Returns:
+            Panel
+        """
+        long = pd.concat(
+            [frame.assign(**{year_col: int(year)}) for year, frame in frames.items()],
+            ignore_index=True
+        )
+        return cls(long, region_col, year_col)
+
+    @classmethod
+    def load(cls, file_path, columns=None, region_col=REGION_COL, year_col=YEAR_COL):
+        """저장된 패널 로드 (Parquet 우선)"""
+        if columns is not None:
+            columns = [region_col, year_col] + [c for c in columns if c not in (region_col, year_col)]
+        return cls(load_table(file_path, columns=columns), region_col, year_col)
+
+    def save(self, file_path, export_csv=False):
+        """패널 저장 (long 형태, Parquet)"""
+        return save_table(self.to_frame(), file_path, export_csv=export_csv)
+
+    def _wrap(self, data):
+        return Panel(data, self.region_col, self.year_col)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __repr__(self):
+        return (f"Panel({self.data.index.get_level_values(0).nunique()}개 지역 x "
+                f"{len(self.years)}개 연도, {self.data.shape[1]}개 변수)")
+
+    @property
+    def years(self):
+        return sorted(self.data.index.get_level_values(self.year_col).unique())
+
+    @property
+    def regions(self):
+        return list(self.data.index.get_level_values(self.region_col).unique())
+
+    def to_frame(self):
+        """long 형태 DataFrame (지역, 연도 컬럼 포함)"""
+        return self.data.reset_index()
+
+    def join(self, other, how='outer'):
+        """
+        다른 패널/long 데이터와 (지역, 연도) 인덱스로 결합
+
+        Args:
+            other (Panel or pd.DataFrame): 결합할 데이터
+            how (str): 'outer' (기본) / 'inner' / 'left'
+
+        Returns:
+            Panel: 새 패널
+        """
+        if not isinstance(other, Panel):
+            other = Panel(other, self.region_col, self.year_col)
+        return self._wrap(self.data.join(other.data, how=how))
+
+    def get(self, region, year, column=None):
+        """(지역, 연도) 단건 조회"""
+        row = self.data.loc[(region, year)]
+        return row if column is None else row[column]
+
+    def cross_section(self, year):
+        """연도별 단면 (지역 인덱스)"""
+        return self.data.xs(year, level=self.year_col)
+
+    def series(self, region, column):
+        """지역별 시계열 (연도 인덱스)"""
+        return self.data.loc[region, column]
+
+    def wide(self, column):
+        """지역 x 연도 표 (추세 비교용)"""
+        return self.data[column].unstack(self.year_col)
+
+    def add_rates(self, numerators, denominator, scale=1000, decimals=None):
+        """
+        전 연도 일괄 비율 변수 추가 (예: 인구 천 명당)
+
+        Args:
+            numerators (dict): {새 컬럼명: 분자 컬럼명}
+            denominator (str): 분모 컬럼명 (예: '총인구')
+            scale (float): 배율 (기본: 1000)
+            decimals (int, optional): 반올림 자릿수
+
+        Returns:
+            Panel: self (체이닝용)
+        """
+        self.data = per_capita(self.data, numerators, denominator, scale, decimals)
+        return self
+
+    def add_change(self, column, periods=1, pct=False, name=None):
+        """
+        지역별 전년 대비 변화량(또는 변화율) 추가
+
+        Returns:
+            Panel: self (체이닝용)
+        """
+        grouped = self.data.groupby(level=self.region_col)[column]
+        change = grouped.pct_change(periods) if pct else grouped.diff(periods)
+        self.data[name or f'{column}_{"증감률" if pct else "증감"}'] = change
+        return self
+
+    def classify_quadrants(self, cctv_col, crime_col, name='분면', labels=None):
+        """
+        연도별 중앙값 기준 4분면 재분류
+
+        Returns:
+            Panel: self (체이닝용)
+        """
+        self.data[name] = classify_quadrant(self.data, cctv_col, crime_col, by=self.year_col, labels=labels)
+        return self
@@ -0,0 +1,208 @@
+"""
+증분 파이프라인 실행기
+
+분석 단계(Day 2~12)를 입력/출력이 선언된 Task 로 정의하고,
+입력 파일 내용 해시 + 파라미터 + 단계 코드 + utils 패키지 소스로 만든 지문(fingerprint)이
+지난 실행과 같으면 해당 단계를 건너뜁니다 (utils 헬퍼를 고치면 모든 단계가 다시 실행됨).
+- 상태는 JSON 파일 하나에 저장 (기본: logs/pipeline_state.json)
+- 파일 해시는 (수정시각, 크기)가 같으면 재계산하지 않음
+"""
+
+import os
+import json
+import time
+import hashlib
+import inspect
+
+# 단계들이 실제 계산을 맡기는 utils 패키지 디렉터리 (지문에 소스 포함)
+LIBRARY_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _hash_bytes_of(func):
+    """단계 함수의 소스(없으면 바이트코드)를 해시용 바이트로 반환"""
+    try:
+        return inspect.getsource(func).encode('utf-8')
+    except (OSError, TypeError):
+        return func.__code__.co_code
+
+
+class Task:
+    """
+    파이프라인 단계 정의
+
+    Args:
+        name (str): 단계 이름 (예: 'day2')
+        func (callable): 실행 함수, params 를 키워드 인자로 받음
+        inputs (list, optional): 입력 파일 경로 리스트
+        outputs (list, optional): 출력 파일 경로 리스트
+        params (dict, optional): 실행 파라미터 (예: {'effect_crimes': CCTV_EFFECT_CRIMES})
+        description (str): 설명 (출력용)
+    """
+
+    def __init__(self, name, func, inputs=None, outputs=None, params=None, description=''):
+        self.name = name
+        self.func = func
+        self.inputs = list(inputs or [])
+        self.outputs = list(outputs or [])
+        self.params = dict(params or {})
+        self.description = description
+
+    def run(self):
+        return self.func(**self.params)
+
+
+class Pipeline:
+    """
+    선언된 Task 들을 순서대로 실행하는 증분 파이프라인
+
+    Task 는 선언 순서대로 실행되며, 앞 단계의 출력이 뒤 단계의 입력이 된다.
+    입력 내용이 같으면 상류 단계가 다시 실행되어도 하류 단계는 건너뛴다.
+
+    Args:
+        tasks (list): Task 리스트 (실행 순서)
+        state_path (str): 지문 상태 JSON 경로
+        library_dir (str): 지문에 소스를 포함할 패키지 디렉터리 (기본: utils)
+
+    Examples:
+        >>> pipeline = Pipeline([Task('day2', clean, inputs=[...], outputs=[...])],
+        ...                     os.path.join(DATA_PATHS['logs'], 'pipeline_state.json'))
+        >>> pipeline.run()                 # 변경된 단계만 실행
+        >>> pipeline.run(only=['day9'])    # day9만 강제 실행
+        >>> pipeline.run(start='day9')     # day9부터 끝까지 강제 실행
+    """
+
+    def __init__(self, tasks, state_path, library_dir=LIBRARY_DIR):
+        names = [task.name for task in tasks]
+        assert len(names) == len(set(names)), f"[ERROR] 중복된 단계 이름: {names}"
+        self.tasks = tasks
+        self.state_path = state_path
+        self.library_dir = library_dir
+        self.state = self._load_state()
+        self._library_hash = None
+
+    def _load_state(self):
+        if os.path.exists(self.state_path):
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return {'tasks': {}, 'files': {}}
+
+    def _save_state(self):
+        os.makedirs(os.path.dirname(self.state_path) or '.', exist_ok=True)
+        with open(self.state_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=2)
+
+    def file_hash(self, path):
+        """
+        파일 내용 SHA-256 (수정시각·크기가 같으면 저장된 값 재사용)
+
+        Returns:
+            str: 16진수 해시, 파일이 없으면 'missing'
+        """
+        if not os.path.exists(path):
+            return 'missing'
+
+        stat = os.stat(path)
+        key = os.path.abspath(path)
+        cached = self.state['files'].get(key)
+        if cached and cached['mtime_ns'] == stat.st_mtime_ns and cached['size'] == stat.st_size:
+            return cached['sha256']
+
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        sha = digest.hexdigest()
+        self.state['files'][key] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': sha}
+        return sha
+
+    def library_hash(self):
+        """library_dir 의 .py 소스 전체 해시 (실행 한 번에 한 번만 계산)"""
+        if self._library_hash is None:
+            digest = hashlib.sha256()
+            for name in sorted(os.listdir(self.library_dir)):
+                if name.endswith('.py'):
+                    digest.update(name.encode('utf-8'))
+                    digest.update(self.file_hash(os.path.join(self.library_dir, name)).encode('utf-8'))
+            self._library_hash = digest.hexdigest()
+        return self._library_hash
+
+    def fingerprint(self, task):
+        """입력 파일 해시 + 파라미터 + 단계 코드 + utils 소스로 만든 지문"""
+        digest = hashlib.sha256()
+        digest.update(task.name.encode('utf-8'))
+        for path in task.inputs:
+            digest.update(path.encode('utf-8'))
+            digest.update(self.file_hash(path).encode('utf-8'))
+        digest.update(json.dumps(task.params, sort_keys=True, ensure_ascii=False, default=str).encode('utf-8'))
+        digest.update(_hash_bytes_of(task.func))
+        digest.update(self.library_hash().encode('utf-8'))
+        return digest.hexdigest()
+
+    def is_up_to_date(self, task):
+        """지문이 지난 실행과 같고 모든 출력 파일이 존재하면 True"""
+        stored = self.state['tasks'].get(task.name, {})
+        outputs_exist = all(os.path.exists(path) for path in task.outputs)
+        return outputs_exist and stored.get('fingerprint') == self.fingerprint(task)
+
+    def select(self, only=None, start=None):
+        """
+        실행 대상 단계 선택
+
+        Args:
+            only (list, optional): 이 단계들만
+            start (str, optional): 이 단계부터 끝까지
+
+        Returns:
+            list: 선택된 Task 리스트
+        """
+        names = [task.name for task in self.tasks]
+        for name in list(only or []) + ([start] if start else []):
+            assert name in names, f"[ERROR] 알 수 없는 단계: {name} (가능: {', '.join(names)})"
+
+        if only:
+            return [task for task in self.tasks if task.name in only]
+        if start:
+            return self.tasks[names.index(start):]
+        return list(self.tasks)
+
+    def run(self, only=None, start=None, force=False):
+        """
+        파이프라인 실행
+
+        only/start 로 직접 고른 단계는 변경 여부와 관계없이 실행하고,
+        아무것도 고르지 않으면 지문이 바뀐 단계만 실행한다.
+
+        Args:
+            only (list, optional): 이 단계들만 실행
+            start (str, optional): 이 단계부터 끝까지 실행
+            force (bool): True면 지문 비교 없이 전부 실행
+
+        Returns:
+            dict: {단계 이름: 'ran' | 'skipped'}
+        """
+        selected = self.select(only, start)
+        force = force or bool(only) or bool(start)
+        results = {}
+
+        for task in selected:
+            if not force and self.is_up_to_date(task):
+                print(f"[SKIP] {task.name}: 변경 없음")
+                results[task.name] = 'skipped'
+                continue
+
+            fingerprint = self.fingerprint(task)
+            started = time.perf_counter()
+            task.run()
+            elapsed = time.perf_counter() - started
+
+            self.state['tasks'][task.name] = {
+                'fingerprint': fingerprint,
+                'elapsed_sec': round(elapsed, 3),
+                'finished_at': time.strftime('%Y-%m-%d %H:%M:%S')
+            }
+            self._save_state()
+            print(f"[OK] {task.name} 완료 ({elapsed:.2f}s)")
+            results[task.name] = 'ran'
+
+        self._save_state()
+        return results
@@ -0,0 +1,189 @@
+"""
+CCTV 신규 설치 위치 최적화 (최대 커버리지, lazy greedy)
+
+후보 지점 중 k 곳(또는 예산 안에서)을 골라, 아직 감시 반경 밖에 있는
+범죄 발생 지점의 가중 합을 최대화합니다. 커버 함수가 submodular 이므로
+비용이 같으면 탐욕 선택이 (1 - 1/e) 근사를, 비용이 다르면 이득/비용 탐욕 결과와
+최고 단일 지점 중 나은 쪽이 (1 - 1/e) / 2 근사를 보장하며,
+- 후보 x 사건 커버 관계는 KD-tree 로 한 번에 희소 행렬(CSR/CSC)로 구성
+- 선택 시 새로 커버된 사건의 열만 따라가 후보별 이득을 증분 갱신
+- 힙에서 꺼낸 후보의 이득이 바뀌었으면 다시 넣는 lazy 평가
+로 10만 개 후보까지 처리합니다.
+"""
+
+import heapq
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+
+from .constants import CCTV_UNIT_COST
+from .points import PointSet, to_latlon
+
+
+def grid_candidates(incidents, mask=None, cell_size=25, region_col=None):
+    """
+    후보 지점 생성: 커버되지 않은 사건이 있는 격자 셀의 사건 평균 위치
+
+    Args:
+        incidents (PointSet): 범죄 발생 지점
+        mask (np.ndarray, optional): 후보로 쓸 사건 (예: ~engine.covered(incidents))
+        cell_size (float): 격자 크기 (m)
+        region_col (str, optional): 후보에 붙일 지역 컬럼 (셀의 첫 사건 기준)
+
+    Returns:
+        PointSet: 후보 지점 (속성: 사건수, region_col)
+    """
+    idx = np.arange(len(incidents)) if mask is None else np.flatnonzero(mask)
+    xy = incidents.xy[idx]
+    cells = np.floor(xy / cell_size).astype('int64')
+    _, first, inverse, counts = np.unique(cells, axis=0, return_index=True, return_inverse=True, return_counts=True)
+    inverse = inverse.ravel()
+
+    centers = np.column_stack([np.bincount(inverse, weights=xy[:, i]) for i in range(2)]) / counts[:, None]
+    lat, lon = to_latlon(centers)
+    attrs = pd.DataFrame({'사건수': counts})
+    if region_col is not None:
+        attrs[region_col] = incidents.attrs[region_col].to_numpy()[idx[first]]
+    return PointSet(lat, lon, attrs)
+
+
+class PlacementOptimizer:
+    """
+    CCTV 설치 위치 최적화 (가중 최대 커버리지)
+
+    Args:
+        candidates (PointSet): 설치 후보 지점
+        incidents (PointSet): 범죄 발생 지점
+        radius (float): 신규 카메라 감시 반경 (m, 기본: 방범용 50m)
+        weights (str or dict or array-like, optional): 사건 가중치
+            - 컬럼명: 해당 숫자 컬럼 사용
+            - dict: {범죄유형: 가중치} (weight_col 값 기준, 없는 유형은 1)
+            - 배열: 사건별 가중치
+        weight_col (str): weights 가 dict 일 때 기준 컬럼 (기본: '범죄유형')
+        covered (np.ndarray, optional): 이미 기존 카메라로 커버된 사건 (가중치 0 처리)
+        cost (float or array-like): 후보별 설치 비용 (백만원, 기본: CCTV_UNIT_COST)
+
+    Examples:
+        >>> engine = CoverageEngine(cctv_points)
+        >>> optimizer = PlacementOptimizer(candidates, incidents, covered=engine.covered(incidents),
+        ...                                weights={'강도': 3, '절도': 1})
+        >>> sites = optimizer.solve(budget=1500)        # 15억원 안에서 설치 위치 선정
+    """
+
+    def __init__(self, candidates, incidents, radius=50, weights=None, weight_col='범죄유형',
+                 covered=None, cost=CCTV_UNIT_COST):
+        self.candidates = candidates
+        self.radius = radius
+        self.weights = self._incident_weights(incidents, weights, weight_col)
+        if covered is not None:
+            self.weights[np.asarray(covered, dtype=bool)] = 0.0
+        self.cost = np.broadcast_to(np.asarray(cost, dtype='float64'), (len(candidates),))
+
+        # 후보 x 사건 커버 행렬 (반경 안이면 1)
+        pairs = cKDTree(candidates.xy).sparse_distance_matrix(
+            cKDTree(incidents.xy), radius, output_type='coo_matrix')
+        self.matrix = pairs.tocsr()
+        self.matrix.data[:] = 1.0
+        self.by_incident = self.matrix.tocsc()
+
+    @staticmethod
+    def _incident_weights(incidents, weights, weight_col):
+        if weights is None:
+            return np.ones(len(incidents))
+        if isinstance(weights, str):
+            return incidents.attrs[weights].to_numpy('float64').copy()
+        if isinstance(weights, dict):
+            types = incidents.attrs[weight_col].astype(object)
+            return types.map(weights).fillna(1.0).to_numpy('float64', copy=True)
+        return np.asarray(weights, dtype='float64').copy()
+
+    def __repr__(self):
+        return (f"PlacementOptimizer(후보 {self.matrix.shape[0]:,}개 x 사건 {self.matrix.shape[1]:,}건, "
+                f"커버 쌍 {self.matrix.nnz:,}개, 반경 {self.radius:g}m)")
+
+    def solve(self, k=None, budget=None, min_gain=0.0):
+        """
+        lazy greedy 선택
+
+        비용이 모두 같으면 이득 기준, 다르면 이득/비용 기준으로 고른다.
+        k, budget 중 먼저 닿는 조건에서 멈추며, 남은 이득이 min_gain 이하여도 멈춘다.
+        비용이 다르면 예산 안의 최고 단일 지점이 탐욕 결과보다 많이 커버할 때 그 지점 하나를 반환한다.
+
+        Args:
+            k (int, optional): 최대 설치 수
+            budget (float, optional): 예산 (백만원)
+            min_gain (float): 최소 추가 커버 가중치
+
+        Returns:
+            pd.DataFrame: 선택 순서대로 [순위, 위도, 경도, 추가커버, 누적커버, 비용, 누적비용] + 후보 속성
+        """
+        assert k is not None or budget is not None, "[ERROR] k 또는 budget 을 지정하세요"
+        k = len(self.candidates) if k is None else k
+        budget = np.inf if budget is None else budget
+
+        remaining = self.weights.copy()
+        gains = self.matrix @ remaining
+        initial_gains = gains.copy()
+        uniform = np.all(self.cost == self.cost[0])
+        score = (lambda c: gains[c]) if uniform else (lambda c: gains[c] / self.cost[c])
+
+        heap = [(-score(c), c) for c in np.flatnonzero(gains > min_gain)]
+        heapq.heapify(heap)
+
+        matrix, by_incident = self.matrix, self.by_incident
+        chosen, chosen_gain = [], []
+        spent = 0.0
+
+        while heap and len(chosen) < k:
+            neg_score, c = heapq.heappop(heap)
+            if gains[c] <= min_gain:
+                continue
+            # 꺼낸 뒤 이득이 줄었으면 현재 값으로 다시 넣기 (lazy 평가)
+            if -neg_score > score(c) + 1e-12:
+                heapq.heappush(heap, (-score(c), c))
+                continue
+            if spent + self.cost[c] > budget:
+                continue
+
+            chosen.append(c)
+            chosen_gain.append(gains[c])
+            spent += self.cost[c]
+
+            # 새로 커버된 사건의 열만 골라 그 사건을 커버하던 후보들의 이득 차감
+            row = matrix.indices[matrix.indptr[c]:matrix.indptr[c + 1]]
+            newly = row[remaining[row] > 0]
+            gains -= by_incident[:, newly] @ remaining[newly]
+            remaining[newly] = 0.0
+
+        # 이득/비용 탐욕은 단독으로는 근사 보장이 없으므로 최고 단일 지점과 비교
+        if not uniform and k >= 1:
+            feasible = np.flatnonzero((self.cost <= budget) & (initial_gains > min_gain))
+            if len(feasible):
+                best = feasible[np.argmax(initial_gains[feasible])]
+                if initial_gains[best] > sum(chosen_gain):
+                    chosen, chosen_gain = [best], [initial_gains[best]]
+
+        chosen = np.asarray(chosen, dtype='int64')
+        sites = pd.DataFrame({
+            '순위': np.arange(1, len(chosen) + 1),
+            '위도': self.candidates.lat[chosen],
+            '경도': self.candidates.lon[chosen],
+            '추가커버': chosen_gain,
+            '비용': self.cost[chosen]
+        })
+        sites['누적커버'] = sites['추가커버'].cumsum()
+        sites['누적비용'] = sites['비용'].cumsum()
+        return pd.concat([sites, self.candidates.attrs.iloc[chosen].reset_index(drop=True)], axis=1)
+
+
+def summarize_sites(sites, region_col='자치구'):
+    """
+    선택 지점을 지역별로 요약 (신규설치 대수, 추가커버, 필요예산)
+
+    Returns:
+        pd.DataFrame: [region_col, 신규설치, 추가커버, 필요예산]
+    """
+    return (sites.groupby(region_col, observed=True)
+            .agg(신규설치=('순위', 'size'), 추가커버=('추가커버', 'sum'), 필요예산=('비용', 'sum'))
+            .reset_index())
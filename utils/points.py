@@ -0,0 +1,441 @@
+"""
+좌표(점) 데이터: CCTV 설치 지점 / 범죄 발생 지점
+
+수만 개의 카메라 좌표, 수백만 건의 지오코딩된 사건을
+- numpy 배열(좌표) + 범주형 컬럼(속성)으로 압축 저장하고
+- KD-tree 공간 인덱스(scipy cKDTree)로 반경 조회
+- 지역 레이어(속성 컬럼 / 격자 / 경계 폴리곤 / 최근접 중심점)에 필요할 때 집계
+합니다. 점 단위 파이썬 반복 없이 bincount 등 벡터 연산으로 처리합니다.
+
+지역 레이어:
+    '자치구' 같은 문자열     점 데이터의 속성 컬럼을 그대로 사용
+    GridLayer(250)          좌표를 250m 격자로 나눔 (격자ID)
+    PolygonLayer            경계 폴리곤(GeoJSON) 안에 포함되는 점
+    CentroidLayer           가장 가까운 지역 중심점 (경계가 없을 때 근사)
+"""
+
+import json
+import itertools
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+from matplotlib.path import Path
+from scipy.spatial import cKDTree
+
+from .constants import SEOUL_BOUNDS, REGION_LEVELS
+from .storage import save_table, load_table
+
+
+# 좌표 -> 미터 변환 기준점 (서울시청)
+ORIGIN = (37.5665, 126.9780)
+
+# 위도 1도 거리 (m)
+METERS_PER_DEG_LAT = 110_940.0
+
+
+def to_meters(lat, lon, origin=ORIGIN):
+    """
+    위경도를 기준점 중심 평면 좌표(m)로 변환 (등장방형 근사, 서울 범위 오차 0.1% 이내)
+
+    Args:
+        lat (array-like): 위도
+        lon (array-like): 경도
+        origin (tuple): 기준점 (위도, 경도)
+
+    Returns:
+        np.ndarray: (n, 2) [x(동쪽), y(북쪽)] 미터 좌표
+    """
+    lat = np.asarray(lat, dtype='float64')
+    lon = np.asarray(lon, dtype='float64')
+    meters_per_deg_lon = METERS_PER_DEG_LAT * np.cos(np.radians(origin[0]))
+    return np.column_stack([(lon - origin[1]) * meters_per_deg_lon, (lat - origin[0]) * METERS_PER_DEG_LAT])
+
+
+def to_latlon(xy, origin=ORIGIN):
+    """
+    평면 좌표(m)를 위경도로 변환 (to_meters 의 역변환)
+
+    Args:
+        xy (np.ndarray): (n, 2) [x, y] 미터 좌표
+
+    Returns:
+        tuple: (위도 배열, 경도 배열)
+    """
+    xy = np.asarray(xy, dtype='float64')
+    meters_per_deg_lon = METERS_PER_DEG_LAT * np.cos(np.radians(origin[0]))
+    return origin[0] + xy[:, 1] / METERS_PER_DEG_LAT, origin[1] + xy[:, 0] / meters_per_deg_lon
+
+
+class PointSet:
+    """
+    좌표 데이터 (배열 기반)
+
+    Args:
+        lat, lon (array-like): 위도, 경도
+        attrs (pd.DataFrame, optional): 점별 속성 (문자열 컬럼은 범주형으로 변환)
+
+    Examples:
+        >>> cctv = load_points('data/raw/cctv_points.csv', POINT_SPECS['cctv'])
+        >>> cctv.aggregate('자치구', by='설치목적', weight='카메라대수', total_col='CCTV_총계')
+        >>> cctv.aggregate(GridLayer(250))                 # 250m 격자별 설치 지점 수
+        >>> cctv.within(37.4979, 127.0276, radius=100)     # 강남역 반경 100m 안의 카메라
+    """
+
+    def __init__(self, lat, lon, attrs=None):
+        self.lat = np.asarray(lat, dtype='float64')
+        self.lon = np.asarray(lon, dtype='float64')
+        attrs = pd.DataFrame(index=pd.RangeIndex(len(self.lat))) if attrs is None else attrs.reset_index(drop=True)
+        for col in attrs.columns[attrs.dtypes == object]:
+            attrs[col] = attrs[col].astype('category')
+        self.attrs = attrs
+
+    @classmethod
+    def from_frame(cls, df, lat_col='위도', lon_col='경도', bounds=SEOUL_BOUNDS):
+        """
+        DataFrame 에서 생성 (좌표 결측 / 범위 밖 행 제외)
+
+        Args:
+            df (pd.DataFrame): 좌표 + 속성 컬럼
+            lat_col, lon_col (str): 위도/경도 컬럼명
+            bounds (dict, optional): {'lat': (최소, 최대), 'lon': (최소, 최대)}, None 이면 범위 확인 생략
+
+        Returns:
+            PointSet
+        """
+        lat = pd.to_numeric(df[lat_col], errors='coerce').to_numpy('float64')
+        lon = pd.to_numeric(df[lon_col], errors='coerce').to_numpy('float64')
+        keep = ~(np.isnan(lat) | np.isnan(lon))
+        if bounds is not None:
+            keep &= (lat >= bounds['lat'][0]) & (lat <= bounds['lat'][1])
+            keep &= (lon >= bounds['lon'][0]) & (lon <= bounds['lon'][1])
+
+        dropped = int((~keep).sum())
+        if dropped:
+            print(f"[WARNING] 좌표 결측/범위 밖 {dropped:,}개 제외 (전체 {len(df):,}개)")
+
+        attrs = df.drop(columns=[lat_col, lon_col])[keep]
+        return cls(lat[keep], lon[keep], attrs)
+
+    @classmethod
+    def load(cls, file_path, columns=None):
+        """저장된 좌표 데이터 로드 (Parquet 우선)"""
+        if columns is not None:
+            columns = ['위도', '경도'] + list(columns)
+        return cls.from_frame(load_table(file_path, columns=columns), bounds=None)
+
+    def save(self, file_path, export_csv=False):
+        """좌표 데이터 저장 (Parquet, 범주형 유지)"""
+        return save_table(self.to_frame(), file_path, export_csv=export_csv)
+
+    def to_frame(self):
+        """위도, 경도 + 속성 DataFrame"""
+        return pd.concat([pd.DataFrame({'위도': self.lat, '경도': self.lon}), self.attrs], axis=1)
+
+    def __len__(self):
+        return len(self.lat)
+
+    def __repr__(self):
+        return f"PointSet({len(self):,}개 지점, 속성: {list(self.attrs.columns)})"
+
+    @cached_property
+    def xy(self):
+        """평면 좌표 (m), (n, 2)"""
+        return to_meters(self.lat, self.lon)
+
+    @cached_property
+    def tree(self):
+        """KD-tree 공간 인덱스 (처음 사용할 때 한 번 생성)"""
+        return cKDTree(self.xy)
+
+    def within(self, lat, lon, radius):
+        """
+        지점 반경(m) 안의 점 위치(인덱스) 조회
+
+        Args:
+            lat, lon (float or array-like): 조회 지점 (여러 개면 지점별 인덱스 리스트)
+            radius (float): 반경 (m)
+
+        Returns:
+            np.ndarray or list: 점 인덱스
+        """
+        centers = to_meters(np.atleast_1d(lat), np.atleast_1d(lon))
+        found = self.tree.query_ball_point(centers, r=radius, return_sorted=True)
+        return np.asarray(found[0], dtype='int64') if np.ndim(lat) == 0 else [np.asarray(f, dtype='int64') for f in found]
+
+    def count_within(self, lat, lon, radius, weight=None):
+        """
+        지점별 반경(m) 안의 점 개수 (weight 지정 시 가중 합)
+
+        Returns:
+            np.ndarray: 지점별 개수
+        """
+        centers = to_meters(np.atleast_1d(lat), np.atleast_1d(lon))
+        if weight is None:
+            return self.tree.query_ball_point(centers, r=radius, return_length=True).astype('int64')
+        found = self.tree.query_ball_point(centers, r=radius)
+        lengths = np.fromiter((len(f) for f in found), dtype='int64', count=len(found))
+        indices = np.fromiter(itertools.chain.from_iterable(found), dtype='int64', count=lengths.sum())
+        values = self.attrs[weight].to_numpy('float64')[indices]
+        return np.bincount(np.repeat(np.arange(len(found)), lengths), weights=values, minlength=len(found))
+
+    def assign(self, layer):
+        """
+        점별 소속 지역 (레이어 밖의 점은 결측)
+
+        Args:
+            layer (str or GridLayer/PolygonLayer/CentroidLayer): 지역 레이어
+
+        Returns:
+            pd.Categorical: 점별 지역
+        """
+        if isinstance(layer, str):
+            assert layer in self.attrs, f"[ERROR] 지역 컬럼 없음: {layer} (경계/격자 레이어를 지정하세요)"
+            return pd.Categorical(self.attrs[layer])
+        return layer.assign(self)
+
+    def aggregate(self, layer, by=None, weight=None, total_col=None, column_format='{}', categories=None):
+        """
+        지역 레이어별 점 개수(또는 가중 합) 집계
+
+        Args:
+            layer (str or layer): 지역 레이어 (assign() 참고)
+            by (str, optional): 분류 컬럼 (예: '설치목적', '범죄유형') - 분류별 컬럼 생성
+            weight (str, optional): 가중치 컬럼 (예: '카메라대수')
+            total_col (str, optional): 합계 컬럼명 (기본: '건수')
+            column_format (str): 분류별 컬럼명 형식 (예: '{}_발생')
+            categories (dict, optional): 원본 분류값 -> 분석 컬럼명 (데이터에 없는 컬럼도 0 으로 생성)
+
+        Returns:
+            pd.DataFrame: 지역 컬럼 + 합계 + 분류별 컬럼 (지역 1행)
+
+        Examples:
+            >>> incidents.aggregate('자치구', by='범죄유형', total_col='총범죄_발생', column_format='{}_발생')
+        """
+        regions = self.assign(layer)
+        region_name = layer if isinstance(layer, str) else layer.name
+        codes = regions.codes.astype('int64')
+        valid = codes >= 0
+        weights = self.attrs[weight].to_numpy('float64') if weight else None
+        n_regions = len(regions.categories)
+
+        outside = int((~valid).sum())
+        if outside:
+            print(f"[WARNING] {region_name} 레이어 밖의 점 {outside:,}개 제외")
+
+        total = np.bincount(codes[valid], weights=None if weights is None else weights[valid], minlength=n_regions)
+        table = pd.DataFrame({total_col or '건수': total}, index=pd.Index(regions.categories, name=region_name))
+
+        if by is not None:
+            names, by_codes = _remap_categories(pd.Categorical(self.attrs[by]), categories or {})
+            # 데이터에 없는 분류도 0 으로 채운 컬럼 생성 (코드는 그대로, 뒤에 추가)
+            names += [name for name in dict.fromkeys((categories or {}).values()) if name not in names]
+            both = valid & (by_codes >= 0)
+            flat = codes[both] * len(names) + by_codes[both]
+            counts = np.bincount(flat, weights=None if weights is None else weights[both],
+                                 minlength=n_regions * len(names)).reshape(n_regions, len(names))
+            by_table = pd.DataFrame(counts, index=table.index, columns=[column_format.format(name) for name in names])
+            table = table.join(by_table)
+
+        return table.reset_index()
+
+
+def _remap_categories(values, mapping):
+    """범주 이름 변경/병합 (여러 원본값 -> 한 컬럼), 코드 배열로만 처리"""
+    renamed = [mapping.get(category, category) for category in values.categories]
+    names = list(pd.unique(pd.Series(renamed, dtype=object)))
+    code_map = np.array([names.index(name) for name in renamed], dtype='int64')
+    codes = np.where(values.codes >= 0, code_map[np.maximum(values.codes, 0)], -1).astype('int64')
+    return names, codes
+
+
+# 격자 (열, 행) 번호를 정수 하나로 합칠 때의 행 자릿수 (음수 행은 절반만큼 이동)
+_GRID_STRIDE = 1_000_000
+
+
+class GridLayer:
+    """
+    정사각형 격자 레이어
+
+    Args:
+        cell_size (float): 격자 한 변 (m, 기본: 250)
+        name (str): 지역 컬럼명 (기본: REGION_LEVELS['격자250m'] 키)
+    """
+
+    def __init__(self, cell_size=250, name=REGION_LEVELS['격자250m']['key']):
+        self.cell_size = cell_size
+        self.name = name
+
+    def cell_index(self, xy):
+        """평면 좌표 -> (열, 행) 격자 번호"""
+        return np.floor(xy / self.cell_size).astype('int64')
+
+    def assign(self, points):
+        cells = self.cell_index(points.xy)
+        flat = cells[:, 0] * _GRID_STRIDE + (cells[:, 1] + _GRID_STRIDE // 2)
+        uniques, codes = np.unique(flat, return_inverse=True)
+        cols = pd.Series(uniques // _GRID_STRIDE).astype(str)
+        rows = pd.Series(uniques % _GRID_STRIDE - _GRID_STRIDE // 2).astype(str)
+        return pd.Categorical.from_codes(codes.ravel(), (cols + '_' + rows).tolist())
+
+    def centers(self, labels):
+        """격자ID -> 격자 중심 평면 좌표 (m)"""
+        parts = pd.Series(labels).str.split('_', expand=True).astype('int64').to_numpy()
+        return (parts + 0.5) * self.cell_size
+
+    def complete(self, table):
+        """
+        집계 표를 점이 있는 격자의 경계 사각형 전체로 확장 (점이 없는 격자는 0)
+
+        Args:
+            table (pd.DataFrame): aggregate() 결과 (self.name 격자ID 컬럼 + 수치 컬럼)
+
+        Returns:
+            pd.DataFrame: 전체 격자 표 (열, 행 순)
+        """
+        parts = table[self.name].astype(str).str.split('_', expand=True).astype('int64')
+        cols, rows = np.meshgrid(np.arange(parts[0].min(), parts[0].max() + 1),
+                                 np.arange(parts[1].min(), parts[1].max() + 1), indexing='ij')
+        labels = pd.Index(cols.ravel().astype(str)) + '_' + rows.ravel().astype(str)
+        return table.set_index(self.name).reindex(labels, fill_value=0).rename_axis(self.name).reset_index()
+
+
+class PolygonLayer:
+    """
+    경계 폴리곤 레이어 (점 포함 판정)
+
+    폴리곤마다 경도순 정렬 배열에서 경계 상자 범위만 잘라낸 뒤 포함 여부를 판정하므로
+    점 수 x 지역 수 전체 비교를 하지 않는다.
+
+    Args:
+        polygons (dict): {지역명: [(경도, 위도) 꼭짓점 배열, ...]} (멀티폴리곤은 여러 개)
+        name (str): 지역 컬럼명 (예: '자치구', '행정동코드')
+    """
+
+    def __init__(self, polygons, name='자치구'):
+        self.polygons = {region: [np.asarray(ring, dtype='float64') for ring in rings]
+                         for region, rings in polygons.items()}
+        self.name = name
+
+    @classmethod
+    def from_geojson(cls, file_path, name_property, name='자치구'):
+        """
+        GeoJSON (Polygon / MultiPolygon) 로드, 바깥 경계만 사용
+
+        Args:
+            file_path (str): GeoJSON 파일 경로
+            name_property (str): 지역명 속성 (예: 'SIG_KOR_NM', 'adm_cd')
+            name (str): 지역 컬럼명
+        """
+        with open(file_path, 'r', encoding='utf-8') as f:
+            features = json.load(f)['features']
+
+        polygons = {}
+        for feature in features:
+            geometry = feature['geometry']
+            parts = geometry['coordinates'] if geometry['type'] == 'MultiPolygon' else [geometry['coordinates']]
+            polygons.setdefault(str(feature['properties'][name_property]), []).extend(part[0] for part in parts)
+        return cls(polygons, name)
+
+    def assign(self, points):
+        order = np.argsort(points.lon, kind='stable')
+        lon_sorted = points.lon[order]
+        coords = np.column_stack([points.lon, points.lat])
+
+        regions = list(self.polygons)
+        codes = np.full(len(points), -1, dtype='int64')
+        for code, region in enumerate(regions):
+            for ring in self.polygons[region]:
+                lo, hi = np.searchsorted(lon_sorted, [ring[:, 0].min(), ring[:, 0].max()], side='left')
+                candidates = order[lo:hi]
+                lat = points.lat[candidates]
+                candidates = candidates[(lat >= ring[:, 1].min()) & (lat <= ring[:, 1].max()) & (codes[candidates] < 0)]
+                inside = Path(ring).contains_points(coords[candidates])
+                codes[candidates[inside]] = code
+        return pd.Categorical.from_codes(codes, regions)
+
+
+class CentroidLayer:
+    """
+    최근접 중심점 레이어 (경계 데이터가 없을 때 보로노이 근사)
+
+    Args:
+        centroids (pd.DataFrame): 지역 컬럼 + 위도/경도 컬럼
+        name (str): 지역 컬럼명
+        max_distance (float, optional): 이 거리(m)보다 먼 점은 레이어 밖으로 처리
+    """
+
+    def __init__(self, centroids, name='행정동코드', lat_col='위도', lon_col='경도', max_distance=None):
+        self.regions = centroids[name].astype(str).tolist()
+        self.tree = cKDTree(to_meters(centroids[lat_col], centroids[lon_col]))
+        self.name = name
+        self.max_distance = max_distance
+
+    def assign(self, points):
+        upper = np.inf if self.max_distance is None else self.max_distance
+        _, nearest = self.tree.query(points.xy, distance_upper_bound=upper)
+        codes = np.where(nearest < len(self.regions), nearest, -1)
+        return pd.Categorical.from_codes(codes, self.regions)
+
+
+def region_layer(level, boundaries=None, name_property='SIG_KOR_NM', cell_size=250):
+    """
+    지역 단위 -> 집계 레이어
+
+    Args:
+        level (str): REGION_LEVELS 의 지역 단위 ('자치구', '행정동', '격자250m')
+        boundaries (str, optional): 경계 GeoJSON 경로 (없으면 점 데이터의 지역 컬럼 사용)
+        name_property (str): GeoJSON 지역명 속성
+        cell_size (float): 격자 크기 (m, '격자250m' 일 때)
+
+    Returns:
+        str or GridLayer or PolygonLayer: 레이어 (문자열은 속성 컬럼명)
+    """
+    key = REGION_LEVELS[level]['key']
+    if level == '격자250m':
+        return GridLayer(cell_size, name=key)
+    if boundaries:
+        return PolygonLayer.from_geojson(boundaries, name_property, name=key)
+    return key
+
+
+def load_points(file_path, spec, encoding='utf-8-sig', extra_cols=()):
+    """
+    좌표 CSV 로드 (필요한 컬럼만, 분류 컬럼은 범주형으로 읽기)
+
+    Args:
+        file_path (str): CSV 경로
+        spec (dict): POINT_SPECS 항목
+        encoding (str): 파일 인코딩 (서울 열린데이터 광장 원본은 'cp949' 인 경우가 많음)
+        extra_cols (tuple): 함께 읽을 속성 컬럼 (예: ('자치구',))
+
+    Returns:
+        PointSet
+    """
+    usecols = [spec['lat_col'], spec['lon_col'], spec['category_col']] + list(extra_cols)
+    dtype = {spec['category_col']: 'category', **{col: 'category' for col in extra_cols}}
+    if spec.get('weight_col'):
+        usecols.append(spec['weight_col'])
+
+    df = pd.read_csv(file_path, usecols=usecols, dtype=dtype, encoding=encoding)
+    if spec.get('weight_col'):
+        df[spec['weight_col']] = pd.to_numeric(df[spec['weight_col']], errors='coerce').fillna(1)
+
+    return PointSet.from_frame(df, spec['lat_col'], spec['lon_col'])
+
+
+def aggregate_points(points, layer, spec):
+    """
+    POINT_SPECS 사양대로 지역별 집계 (분석용 컬럼명: CCTV_총계, 방범용 / 총범죄_발생, 절도_발생 ...)
+
+    Args:
+        points (PointSet): 좌표 데이터
+        layer (str or layer): 지역 레이어
+        spec (dict): POINT_SPECS 항목
+
+    Returns:
+        pd.DataFrame: 지역별 표
+    """
+    return points.aggregate(layer, by=spec['category_col'], weight=spec.get('weight_col'),
+                            total_col=spec['total_col'], column_format=spec['column_format'],
+                            categories=spec['categories'])
@@ -0,0 +1,153 @@
+"""
+지역 단위 일반화 (자치구 / 행정동 / 250m 격자)
+
+자치구 25개를 전제로 한 병합·파생 변수·위험도 계산을
+임의의 지역 키와 상위 지역(parent)으로 일반화합니다.
+- REGION_LEVELS (constants.py) 에 지역 단위별 키 컬럼과 상위 키 컬럼 정의
+- 모든 계산은 컬럼 단위 벡터 연산 / groupby 로 처리 (행 수에 선형)
+"""
+
+import numpy as np
+
+from .constants import REGION_LEVELS
+
+
+def region_key(level):
+    """지역 단위의 키 컬럼명 (예: '행정동' -> '행정동코드')"""
+    assert level in REGION_LEVELS, f"[ERROR] 알 수 없는 지역 단위: {level} (가능: {', '.join(REGION_LEVELS)})"
+    return REGION_LEVELS[level]['key']
+
+
+def integrate(frames, key='자치구', how='inner'):
+    """
+    여러 데이터(CCTV, 범죄, 인구 등)를 지역 키로 병합
+
+    Args:
+        frames (list): 지역 키 컬럼을 가진 DataFrame 리스트
+        key (str or list): 지역 키 컬럼 (예: '행정동코드', ['격자ID', '연도'])
+        how (str): 병합 방식 (기본: 'inner')
+
+    Returns:
+        pd.DataFrame: 병합 결과
+
+    Raises:
+        pandas.errors.MergeError: 지역 키가 중복될 때 (1:1 병합 검증)
+    """
+    merged = frames[0]
+    for frame in frames[1:]:
+        merged = merged.merge(frame, on=key, how=how, validate='one_to_one')
+    return merged
+
+
+def per_capita(df, numerators, population_col, scale=1000, decimals=None):
+    """
+    인구 대비 비율 변수 일괄 추가 (예: 인구 천 명당 CCTV)
+
+    Args:
+        df (pd.DataFrame): 데이터프레임
+        numerators (dict): {새 컬럼명: 분자 컬럼명}
+        population_col (str): 인구 컬럼명
+        scale (float): 배율 (기본: 1000)
+        decimals (int, optional): 반올림 자릿수
+
+    Returns:
+        pd.DataFrame: 비율 컬럼이 추가된 데이터프레임 (인구 0은 결측)
+
+    Examples:
+        >>> df = per_capita(df, {'인구당_방범용': '방범용'}, '인구수', decimals=2)
+    """
+    df = df.copy()
+    population = df[population_col].replace(0, np.nan)
+    for new_col, num_col in numerators.items():
+        rate = df[num_col] / population * scale
+        df[new_col] = rate.round(decimals) if decimals is not None else rate
+    return df
+
+
+def zscore(series, groups=None):
+    """
+    Z-score 표준화 (groups 지정 시 그룹 내 표준화, 표본표준편차 기준)
+
+    Args:
+        series (pd.Series): 값
+        groups (pd.Series or list, optional): 그룹 키 (예: 상위 지역, 연도)
+
+    Returns:
+        pd.Series: 표준화 값
+    """
+    if groups is None:
+        return (series - series.mean()) / series.std()
+    grouped = series.groupby(groups, sort=False, observed=True)
+    return (series - grouped.transform('mean')) / grouped.transform('std')
+
+
+def risk_score(df, crime_col, cctv_col, by=None):
+    """
+    위험도 점수 = 범죄율 Z-score - CCTV 밀도 Z-score
+
+    Args:
+        df (pd.DataFrame): 데이터프레임
+        crime_col (str): 범죄율 컬럼명
+        cctv_col (str): CCTV 밀도 컬럼명
+        by (str or list, optional): 그룹 컬럼 (예: '자치구' -> 자치구 안에서 행정동 비교)
+
+    Returns:
+        pd.Series: 위험도 점수 (클수록 CCTV 대비 범죄가 많음)
+
+    Examples:
+        >>> df['위험도점수'] = risk_score(df, '범죄_per_1000', 'CCTV_per_1000')
+    """
+    groups = None if by is None else [df[col] for col in ([by] if isinstance(by, str) else by)]
+    score = zscore(df[crime_col], groups) - zscore(df[cctv_col], groups)
+    return score.rename('위험도점수')
+
+
+def rollup(df, parent, sum_cols, hierarchy=None, key=None):
+    """
+    하위 지역 합계를 상위 지역으로 집계 (예: 격자 -> 행정동 -> 자치구)
+
+    비율 변수는 합계로 다시 계산해야 하므로 건수/인구 같은 합산 가능한 컬럼만 지정한다.
+
+    Args:
+        df (pd.DataFrame): 하위 지역 데이터
+        parent (str or list): 상위 지역 키 컬럼 (예: '자치구', ['자치구', '연도'])
+        sum_cols (list): 합산할 컬럼 리스트
+        hierarchy (pd.DataFrame, optional): df 에 상위 키가 없을 때 사용할 {key, parent} 대응표
+        key (str, optional): hierarchy 결합용 하위 지역 키 컬럼
+
+    Returns:
+        pd.DataFrame: 상위 지역별 합계 (상위 키 컬럼 포함)
+    """
+    parents = [parent] if isinstance(parent, str) else list(parent)
+    if hierarchy is not None:
+        missing = [col for col in parents if col not in df.columns]
+        df = df.merge(hierarchy[[key] + missing].drop_duplicates(key), on=key, how='left', validate='many_to_one')
+    return df.groupby(parents, sort=True, observed=True)[list(sum_cols)].sum().reset_index()
+
+
+def validate_regions(df, level=None, key=None, expected=None):
+    """
+    지역 단위 데이터 검증 (키 중복, 지역 수)
+
+    Args:
+        df (pd.DataFrame): 데이터프레임
+        level (str, optional): REGION_LEVELS 의 지역 단위 (key/expected 기본값 사용)
+        key (str or list, optional): 지역 키 컬럼
+        expected (int, optional): 예상 지역 수 (None 이면 확인 생략)
+
+    Raises:
+        AssertionError: 검증 실패 시
+
+    Returns:
+        bool: 검증 성공 여부
+    """
+    if level is not None:
+        key = key or REGION_LEVELS[level]['key']
+        expected = expected if expected is not None else REGION_LEVELS[level]['expected']
+
+    assert not df.duplicated(key).any(), f"[ERROR] 지역 키 중복: {key}"
+    if expected is not None:
+        assert len(df) == expected, f"[ERROR] 지역 수 불일치: {len(df)} != {expected}"
+
+    print(f"[OK] 지역 검증 완료: {len(df):,}개 ({key})")
+    return True
@@ -0,0 +1,360 @@
+"""
+회귀모형 레지스트리 (일괄 OLS + 결과 캐시)
+
+후보 설명변수 조합마다 statsmodels 로 다시 적합하는 대신,
+- 중심화·표준화한 설명변수의 상관행렬 R 과 Z'y 를 한 번만 계산하고
+- 같은 크기의 변수 조합들을 (모형 수, k, k) 배열로 모아 R 의 부분행렬 역행렬을 한 번에 계산
+해서 계수 / 표준오차 / R² / 수정 R² / AIC / BIC / F 검정 / VIF 를 함께 구합니다.
+(부분 역행렬의 대각선이 곧 VIF)
+
+적합 결과는 (사용한 컬럼 내용 해시 + 모형식) 키로 캐시하며,
+cache_path 를 주면 JSON 파일에 저장해 다음 실행에서도 재사용합니다.
+
+회귀 진단(레버리지, 쿡의 거리)은 n x n hat 행렬 대신 [X | y] 의 QR 분해 R 만으로
+행 단위 청크에서 계산하므로 백만 행 설계행렬에서도 메모리가 설명변수 수에만 비례합니다.
+"""
+
+import os
+import json
+import hashlib
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+from scipy.linalg import solve_triangular
+
+
+# 한 번에 역행렬을 계산할 최대 모형 수 (메모리 제한)
+REGRESSION_CHUNK = 100_000
+
+# 회귀 진단을 한 번에 처리할 최대 행 수 (메모리 제한)
+DIAGNOSTIC_CHUNK = 200_000
+
+
+def model_formula(y, x_cols):
+    """모형식 문자열 (예: '인구당_CCTV효과범죄율 ~ 인구당_방범용 + 인구밀도')"""
+    return f"{y} ~ {' + '.join(x_cols)}"
+
+
+def batch_ols(X, y, subsets):
+    """
+    같은 크기의 설명변수 조합들에 대한 상수항 포함 OLS 를 한 번에 적합
+
+    Args:
+        X (np.ndarray): (n, p) 후보 설명변수 (결측 없음)
+        y (np.ndarray): (n,) 종속변수
+        subsets (np.ndarray): (M, k) 모형별 설명변수 열 인덱스
+
+    Returns:
+        dict: 모형별 배열
+            - params, bse, pvalues: (M, k+1) 상수항이 첫 열
+            - vif: (M, k)
+            - rsquared, rsquared_adj, fvalue, f_pvalue, aic, bic: (M,)
+            - singular: (M,) 완전 다중공선성 모형 (결과 NaN)
+    """
+    X = np.asarray(X, dtype='float64')
+    y = np.asarray(y, dtype='float64')
+    subsets = np.atleast_2d(np.asarray(subsets, dtype='int64'))
+    n = len(y)
+    m, k = subsets.shape
+    dof = n - k - 1
+
+    x_mean, y_mean = X.mean(axis=0), y.mean()
+    centered = X - x_mean
+    scale = np.sqrt((centered ** 2).sum(axis=0))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        z = centered / scale
+    y_centered = y - y_mean
+    corr = z.T @ z
+    zy = z.T @ y_centered
+    syy = y_centered @ y_centered
+
+    A = corr[subsets[:, :, None], subsets[:, None, :]]
+    b = zy[subsets]
+    singular = ~np.isfinite(A).all(axis=(1, 2))
+    singular |= np.linalg.matrix_rank(np.where(singular[:, None, None], 0.0, A)) < k
+    A[singular] = np.eye(k)
+    A_inv = np.linalg.inv(A)
+
+    gamma = np.einsum('mij,mj->mi', A_inv, b)
+    sse = np.maximum(syy - (gamma * b).sum(axis=1), 0.0)
+    s2 = sse / dof
+    sub_scale, sub_mean = scale[subsets], x_mean[subsets]
+
+    slopes = gamma / sub_scale
+    slope_se = np.sqrt(s2[:, None] * np.diagonal(A_inv, axis1=1, axis2=2)) / sub_scale
+    u = sub_mean / sub_scale
+    intercept = y_mean - (sub_mean * slopes).sum(axis=1)
+    intercept_se = np.sqrt(s2 / n + s2 * np.einsum('mi,mij,mj->m', u, A_inv, u))
+
+    params = np.column_stack([intercept, slopes])
+    bse = np.column_stack([intercept_se, slope_se])
+    with np.errstate(invalid='ignore', divide='ignore'):
+        pvalues = 2 * stats.t.sf(np.abs(params / bse), dof)
+        rsquared = 1 - sse / syy
+        fvalue = ((syy - sse) / k) / s2
+    llf = -n / 2 * (np.log(2 * np.pi) + np.log(sse / n) + 1)
+
+    result = {
+        'params': params,
+        'bse': bse,
+        'pvalues': pvalues,
+        'vif': np.diagonal(A_inv, axis1=1, axis2=2).copy(),
+        'rsquared': rsquared,
+        'rsquared_adj': 1 - (1 - rsquared) * (n - 1) / dof,
+        'fvalue': fvalue,
+        'f_pvalue': stats.f.sf(fvalue, k, dof),
+        'aic': -2 * llf + 2 * (k + 1),
+        'bic': -2 * llf + np.log(n) * (k + 1),
+        'singular': singular
+    }
+    for key, value in result.items():
+        if key != 'singular':
+            value[singular] = np.nan
+    return result
+
+
+class RegressionRegistry:
+    """
+    회귀모형 레지스트리
+
+    Args:
+        df (pd.DataFrame): 분석 데이터 (모형마다 사용 컬럼의 결측 행 제외)
+        cache_path (str, optional): 적합 결과 JSON 캐시 경로 (없으면 메모리 캐시만)
+
+    Examples:
+        >>> registry = RegressionRegistry(df, os.path.join(DATA_PATHS['logs'], 'regression_cache.json'))
+        >>> model = registry.fit('인구당_CCTV효과범죄율', ['인구당_방범용', '인구밀도'])
+        >>> model['rsquared'], model['params']['인구당_방범용']
+        >>> registry.best_subsets('인구당_CCTV효과범죄율', candidates, max_size=3).head(10)
+    """
+
+    def __init__(self, df, cache_path=None):
+        self.df = df
+        self.cache_path = cache_path
+        self._column_hashes = {}
+        self._searches = {}
+        self.cache = {}
+        if cache_path and os.path.exists(cache_path):
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                self.cache = json.load(f)
+
+    def __repr__(self):
+        return f"RegressionRegistry({len(self.df)}행, 캐시 모형 {len(self.cache):,}개)"
+
+    def column_hash(self, col):
+        """컬럼 내용 해시 (컬럼별로 한 번만 계산)"""
+        if col not in self._column_hashes:
+            values = pd.util.hash_pandas_object(self.df[col], index=False).to_numpy()
+            self._column_hashes[col] = hashlib.sha256(values.tobytes()).hexdigest()
+        return self._column_hashes[col]
+
+    def key(self, y, x_cols):
+        """캐시 키: 사용 컬럼 내용 해시 + 모형식"""
+        digest = hashlib.sha256(model_formula(y, x_cols).encode('utf-8'))
+        for col in [y] + list(x_cols):
+            digest.update(self.column_hash(col).encode('utf-8'))
+        return digest.hexdigest()
+
+    def save(self):
+        """캐시를 JSON 파일로 저장 (cache_path 가 있을 때)"""
+        if not self.cache_path:
+            return
+        os.makedirs(os.path.dirname(self.cache_path) or '.', exist_ok=True)
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump(self.cache, f, ensure_ascii=False)
+
+    def fit(self, y, x_cols):
+        """
+        단일 모형 적합 (캐시 우선)
+
+        Returns:
+            dict: formula, y_col, x_cols, nobs, rsquared, rsquared_adj, fvalue, f_pvalue, aic, bic,
+                params / bse / pvalues ({'const': ..., 변수: ...}), vif ({변수: ...})
+        """
+        return self.fit_many(y, [x_cols])[0]
+
+    def fit_many(self, y, specs):
+        """
+        여러 모형 적합 (캐시에 없는 모형만 설명변수 수별로 묶어 일괄 적합)
+
+        Args:
+            y (str): 종속변수
+            specs (list): 설명변수 리스트의 리스트
+
+        Returns:
+            list: 모형별 결과 dict (fit() 참고, specs 순서)
+        """
+        specs = [list(x_cols) for x_cols in specs]
+        keys = [self.key(y, x_cols) for x_cols in specs]
+        todo = {}
+        for key, x_cols in zip(keys, specs):
+            if key not in self.cache:
+                todo.setdefault(tuple(x_cols), key)
+
+        # 같은 행(결측 제외)·같은 크기끼리 묶어 한 번에 적합
+        groups = {}
+        for x_cols, key in todo.items():
+            columns = [y] + sorted(set(x_cols))
+            rows = self.df[columns].notna().all(axis=1).to_numpy()
+            groups.setdefault((rows.tobytes(), len(x_cols)), []).append((x_cols, key, rows))
+
+        for members in groups.values():
+            rows = members[0][2]
+            columns = sorted({col for x_cols, _, _ in members for col in x_cols})
+            index = {col: i for i, col in enumerate(columns)}
+            X = self.df.loc[rows, columns].to_numpy(dtype='float64')
+            subsets = np.array([[index[col] for col in x_cols] for x_cols, _, _ in members])
+            result = batch_ols(X, self.df.loc[rows, y].to_numpy(dtype='float64'), subsets)
+            for i, (x_cols, key, _) in enumerate(members):
+                self.cache[key] = self._to_dict(y, list(x_cols), int(rows.sum()), result, i)
+
+        if todo:
+            self.save()
+        return [self.cache[key] for key in keys]
+
+    @staticmethod
+    def _to_dict(y, x_cols, nobs, result, i):
+        names = ['const'] + x_cols
+        as_float = lambda value: None if np.isnan(value) else float(value)
+        return {
+            'formula': model_formula(y, x_cols),
+            'y_col': y,
+            'x_cols': x_cols,
+            'nobs': nobs,
+            **{name: as_float(result[name][i])
+               for name in ['rsquared', 'rsquared_adj', 'fvalue', 'f_pvalue', 'aic', 'bic']},
+            **{name: {col: as_float(v) for col, v in zip(names, result[name][i])}
+               for name in ['params', 'bse', 'pvalues']},
+            'vif': {col: as_float(v) for col, v in zip(x_cols, result['vif'][i])}
+        }
+
+    def best_subsets(self, y, candidates, max_size=3, min_size=1, criterion='aic', top=None):
+        """
+        모든 설명변수 조합 탐색 (크기 min_size ~ max_size)
+
+        후보 변수와 y 에 결측이 없는 행만 사용하며, 결과 표는 메모리에 캐시합니다.
+        (개별 모형의 계수가 필요하면 fit() 으로 다시 조회)
+
+        Args:
+            y (str): 종속변수
+            candidates (list): 후보 설명변수
+            max_size (int): 최대 설명변수 수
+            min_size (int): 최소 설명변수 수
+            criterion (str): 정렬 기준 ('aic', 'bic' 는 오름차순, 'rsquared_adj' 는 내림차순)
+            top (int, optional): 상위 모형 수
+
+        Returns:
+            pd.DataFrame: [모형식, 변수수, rsquared, rsquared_adj, aic, bic, f_pvalue, 최대VIF]
+        """
+        candidates = [col for col in candidates if col != y]
+        search_key = self.key(y, candidates) + f":{min_size}:{max_size}"
+
+        if search_key not in self._searches:
+            data = self.df[[y] + candidates].dropna()
+            X = data[candidates].to_numpy(dtype='float64')
+            target = data[y].to_numpy(dtype='float64')
+            names = np.asarray(candidates, dtype=object)
+
+            tables = []
+            for size in range(min_size, min(max_size, len(candidates)) + 1):
+                subsets = np.array(list(combinations(range(len(candidates)), size)), dtype='int64')
+                for start in range(0, len(subsets), REGRESSION_CHUNK):
+                    chunk = subsets[start:start + REGRESSION_CHUNK]
+                    result = batch_ols(X, target, chunk)
+                    tables.append(pd.DataFrame({
+                        '모형식': [model_formula(y, names[s]) for s in chunk],
+                        '변수수': size,
+                        'rsquared': result['rsquared'],
+                        'rsquared_adj': result['rsquared_adj'],
+                        'aic': result['aic'],
+                        'bic': result['bic'],
+                        'f_pvalue': result['f_pvalue'],
+                        '최대VIF': result['vif'].max(axis=1)
+                    }))
+            self._searches[search_key] = pd.concat(tables, ignore_index=True)
+
+        table = self._searches[search_key].sort_values(
+            criterion, ascending=criterion != 'rsquared_adj', ignore_index=True)
+        return table if top is None else table.head(top)
+
+
+def vif_table(df, x_cols):
+    """
+    분산팽창계수 (VIF) - 설명변수 상관행렬의 역행렬 대각선
+
+    상수항이 있는 회귀모형 기준 VIF 로, 변수마다 보조회귀를 돌리지 않고 역행렬 한 번으로 계산합니다.
+
+    Args:
+        df (pd.DataFrame): 데이터프레임 (결측 행 제외)
+        x_cols (list): 설명변수
+
+    Returns:
+        pd.DataFrame: [변수, VIF]
+    """
+    values = df[list(x_cols)].dropna().to_numpy(dtype='float64')
+    centered = values - values.mean(axis=0)
+    z = centered / np.sqrt((centered ** 2).sum(axis=0))
+    return pd.DataFrame({'변수': list(x_cols), 'VIF': np.diag(np.linalg.inv(z.T @ z))})
+
+
+def regression_diagnostics(df, y, x_cols, chunk_size=DIAGNOSTIC_CHUNK):
+    """
+    상수항 포함 OLS 회귀 진단 (적합값, 잔차, 레버리지, 스튜던트화 잔차, 쿡의 거리)
+
+    1) 청크마다 [1, X | y] 를 이전 R 아래에 쌓아 QR 분해 (TSQR) -> 계수와 SSE
+    2) 청크마다 레버리지 h = ||R^-T x||^2, 쿡의 거리 = r^2 h / (p (1 - h)) 계산
+    (statsmodels get_influence() 의 hat_matrix_diag, resid_studentized_internal, cooks_distance[0] 와 같은 값)
+
+    Args:
+        df (pd.DataFrame): 데이터프레임 (사용 컬럼에 결측이 있는 행은 제외)
+        y (str): 종속변수
+        x_cols (list): 설명변수
+        chunk_size (int): 한 번에 처리할 행 수
+
+    Returns:
+        pd.DataFrame: df 인덱스 기준 [적합값, 잔차, 레버리지, 스튜던트화잔차, 쿡거리]
+
+    Examples:
+        >>> diag = regression_diagnostics(df, '인구당_CCTV효과범죄율', ['인구당_방범용', '인구밀도'])
+        >>> diag[diag['쿡거리'] > 4 / len(diag)]
+    """
+    data = df[[y] + list(x_cols)].dropna()
+    n, p = len(data), len(x_cols) + 1
+    assert n > p, f"[ERROR] 관측치 수({n})가 모수 수({p})보다 많아야 합니다"
+
+    def design(start):
+        chunk = data.iloc[start:start + chunk_size]
+        X = np.column_stack([np.ones(len(chunk)), chunk[list(x_cols)].to_numpy(dtype='float64')])
+        return X, chunk[y].to_numpy(dtype='float64')
+
+    # 1) TSQR: [X | y] 의 R (p+1 x p+1) 누적
+    R = np.empty((0, p + 1))
+    for start in range(0, n, chunk_size):
+        X, target = design(start)
+        R = np.linalg.qr(np.vstack([R, np.column_stack([X, target])]), mode='r')
+    R_x, qty = R[:p, :p], R[:p, p]
+    assert np.all(np.abs(np.diag(R_x)) > 1e-10 * np.abs(R_x).max()), "[ERROR] 설명변수에 완전 다중공선성이 있습니다"
+    params = solve_triangular(R_x, qty)
+    s2 = R[p, p] ** 2 / (n - p) if len(R) > p else 0.0
+
+    # 2) 청크별 진단
+    fitted, leverage = np.empty(n), np.empty(n)
+    for start in range(0, n, chunk_size):
+        X, _ = design(start)
+        fitted[start:start + len(X)] = X @ params
+        leverage[start:start + len(X)] = (solve_triangular(R_x, X.T, trans='T') ** 2).sum(axis=0)
+
+    resid = data[y].to_numpy(dtype='float64') - fitted
+    with np.errstate(invalid='ignore', divide='ignore'):
+        studentized = resid / np.sqrt(s2 * (1 - leverage))
+        cooks = studentized ** 2 * leverage / (p * (1 - leverage))
+
+    return pd.DataFrame({
+        '적합값': fitted,
+        '잔차': resid,
+        '레버리지': leverage,
+        '스튜던트화잔차': studentized,
+        '쿡거리': cooks
+    }, index=data.index)
@@ -0,0 +1,92 @@
+"""
+그래프 병렬 렌더링
+
+서로 독립적인 Matplotlib 그래프(dpi=300 저장)를 프로세스 풀에서 동시에 그립니다.
+- 각 워커는 Agg 백엔드 + 부모 프로세스의 rcParams(한글 폰트, 스타일)로 초기화
+- 데이터(context)는 워커당 한 번만 전달되어 모든 그래프가 읽기 전용으로 공유
+- 그래프별 소요 시간을 반환하여 병목 그래프 확인 가능
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import matplotlib
+import matplotlib.pyplot as plt
+
+
+# 워커 프로세스에서 공유하는 읽기 전용 데이터 (_init_worker 에서 설정)
+_WORKER_CONTEXT = None
+
+
+def _init_worker(context, rc_params):
+    """워커 초기화: Agg 백엔드, 부모와 같은 rcParams, 공유 데이터 설정"""
+    global _WORKER_CONTEXT
+    matplotlib.use('Agg')
+    matplotlib.rcParams.update(rc_params)
+    _WORKER_CONTEXT = context
+
+
+def _render_one(filename, func, output_dir, context=None):
+    """그래프 하나를 그려 저장하고 (파일명, 소요 시간(초)) 반환"""
+    if context is None:
+        context = _WORKER_CONTEXT
+
+    started = time.perf_counter()
+    func(context, os.path.join(output_dir, filename))
+    plt.close('all')
+    return filename, time.perf_counter() - started
+
+
+def render_figures(figures, context, output_dir, workers=None, parallel=True):
+    """
+    그래프 목록을 (병렬로) 렌더링
+
+    figures 의 각 함수는 func(context, save_path) 형태로, 그래프를 그려 save_path 에 저장한다.
+    프로세스 풀에서 실행되므로 함수는 모듈 최상위에 정의해야 하며 context 를 수정하지 않아야 한다.
+
+    Args:
+        figures (list): (파일명, 함수) 튜플 리스트
+        context (dict): 모든 그래프가 공유하는 데이터 (예: {'df': df, 'residuals': ...})
+        output_dir (str): 저장 폴더
+        workers (int, optional): 워커 프로세스 수 (기본: min(CPU 수, 그래프 수))
+        parallel (bool): False면 현재 프로세스에서 순차 실행 (기본: True)
+
+    Returns:
+        dict: {파일명: 소요 시간(초)} (figures 순서)
+
+    Examples:
+        >>> timings = render_figures([('day8_qq_plot.png', plot_qq)], {'df': df}, FIGURES_PATH)
+        >>> max(timings, key=timings.get)  # 가장 느린 그래프
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    if workers is None:
+        workers = min(os.cpu_count() or 1, len(figures))
+
+    total = len(figures)
+    timings = {}
+    started = time.perf_counter()
+
+    if not parallel or workers <= 1:
+        for i, (filename, func) in enumerate(figures, 1):
+            _, elapsed = _render_one(filename, func, output_dir, context)
+            timings[filename] = elapsed
+            print(f"   [{i}/{total}] [OK] {filename} ({elapsed:.2f}s)")
+    else:
+        rc_params = {k: v for k, v in matplotlib.rcParams.items() if k != 'backend'}
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(context, rc_params)) as executor:
+            futures = [executor.submit(_render_one, filename, func, output_dir)
+                       for filename, func in figures]
+            for i, future in enumerate(as_completed(futures), 1):
+                filename, elapsed = future.result()
+                timings[filename] = elapsed
+                print(f"   [{i}/{total}] [OK] {filename} ({elapsed:.2f}s)")
+
+    wall = time.perf_counter() - started
+    mode = f"병렬 {workers}개 프로세스" if parallel and workers > 1 else "순차"
+    print(f"\n그래프 {total}개 렌더링 완료: {wall:.2f}s ({mode}, 그래프 합계 {sum(timings.values()):.2f}s)")
+    for filename, elapsed in sorted(timings.items(), key=lambda item: item[1], reverse=True):
+        print(f"   {elapsed:6.2f}s  {filename}")
+
+    return {filename: timings[filename] for filename, _ in figures}
@@ -0,0 +1,118 @@
+"""
+부트스트랩 / 순열검정 (상관계수 추론)
+
+n=25 자치구에서 pearsonr 한 번으로 얻은 r, p-value 대신
+모든 변수 쌍의 부트스트랩 신뢰구간과 순열검정 p-value 를 계산합니다.
+- 재표본 인덱스 행렬을 배치 단위로 한 번에 생성 (B x n)
+- 배치의 모든 상관행렬을 einsum 한 번으로 계산 (B x p x p)
+- 배치별 시드는 SeedSequence(RANDOM_SEED).spawn() 으로 고정 -> 워커 수와 무관하게 같은 결과
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .constants import RANDOM_SEED
+from .correlation import correlate, fdr_bh
+
+
+def batched_corr(samples):
+    """
+    여러 표본의 Pearson 상관행렬을 한 번에 계산
+
+    Args:
+        samples (np.ndarray): (B, n, p) 표본 배열
+
+    Returns:
+        np.ndarray: (B, p, p) 상관행렬 (분산 0 인 표본은 NaN)
+    """
+    centered = samples - samples.mean(axis=1, keepdims=True)
+    norms = np.sqrt(np.einsum('bni,bni->bi', centered, centered))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        unit = centered / norms[:, None, :]
+    return np.einsum('bni,bnj->bij', unit, unit)
+
+
+def _bootstrap_batch(values, size, seed):
+    """부트스트랩 배치: 행 재표본 인덱스 (size x n) -> 상관행렬 (size x p x p)"""
+    rng = np.random.default_rng(seed)
+    idx = rng.integers(0, len(values), size=(size, len(values)))
+    return batched_corr(values[idx])
+
+
+def _permutation_batch(values, size, seed):
+    """순열 배치: 열마다 독립적으로 행 순서 섞기 -> 귀무분포 상관행렬 (size x p x p)"""
+    rng = np.random.default_rng(seed)
+    n, p = values.shape
+    order = np.argsort(rng.random((size, p, n)), axis=-1)
+    shuffled = values.T[np.arange(p)[None, :, None], order]
+    return batched_corr(shuffled.transpose(0, 2, 1))
+
+
+def _run_batches(func, values, n_resamples, batch_size, seed, workers):
+    """배치별 시드로 func 실행 (workers > 1 이면 프로세스 풀), 결과를 이어 붙여 반환"""
+    sizes = [batch_size] * (n_resamples // batch_size)
+    if n_resamples % batch_size:
+        sizes.append(n_resamples % batch_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(sizes) == 1:
+        return np.concatenate([func(values, size, s) for size, s in zip(sizes, seeds)])
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(sizes))) as executor:
+        return np.concatenate(list(executor.map(func, [values] * len(sizes), sizes, seeds)))
+
+
+def correlation_inference(df, columns=None, n_resamples=10000, ci=0.95, seed=RANDOM_SEED,
+                          batch_size=1000, workers=1):
+    """
+    모든 변수 쌍의 상관계수 추론 (부트스트랩 신뢰구간 + 순열검정 p-value)
+
+    Args:
+        df (pd.DataFrame): 데이터프레임
+        columns (list, optional): 분석 변수 (기본: 숫자형 컬럼 전체)
+        n_resamples (int): 부트스트랩/순열 반복 횟수 (기본: 10,000)
+        ci (float): 신뢰수준 (기본: 0.95, 백분위수 구간)
+        seed (int): 난수 시드 (기본: RANDOM_SEED)
+        batch_size (int): 한 번에 계산할 재표본 수 (메모리: batch_size x n x p)
+        workers (int, optional): 프로세스 수 (기본: 1, None 이면 CPU 수).
+            모듈 최상위에서 실행되는 스크립트는 Windows 에서 재실행되므로 __main__ 보호가 있을 때만 사용
+
+    Returns:
+        pd.DataFrame: [변수1, 변수2, r, CI_하한, CI_상한, 표준오차, p_value, q_value, p_permutation]
+
+    Examples:
+        >>> inference = correlation_inference(merged, ['CCTV_per_1000', '범죄_per_1000'])
+        >>> inference.sort_values('p_permutation')
+    """
+    if columns is None:
+        columns = df.select_dtypes('number').columns.tolist()
+    values = df[columns].dropna().to_numpy(dtype='float64')
+    observed, _, p_value = correlate(values)
+
+    boot = _run_batches(_bootstrap_batch, values, n_resamples, batch_size, seed, workers)
+    null = _run_batches(_permutation_batch, values, n_resamples, batch_size, seed + 1, workers)
+
+    alpha = (1 - ci) / 2
+    low, high = np.nanquantile(boot, [alpha, 1 - alpha], axis=0)
+    se = np.nanstd(boot, axis=0, ddof=1)
+    exceed = (np.abs(null) >= np.abs(observed) - 1e-12).sum(axis=0)
+    # 상수 컬럼처럼 r 이 정의되지 않으면 순열 p 값도 결측
+    p_permutation = np.where(np.isnan(observed), np.nan, (exceed + 1) / (n_resamples + 1))
+
+    i, j = np.triu_indices(len(columns), k=1)
+    return pd.DataFrame({
+        '변수1': np.asarray(columns)[i],
+        '변수2': np.asarray(columns)[j],
+        'r': observed[i, j],
+        'CI_하한': low[i, j],
+        'CI_상한': high[i, j],
+        '표준오차': se[i, j],
+        'p_value': p_value[i, j],
+        'q_value': fdr_bh(p_value[i, j]),
+        'p_permutation': p_permutation[i, j]
+    })
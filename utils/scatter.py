@@ -0,0 +1,136 @@
+"""
+대용량 산점도 다운샘플링 (대시보드용)
+
+점 수에 따라 브라우저로 보낼 데이터를 줄입니다.
+- SVG (점 수 < SCATTER_WEBGL_THRESHOLD): 모든 점
+- WebGL (점 수 < SCATTER_DENSITY_THRESHOLD): 모든 점, Scattergl 로 렌더링
+- 밀도 타일 (그 이상): 서버에서 2차원 격자로 집계한 (타일 중심, 점 수) 만 전송
+어느 경우든 라벨은 마할라노비스 거리 상위 N개 이상치에만 붙이고,
+추세선(OLS)은 한 번 계산한 계수로 선분 두 점만 그립니다.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+# WebGL 렌더링으로 전환하는 점 수
+SCATTER_WEBGL_THRESHOLD = 2_000
+
+# 서버 밀도 타일로 전환하는 점 수
+SCATTER_DENSITY_THRESHOLD = 50_000
+
+# 밀도 타일 축별 구간 수
+SCATTER_BINS = 100
+
+# 라벨을 붙일 이상치 수 (자치구 단위는 전체 라벨)
+SCATTER_LABEL_TOP = 30
+
+
+def fit_trendline(x, y):
+    """
+    단순 OLS 추세선
+
+    Args:
+        x, y (array-like): 좌표 (결측 제외)
+
+    Returns:
+        dict: slope, intercept, r2, x (양 끝 x), y (양 끝 추정값)
+    """
+    x = np.asarray(x, dtype='float64')
+    y = np.asarray(y, dtype='float64')
+    valid = np.isfinite(x) & np.isfinite(y)
+    x, y = x[valid], y[valid]
+    if len(x) < 2 or np.ptp(x) == 0:
+        return None
+
+    dx, dy = x - x.mean(), y - y.mean()
+    slope = (dx @ dy) / (dx @ dx)
+    intercept = y.mean() - slope * x.mean()
+    ss_res = ((dy - slope * dx) ** 2).sum()
+    ends = np.array([x.min(), x.max()])
+    return {
+        'slope': slope,
+        'intercept': intercept,
+        'r2': 1 - ss_res / (dy @ dy) if dy @ dy > 0 else np.nan,
+        'x': ends,
+        'y': intercept + slope * ends
+    }
+
+
+def top_outliers(x, y, n=SCATTER_LABEL_TOP):
+    """
+    마할라노비스 거리 상위 n개 점의 위치 인덱스 (n 이하이면 전체)
+
+    Args:
+        x, y (array-like): 좌표
+        n (int): 선택할 점 수
+
+    Returns:
+        np.ndarray: 위치 인덱스 (거리 내림차순)
+    """
+    points = np.column_stack([np.asarray(x, dtype='float64'), np.asarray(y, dtype='float64')])
+    valid = np.flatnonzero(np.isfinite(points).all(axis=1))
+    if len(valid) <= n:
+        return valid
+
+    centered = points[valid] - points[valid].mean(axis=0)
+    precision = np.linalg.pinv(np.cov(centered, rowvar=False))
+    distance = np.einsum('ij,jk,ik->i', centered, precision, centered)
+    top = np.argpartition(distance, -n)[-n:]
+    return valid[top[np.argsort(distance[top])[::-1]]]
+
+
+def density_tiles(x, y, bins=SCATTER_BINS):
+    """
+    2차원 격자 밀도 (비어 있지 않은 타일만)
+
+    Returns:
+        pd.DataFrame: [x, y, 점수] 타일 중심과 점 수
+    """
+    x = np.asarray(x, dtype='float64')
+    y = np.asarray(y, dtype='float64')
+    valid = np.isfinite(x) & np.isfinite(y)
+    counts, x_edges, y_edges = np.histogram2d(x[valid], y[valid], bins=bins)
+    ix, iy = np.nonzero(counts)
+    return pd.DataFrame({
+        'x': (x_edges[ix] + x_edges[ix + 1]) / 2,
+        'y': (y_edges[iy] + y_edges[iy + 1]) / 2,
+        '점수': counts[ix, iy].astype('int64')
+    })
+
+
+def scatter_layers(df, x, y, label_col=None, label_top=SCATTER_LABEL_TOP,
+                   webgl_threshold=SCATTER_WEBGL_THRESHOLD, density_threshold=SCATTER_DENSITY_THRESHOLD,
+                   bins=SCATTER_BINS):
+    """
+    산점도 렌더링 단위 계산 (모드, 점/타일, 라벨 이상치, 추세선)
+
+    Args:
+        df (pd.DataFrame): 데이터
+        x, y (str): 축 컬럼
+        label_col (str, optional): 라벨 컬럼 (예: '자치구')
+        label_top (int): 라벨을 붙일 이상치 수
+        webgl_threshold (int): WebGL 전환 점 수
+        density_threshold (int): 밀도 타일 전환 점 수
+        bins (int): 밀도 타일 축별 구간 수
+
+    Returns:
+        dict: mode ('svg' | 'webgl' | 'density'), points (svg/webgl: df, density: None),
+              tiles (density 타일 또는 None), labels (이상치 행), trend (fit_trendline 결과)
+
+    Examples:
+        >>> layers = scatter_layers(df, '인구당_총CCTV', '인구당_CCTV효과범죄율', label_col='자치구')
+        >>> layers['mode'], len(layers['labels'])
+    """
+    n = len(df)
+    mode = 'svg' if n < webgl_threshold else 'webgl' if n < density_threshold else 'density'
+    x_values, y_values = df[x].to_numpy(), df[y].to_numpy()
+
+    labels = df.iloc[top_outliers(x_values, y_values, label_top)] if label_col else df.iloc[:0]
+    return {
+        'mode': mode,
+        'points': None if mode == 'density' else df,
+        'tiles': density_tiles(x_values, y_values, bins) if mode == 'density' else None,
+        'labels': labels,
+        'trend': fit_trendline(x_values, y_values)
+    }
@@ -0,0 +1,527 @@
+"""
+서울 열린데이터광장 Open API 클라이언트
+
+- 연결 풀을 공유하는 requests.Session 하나로 모든 호출 처리
+- 1회 최대 1,000건 제한에 맞춰 전체 페이지를 자동 순회 (첫 페이지의 list_total_count 기준)
+- 남은 페이지는 스레드 풀에서 동시에 요청, API 키별 동시 요청 수 제한
+- 429/5xx/연결 오류는 지수 백오프로 재시도
+- 응답은 SQLite 캐시(zlib 압축)에 저장, 서비스별 TTL 이 지나면 ETag/Last-Modified 로 재검증
+- offline=True 면 네트워크 없이 캐시만 사용
+- ServiceProber: 서비스명 병렬 탐색 (동시 요청/호스트별 속도 제한, 빈 범위 조기 중단, 결과 저장)
+- base_url 을 바꾸면 로컬 스텁 서버로 테스트 가능
+"""
+
+import os
+import json
+import time
+import zlib
+import sqlite3
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+
+
+# API 기본 설정
+SEOUL_API_BASE_URL = "http://openapi.seoul.go.kr:8088"
+PAGE_SIZE = 1000  # 1회 호출 최대 건수 (API 제한)
+
+# 재시도 대상 HTTP 상태 코드
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+# API 결과 코드
+CODE_OK = 'INFO-000'
+CODE_NO_DATA = 'INFO-200'
+
+# 응답 캐시 기본 유효 시간 (초)
+DEFAULT_CACHE_TTL = 24 * 60 * 60
+
+
+def parse_page(payload, service_name):
+    """
+    API 응답(JSON) 한 페이지 해석
+
+    Args:
+        payload (dict): 응답 JSON
+        service_name (str): 서비스명
+
+    Returns:
+        tuple: (전체 건수, 행 리스트, 결과 코드, 메시지)
+    """
+    body = payload.get(service_name, payload)
+    result = body.get('RESULT', {})
+    return (
+        int(body.get('list_total_count', 0)),
+        body.get('row', []),
+        result.get('CODE', CODE_OK if 'row' in body else None),
+        result.get('MESSAGE', '')
+    )
+
+
+def key_fingerprint(api_key):
+    """API 키 지문 (캐시에는 원본 키 대신 이 값만 저장)"""
+    return hashlib.sha256(str(api_key).encode('utf-8')).hexdigest()[:16]
+
+
+class ResponseCache:
+    """
+    API 응답 디스크 캐시 (SQLite + zlib 압축)
+
+    (서비스명, 시작/끝 인덱스, API 키 지문) 단위로 응답 JSON 을 저장한다.
+    저장 후 TTL 이 지나지 않았으면 그대로 사용하고, 지났으면 ETag/Last-Modified 로
+    조건부 요청(304 Not Modified)을 보내 재검증한다.
+
+    Args:
+        path (str): SQLite 파일 경로 (예: 'data/cache/seoul_api.sqlite')
+        ttl (dict or int, optional): 서비스별 유효 시간(초) {서비스명: 초, 'default': 초}
+            또는 전체 공통 값 (기본: DEFAULT_CACHE_TTL)
+
+    Examples:
+        >>> cache = ResponseCache('data/cache/seoul_api.sqlite', ttl={'등록인구통계': 7 * 86400})
+        >>> client = SeoulApiClient(cache=cache)
+    """
+
+    def __init__(self, path, ttl=None):
+        self.path = path
+        if ttl is None or isinstance(ttl, dict):
+            self.ttl = {'default': DEFAULT_CACHE_TTL, **(ttl or {})}
+        else:
+            self.ttl = {'default': ttl}
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                service TEXT, start_idx INTEGER, end_idx INTEGER, key_fp TEXT,
+                etag TEXT, last_modified TEXT, fetched_at REAL, body BLOB,
+                PRIMARY KEY (service, start_idx, end_idx, key_fp)
+            )
+        """)
+        self._conn.commit()
+
+    def ttl_for(self, service_name):
+        return self.ttl.get(service_name, self.ttl['default'])
+
+    def get(self, api_key, service_name, start_idx, end_idx):
+        """
+        캐시 조회
+
+        Returns:
+            dict or None: {'data', 'etag', 'last_modified', 'fresh'} (없으면 None)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, fetched_at, body FROM responses "
+                "WHERE service=? AND start_idx=? AND end_idx=? AND key_fp=?",
+                (service_name, start_idx, end_idx, key_fingerprint(api_key))
+            ).fetchone()
+        if row is None:
+            return None
+
+        etag, last_modified, fetched_at, body = row
+        return {
+            'data': json.loads(zlib.decompress(body).decode('utf-8')),
+            'etag': etag,
+            'last_modified': last_modified,
+            'fresh': time.time() - fetched_at < self.ttl_for(service_name)
+        }
+
+    def put(self, api_key, service_name, start_idx, end_idx, data, etag=None, last_modified=None):
+        """응답 저장 (같은 키는 덮어쓰기)"""
+        body = zlib.compress(json.dumps(data, ensure_ascii=False).encode('utf-8'))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (service_name, start_idx, end_idx, key_fingerprint(api_key),
+                 etag, last_modified, time.time(), body)
+            )
+            self._conn.commit()
+
+    def touch(self, api_key, service_name, start_idx, end_idx):
+        """재검증 성공(304) 시 저장 시각만 갱신"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET fetched_at=? "
+                "WHERE service=? AND start_idx=? AND end_idx=? AND key_fp=?",
+                (time.time(), service_name, start_idx, end_idx, key_fingerprint(api_key))
+            )
+            self._conn.commit()
+
+    def clear(self, service_name=None):
+        """캐시 삭제 (서비스명 지정 시 해당 서비스만)"""
+        with self._lock:
+            if service_name is None:
+                self._conn.execute("DELETE FROM responses")
+            else:
+                self._conn.execute("DELETE FROM responses WHERE service=?", (service_name,))
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class SeoulApiClient:
+    """
+    서울 열린데이터광장 Open API 클라이언트 (페이지 자동 순회, 동시 요청, 재시도)
+
+    Args:
+        base_url (str): API 주소 (기본: SEOUL_API_BASE_URL)
+        page_size (int): 페이지당 건수 (기본: 1000, API 최대값)
+        max_workers (int): 전체 동시 요청 수 (기본: 8)
+        per_key_limit (int): API 키별 동시 요청 수 (기본: 4)
+        max_retries (int): 재시도 횟수 (기본: 3)
+        backoff (float): 첫 재시도 대기 시간(초), 이후 2배씩 증가 (기본: 0.5)
+        timeout (float): 요청 타임아웃(초) (기본: 30)
+        cache (ResponseCache, optional): 응답 캐시 (기본: 사용 안 함)
+        offline (bool): True면 캐시만 사용, 네트워크 요청 없음 (기본: False)
+
+    Examples:
+        >>> client = SeoulApiClient()
+        >>> df = client.fetch_frame(api_key, 'SeoulLibraryTimeInfo')   # 전체 페이지
+        >>> client = SeoulApiClient(base_url='http://127.0.0.1:8088')  # 스텁 서버
+        >>> client = SeoulApiClient(cache=ResponseCache('data/cache/seoul_api.sqlite'), offline=True)
+    """
+
+    def __init__(self, base_url=SEOUL_API_BASE_URL, page_size=PAGE_SIZE, max_workers=8,
+                 per_key_limit=4, max_retries=3, backoff=0.5, timeout=30, cache=None, offline=False):
+        self.base_url = base_url.rstrip('/')
+        self.page_size = page_size
+        self.max_workers = max_workers
+        self.per_key_limit = per_key_limit
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.cache = cache
+        self.offline = offline
+        self.stats = {'network': 0, 'cache_hit': 0, 'revalidated': 0}
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._key_slots = {}
+        self._lock = threading.Lock()
+
+    def close(self):
+        """스레드 풀과 세션 정리"""
+        self._executor.shutdown(wait=True)
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def url(self, api_key, service_name, start_idx, end_idx, output_format='json'):
+        return f"{self.base_url}/{api_key}/{output_format}/{service_name}/{start_idx}/{end_idx}"
+
+    def _slot(self, api_key):
+        """API 키별 동시 요청 제한용 세마포어"""
+        with self._lock:
+            if api_key not in self._key_slots:
+                self._key_slots[api_key] = threading.BoundedSemaphore(self.per_key_limit)
+            return self._key_slots[api_key]
+
+    def get_json(self, api_key, service_name, start_idx=1, end_idx=PAGE_SIZE):
+        """
+        한 구간 호출 (캐시 -> 조건부 재검증 -> 재시도 포함 요청 순)
+
+        Returns:
+            dict: 응답 JSON
+
+        Raises:
+            ValueError: offline 모드에서 캐시에 없을 때
+            requests.exceptions.RequestException: 재시도 후에도 실패한 경우
+        """
+        cached = self.cache.get(api_key, service_name, start_idx, end_idx) if self.cache else None
+        if cached and (cached['fresh'] or self.offline):
+            with self._lock:
+                self.stats['cache_hit'] += 1
+            return cached['data']
+        if self.offline:
+            raise ValueError(f"[ERROR] offline 모드 - 캐시 없음: {service_name} {start_idx}-{end_idx}")
+
+        headers = {}
+        if cached and cached['etag']:
+            headers['If-None-Match'] = cached['etag']
+        if cached and cached['last_modified']:
+            headers['If-Modified-Since'] = cached['last_modified']
+
+        response = self._request(api_key, self.url(api_key, service_name, start_idx, end_idx), headers)
+        if response.status_code == 304 and cached:
+            self.cache.touch(api_key, service_name, start_idx, end_idx)
+            with self._lock:
+                self.stats['revalidated'] += 1
+            return cached['data']
+
+        data = response.json()
+        if self.cache is not None and parse_page(data, service_name)[2] in (CODE_OK, CODE_NO_DATA):
+            self.cache.put(api_key, service_name, start_idx, end_idx, data,
+                           etag=response.headers.get('ETag'),
+                           last_modified=response.headers.get('Last-Modified'))
+        return data
+
+    def _request(self, api_key, url, headers=None):
+        """GET 요청 (429/5xx/연결 오류는 지수 백오프로 재시도)"""
+        for attempt in range(self.max_retries + 1):
+            try:
+                with self._slot(api_key):
+                    response = self.session.get(url, headers=headers, timeout=self.timeout)
+                with self._lock:
+                    self.stats['network'] += 1
+                if response.status_code not in RETRY_STATUS:
+                    response.raise_for_status()
+                    return response
+                error = requests.exceptions.HTTPError(f"HTTP {response.status_code}", response=response)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                error = e
+
+            if attempt == self.max_retries:
+                raise error
+            time.sleep(self.backoff * (2 ** attempt))
+
+    def page_ranges(self, total, first_end=None):
+        """첫 페이지 이후 남은 (시작, 끝) 구간 리스트 (1부터 시작하는 인덱스)"""
+        start = (first_end or self.page_size) + 1
+        return [(i, min(i + self.page_size - 1, total)) for i in range(start, total + 1, self.page_size)]
+
+    def iter_pages(self, api_key, service_name):
+        """
+        전체 페이지를 순서대로 DataFrame 으로 반환 (제너레이터)
+
+        첫 페이지로 전체 건수를 확인한 뒤, 남은 페이지를 스레드 풀에 한 번에 제출하고
+        도착하는 대로 페이지 순서대로 내보낸다.
+
+        Yields:
+            pd.DataFrame: 페이지별 데이터
+
+        Raises:
+            ValueError: API 결과 코드가 오류일 때 (INFO-200 데이터 없음은 빈 결과)
+        """
+        total, rows, code, message = parse_page(self.get_json(api_key, service_name, 1, self.page_size), service_name)
+        if code == CODE_NO_DATA:
+            return
+        if code != CODE_OK:
+            raise ValueError(f"[ERROR] {service_name}: {code} {message}")
+        yield pd.DataFrame(rows)
+
+        futures = [self._executor.submit(self.get_json, api_key, service_name, start, end)
+                   for start, end in self.page_ranges(total)]
+        for future in futures:
+            _, rows, code, message = parse_page(future.result(), service_name)
+            if code != CODE_OK:
+                raise ValueError(f"[ERROR] {service_name}: {code} {message}")
+            yield pd.DataFrame(rows)
+
+    def fetch_frame(self, api_key, service_name):
+        """
+        서비스 전체 데이터를 하나의 DataFrame 으로 수집
+
+        Returns:
+            pd.DataFrame: 전체 행 (데이터가 없으면 빈 DataFrame)
+        """
+        pages = list(self.iter_pages(api_key, service_name))
+        return pd.concat(pages, ignore_index=True) if pages else pd.DataFrame()
+
+    def fetch_many(self, jobs):
+        """
+        여러 서비스를 동시에 수집
+
+        Args:
+            jobs (dict): {이름: (API 키, 서비스명)}
+
+        Returns:
+            dict: {이름: DataFrame 또는 Exception}
+        """
+        def run(job):
+            try:
+                return self.fetch_frame(*job)
+            except Exception as e:
+                return e
+
+        # 서비스 단위는 별도 풀에서 실행 (페이지 요청용 풀과 분리해 교착 방지)
+        with ThreadPoolExecutor(max_workers=max(len(jobs), 1)) as executor:
+            results = dict(zip(jobs.keys(), executor.map(run, jobs.values())))
+        return results
+
+
+class _RateLimiter:
+    """호스트별 초당 요청 수 제한 (요청 간 최소 간격 보장)"""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class ServiceProber:
+    """
+    서비스명 병렬 탐색기 (어떤 서비스가 API 키로 조회 가능한지 확인)
+
+    - 동시 요청 수 제한 + 호스트별 초당 요청 수 제한
+    - 순서대로 묶음(wave) 단위로 요청하고, 마지막 성공 이후 연속 실패가
+      stop_after_misses 에 도달하면 남은 범위는 요청하지 않음
+    - 결과(서비스, 코드, 응답 시간)를 CSV로 저장하고, 다음 탐색에서는
+      stale_after 초가 지난 항목만 다시 확인
+
+    Args:
+        api_key (str): API 인증키
+        base_url (str): API 주소 (기본: SEOUL_API_BASE_URL)
+        max_workers (int): 동시 요청 수 (기본: 16)
+        rate_limit (float): 호스트별 초당 최대 요청 수 (기본: 20)
+        timeout (float): 요청 타임아웃(초) (기본: 5)
+        state_path (str, optional): 결과 저장 CSV (기본: 저장 안 함)
+        stale_after (float): 저장된 결과 재확인 주기(초) (기본: 7일)
+
+    Examples:
+        >>> prober = ServiceProber(API_KEY, state_path='data/cache/service_probe.csv')
+        >>> found = prober.scan_range('LOCALDATA_0205', 1, 999)
+        >>> found[found['ok']]
+    """
+
+    COLUMNS = ['service', 'ok', 'code', 'message', 'http_status', 'latency_ms', 'checked_at']
+
+    def __init__(self, api_key, base_url=SEOUL_API_BASE_URL, max_workers=16, rate_limit=20,
+                 timeout=5, state_path=None, stale_after=7 * 24 * 60 * 60):
+        self.api_key = api_key
+        self.base_url = base_url.rstrip('/')
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.state_path = state_path
+        self.stale_after = stale_after
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self._limiters = {}
+        self._rate_limit = rate_limit
+        self._lock = threading.Lock()
+        self.results = self._load_state()
+
+    def _load_state(self):
+        if self.state_path and os.path.exists(self.state_path):
+            return pd.read_csv(self.state_path, encoding='utf-8-sig')
+        return pd.DataFrame(columns=self.COLUMNS)
+
+    def save_state(self):
+        if self.state_path:
+            os.makedirs(os.path.dirname(self.state_path) or '.', exist_ok=True)
+            self.results.to_csv(self.state_path, index=False, encoding='utf-8-sig')
+
+    def _limiter(self, url):
+        host = requests.utils.urlparse(url).netloc
+        with self._lock:
+            if host not in self._limiters:
+                self._limiters[host] = _RateLimiter(self._rate_limit)
+            return self._limiters[host]
+
+    def probe(self, service_name):
+        """
+        서비스 하나 확인 (1건만 조회)
+
+        Returns:
+            dict: service, ok, code, message, http_status, latency_ms, checked_at
+        """
+        url = f"{self.base_url}/{self.api_key}/json/{service_name}/1/1"
+        self._limiter(url).wait()
+
+        result = {'service': service_name, 'ok': False, 'code': None, 'message': '', 'http_status': None}
+        started = time.perf_counter()
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            result['http_status'] = response.status_code
+            data = response.json()
+            _, _, code, message = parse_page(data, service_name)
+            result.update(code=code, message=message,
+                          ok=service_name in data or code == CODE_OK)
+        except requests.exceptions.JSONDecodeError:
+            # RequestException 의 하위 클래스이므로 먼저 처리
+            result.update(code='INVALID_JSON', message=response.text[:100])
+        except requests.exceptions.RequestException as e:
+            result.update(code='REQUEST_FAILED', message=type(e).__name__)
+
+        result['latency_ms'] = round((time.perf_counter() - started) * 1000, 1)
+        result['checked_at'] = time.time()
+        return result
+
+    def fresh_results(self):
+        """stale_after 이내에 확인한 결과 {서비스명: 성공 여부}"""
+        if self.results.empty:
+            return {}
+        fresh = self.results[time.time() - self.results['checked_at'] < self.stale_after]
+        return dict(zip(fresh['service'], fresh['ok'].astype(bool)))
+
+    def scan(self, names, stop_after_misses=None):
+        """
+        서비스명 목록 병렬 확인
+
+        names 를 순서대로 묶음 단위로 확인하며, 최근 결과가 있는 서비스는 다시 요청하지 않는다.
+        연속 실패 수는 저장된 결과까지 포함해 계산하므로, 재탐색 시에도 같은 위치에서 중단된다.
+
+        Args:
+            names (list): 서비스명 리스트 (범위 순서대로)
+            stop_after_misses (int, optional): 마지막 성공 이후 연속 실패가 이 값에 도달하면 중단
+
+        Returns:
+            pd.DataFrame: 확인된 서비스 결과 (names 순서)
+        """
+        known = self.fresh_results()
+        wave_size = self.max_workers * 2
+        new_rows = []
+        misses = 0
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for i in range(0, len(names), wave_size):
+                wave = names[i:i + wave_size]
+                rows = list(executor.map(self.probe, [name for name in wave if name not in known]))
+                new_rows.extend(rows)
+                known.update((row['service'], row['ok']) for row in rows)
+
+                for name in wave:
+                    misses = 0 if known[name] else misses + 1
+                if stop_after_misses and misses >= stop_after_misses:
+                    skipped = len(names) - i - len(wave)
+                    if skipped:
+                        print(f"   연속 {misses}개 실패 - 남은 {skipped}개 건너뜀")
+                    break
+
+        if new_rows:
+            new = pd.DataFrame(new_rows, columns=self.COLUMNS)
+            merged = pd.concat([self.results, new], ignore_index=True) if not self.results.empty else new
+            self.results = merged.drop_duplicates('service', keep='last').reset_index(drop=True)
+            self.save_state()
+
+        return pd.DataFrame({'service': names}).merge(self.results, on='service', how='inner')
+
+    def scan_range(self, prefix, start, end, width=4, stop_after_misses=200):
+        """
+        '{prefix}{번호}' 형태의 서비스명 범위 확인 (예: LOCALDATA_0205 0001~0999)
+
+        Returns:
+            pd.DataFrame: 범위 내 결과
+        """
+        names = [f"{prefix}{i:0{width}d}" for i in range(start, end + 1)]
+        return self.scan(names, stop_after_misses=stop_after_misses)
+
+    def close(self):
+        self.session.close()
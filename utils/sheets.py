@@ -0,0 +1,157 @@
+"""
+Excel/KOSIS 시트 파서 (선언형 시트 사양)
+
+서울시 열린데이터 광장 / KOSIS 에서 내려받은 자치구별 통계표는
+여러 줄의 헤더, 합계 행, 각주(※) 행, '-' 표기 등이 섞여 있습니다.
+시트마다 행을 하나씩 도는 대신, 시트 사양(spec) 딕셔너리 하나로 구조를 선언하고
+컬럼 단위 연산으로 한 번에 추출합니다.
+
+시트 사양 키:
+    district_col (int): 자치구명이 있는 열 위치
+    data_start (int): 데이터가 시작되는 행 위치 (헤더 오프셋, header=None 기준)
+    columns (dict, optional): {출력 컬럼명: 열 위치}
+    header_row (int, optional): columns 대신 이 행의 헤더 텍스트를 컬럼명으로 사용
+    value_cols (tuple, optional): header_row 사용 시 값 열 범위 (시작, 끝), 끝은 None 가능
+    skip_markers (tuple, optional): 자치구명이 이 값으로 시작하면 제외 (기본: SKIP_MARKERS)
+    dash_to_zero (bool, optional): '-' 를 0으로 변환 (기본: True)
+"""
+
+import os
+import glob
+import pandas as pd
+
+from .constants import SEOUL_DISTRICTS
+
+
+# 합계/헤더/각주 행 표시
+SKIP_MARKERS = ('소계', '합계', '계', '자치구', '구분', '구 분', '※')
+
+
+def read_sheet(file_path, sheet_name=0):
+    """
+    원본 시트를 헤더 없이 그대로 읽기 (xlsx/xls/csv)
+
+    Args:
+        file_path (str): 파일 경로
+        sheet_name (int or str): 엑셀 시트 (기본: 첫 번째 시트)
+
+    Returns:
+        pd.DataFrame: header=None 으로 읽은 원본 데이터프레임
+    """
+    if os.path.splitext(file_path)[1].lower() == '.csv':
+        return pd.read_csv(file_path, header=None, encoding='utf-8-sig', dtype=object)
+    return pd.read_excel(file_path, sheet_name=sheet_name, header=None, dtype=object)
+
+
+def normalize_districts(names):
+    """
+    자치구명 일괄 정리 (벡터 연산)
+
+    공백 제거('중 구' -> '중구'), '서울특별시' 접두사 제거,
+    '구'가 빠진 약칭 보정('동대문' -> '동대문구')
+
+    Args:
+        names (pd.Series): 원본 자치구명
+
+    Returns:
+        pd.Series: 정리된 자치구명 (string dtype)
+    """
+    names = names.astype('string').str.replace(r'\s+', '', regex=True)
+    names = names.str.replace(r'^서울(특별)?시', '', regex=True)
+    abbreviated = ~names.isin(SEOUL_DISTRICTS) & (names + '구').isin(SEOUL_DISTRICTS)
+    return names.mask(abbreviated, names + '구')
+
+
+def _header_names(raw, spec):
+    """header_row 의 텍스트를 정리해 {컬럼명: 열 위치} 생성"""
+    start, stop = spec.get('value_cols', (spec['district_col'] + 1, None))
+    header = raw.iloc[spec['header_row'], start:stop]
+    names = header.astype('string').str.replace(r'\s+', ' ', regex=True).str.strip()
+    return {name: pos for pos, name in zip(range(start, start + len(header)), names) if pd.notna(name)}
+
+
+def parse_sheet(raw, spec):
+    """
+    시트 사양에 따라 자치구별 표 추출
+
+    Args:
+        raw (pd.DataFrame): read_sheet() 로 읽은 원본
+        spec (dict): 시트 사양 (모듈 docstring 및 SHEET_SPECS 참고)
+
+    Returns:
+        pd.DataFrame: '자치구' + 값 컬럼 (숫자형), 원본 순서 유지
+
+    Examples:
+        >>> raw = read_sheet('01_데이터셋/raw/등록인구_20251210203438.csv')
+        >>> pop = parse_sheet(raw, SHEET_SPECS['population'])
+    """
+    columns = spec['columns'] if 'columns' in spec else _header_names(raw, spec)
+    body = raw.iloc[spec['data_start']:]
+
+    # 합계/각주/빈 행 제거 (마스크 한 번으로)
+    district = body.iloc[:, spec['district_col']].astype('string').str.strip()
+    markers = tuple(spec.get('skip_markers', SKIP_MARKERS))
+    keep = district.notna() & (district != '') & ~district.str.startswith(markers).fillna(False)
+    body = body[keep.to_numpy()]
+
+    values = body.iloc[:, list(columns.values())]
+    values.columns = list(columns.keys())
+    if spec.get('dash_to_zero', True):
+        values = values.replace({'-': 0})
+    values = values.apply(pd.to_numeric, errors='coerce')
+
+    result = pd.concat([normalize_districts(district[keep]).rename('자치구'), values], axis=1)
+    return result.reset_index(drop=True)
+
+
+def load_sheet(file_path, spec, sheet_name=0):
+    """
+    파일 읽기 + parse_sheet() 한 번에 실행
+
+    Args:
+        file_path (str): 파일 경로
+        spec (dict): 시트 사양
+        sheet_name (int or str): 엑셀 시트 (기본: 첫 번째 시트)
+
+    Returns:
+        pd.DataFrame: 추출된 자치구별 표
+    """
+    return parse_sheet(read_sheet(file_path, sheet_name), spec)
+
+
+def load_sheets(pattern, spec, source_col='파일'):
+    """
+    같은 양식의 여러 파일(예: 기준일별 연도별 워크북)을 읽어 하나로 합치기
+
+    Args:
+        pattern (str): glob 패턴 (예: '01_데이터셋/raw/*범죄예방 수사용*.xlsx')
+        spec (dict): 시트 사양
+        source_col (str): 원본 파일명을 기록할 컬럼명
+
+    Returns:
+        pd.DataFrame: 파일별 결과를 세로로 합친 데이터프레임 (파일마다 다른 컬럼은 NaN)
+
+    Raises:
+        FileNotFoundError: 패턴에 맞는 파일이 없을 때
+    """
+    paths = sorted(glob.glob(pattern))
+    if not paths:
+        raise FileNotFoundError(f"[ERROR] 파일 없음: {pattern}")
+
+    frames = [load_sheet(path, spec).assign(**{source_col: os.path.basename(path)}) for path in paths]
+    return pd.concat(frames, ignore_index=True)
+
+
+def check_districts(df, name):
+    """추출 결과의 자치구가 서울시 25개 자치구와 일치하는지 출력"""
+    found = set(df['자치구'])
+    missing = sorted(set(SEOUL_DISTRICTS) - found)
+    unknown = sorted(found - set(SEOUL_DISTRICTS))
+    if not missing and not unknown:
+        print(f"[OK] {name}: 25개 자치구 확인")
+        return True
+    if missing:
+        print(f"[WARNING] {name}: 누락된 자치구 {missing}")
+    if unknown:
+        print(f"[WARNING] {name}: 알 수 없는 자치구명 {unknown}")
+    return False
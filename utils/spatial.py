@@ -0,0 +1,295 @@
+"""
+공간 자기상관 (Moran's I, LISA)
+
+자치구 / 행정동 / 격자 셀에 대해 희소(CSR) 공간 가중치 행렬을 만들고
+- 전역 Moran's I: 정규 근사 + 순열검정 (모든 순열을 (n, B) 행렬 하나로 W @ Z 계산)
+- 국지 Moran's I (LISA): 조건부 순열검정 (모든 지역이 공유하는 무작위 이웃 인덱스 행렬을 청크 단위로 적용)
+를 계산하고, HH/LL/HL/LH 군집을 통합 데이터에 붙여 4분면 분류와 함께 쓸 수 있게 합니다.
+
+가중치:
+- knn_weights / distance_weights: 중심점 좌표 (KD-tree)
+- grid_weights: 격자 셀 인접 (rook / queen)
+- polygon_weights: 경계 폴리곤 꼭짓점 공유 (queen)
+"""
+
+import numpy as np
+import pandas as pd
+from scipy import sparse, stats
+from scipy.spatial import cKDTree
+
+from .constants import RANDOM_SEED, DISTRICT_CENTROIDS, LISA_LABELS
+from .points import to_meters
+
+
+# LISA 조건부 순열을 한 번에 계산할 최대 원소 수 (지역 수 x 순열 수 x 최대 이웃 수, 메모리 제한)
+LISA_CHUNK = 20_000_000
+
+
+def row_standardize(W):
+    """행 합이 1 이 되도록 표준화 (이웃 없는 행은 0)"""
+    W = sparse.csr_matrix(W, dtype='float64')
+    sums = np.asarray(W.sum(axis=1)).ravel()
+    scale = np.divide(1.0, sums, out=np.zeros_like(sums), where=sums > 0)
+    return sparse.diags(scale) @ W
+
+
+def knn_weights(xy, k=4):
+    """
+    k-최근접 이웃 가중치 (행 표준화)
+
+    Args:
+        xy (np.ndarray): (n, 2) 평면 좌표 (m)
+        k (int): 이웃 수
+
+    Returns:
+        sparse.csr_matrix: (n, n)
+    """
+    n = len(xy)
+    k = min(k, n - 1)
+    _, neighbors = cKDTree(xy).query(xy, k=k + 1)
+    rows = np.repeat(np.arange(n), k)
+    W = sparse.csr_matrix((np.ones(n * k), (rows, neighbors[:, 1:].ravel())), shape=(n, n))
+    return row_standardize(W)
+
+
+def distance_weights(xy, threshold, binary=True):
+    """
+    거리 임계값 가중치 (행 표준화)
+
+    Args:
+        xy (np.ndarray): (n, 2) 평면 좌표 (m)
+        threshold (float): 이웃 거리 (m)
+        binary (bool): True면 1, False면 역거리
+
+    Returns:
+        sparse.csr_matrix: (n, n)
+    """
+    tree = cKDTree(xy)
+    W = tree.sparse_distance_matrix(tree, threshold, output_type='coo_matrix').tocsr()
+    W.setdiag(0)
+    W.eliminate_zeros()
+    if binary:
+        W.data[:] = 1.0
+    else:
+        W.data = 1.0 / W.data
+    return row_standardize(W)
+
+
+def grid_weights(cells, queen=True):
+    """
+    격자 셀 인접 가중치 (행 표준화)
+
+    Args:
+        cells (np.ndarray or list): (n, 2) 정수 (열, 행) 격자 번호 (GridLayer.cell_index)
+            또는 격자ID '열_행' 문자열 (GridLayer.assign)
+        queen (bool): True면 대각선 포함 8방향, False면 상하좌우 4방향
+
+    Returns:
+        sparse.csr_matrix: (n, n)
+    """
+    if np.ndim(cells) == 1:
+        cells = pd.Series(cells, dtype=str).str.split('_', expand=True).to_numpy()
+    cells = np.asarray(cells, dtype='int64')
+    stride = int(np.ptp(cells[:, 1])) + 3
+    keys = (cells[:, 0] - cells[:, 0].min() + 1) * stride + (cells[:, 1] - cells[:, 1].min() + 1)
+    order = np.argsort(keys)
+    sorted_keys = keys[order]
+
+    offsets = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)
+               if (dx, dy) != (0, 0) and (queen or dx == 0 or dy == 0)]
+    rows, cols = [], []
+    for dx, dy in offsets:
+        target = keys + dx * stride + dy
+        pos = np.minimum(np.searchsorted(sorted_keys, target), len(keys) - 1)
+        found = sorted_keys[pos] == target
+        rows.append(np.flatnonzero(found))
+        cols.append(order[pos[found]])
+    rows, cols = np.concatenate(rows), np.concatenate(cols)
+    W = sparse.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(len(keys), len(keys)))
+    return row_standardize(W)
+
+
+def polygon_weights(layer, decimals=6):
+    """
+    경계 폴리곤 queen 인접 가중치 (꼭짓점을 하나라도 공유하면 이웃, 행 표준화)
+
+    Args:
+        layer (PolygonLayer): 경계 레이어
+        decimals (int): 꼭짓점 좌표 반올림 자릿수 (경계 데이터 오차 흡수)
+
+    Returns:
+        tuple: (sparse.csr_matrix (n, n), 지역 리스트)
+    """
+    regions = list(layer.polygons)
+    vertices = [(np.round(ring, decimals), code) for code, region in enumerate(regions) for ring in layer.polygons[region]]
+    coords = np.vstack([ring for ring, _ in vertices])
+    owner = np.concatenate([np.full(len(ring), code) for ring, code in vertices])
+
+    _, vertex_id = np.unique(coords, axis=0, return_inverse=True)
+    incidence = sparse.csr_matrix((np.ones(len(owner)), (owner, vertex_id.ravel())),
+                                  shape=(len(regions), vertex_id.max() + 1))
+    incidence.data[:] = 1.0
+    W = (incidence @ incidence.T).tocsr()
+    W.setdiag(0)
+    W.eliminate_zeros()
+    W.data[:] = 1.0
+    return row_standardize(W), regions
+
+
+def district_weights(districts, k=4):
+    """
+    자치구 k-최근접 가중치 (DISTRICT_CENTROIDS 구청 좌표 기준)
+
+    Args:
+        districts (list): 자치구 이름 (행 순서)
+        k (int): 이웃 수
+
+    Returns:
+        sparse.csr_matrix: (n, n)
+    """
+    missing = [d for d in districts if d not in DISTRICT_CENTROIDS]
+    assert not missing, f"[ERROR] 좌표가 없는 자치구: {missing}"
+    lat, lon = zip(*(DISTRICT_CENTROIDS[d] for d in districts))
+    return knn_weights(to_meters(np.array(lat), np.array(lon)), k=k)
+
+
+def morans_i(values, W, n_perm=999, seed=RANDOM_SEED, batch_size=1000):
+    """
+    전역 Moran's I
+
+    Args:
+        values (array-like): 지역별 값 (W 행 순서)
+        W (sparse matrix): 공간 가중치
+        n_perm (int): 순열 수 (0 이면 생략)
+        seed (int): 난수 시드
+        batch_size (int): 한 번에 계산할 순열 수
+
+    Returns:
+        dict: I, 기대값, z_norm, p_norm (양측), p_sim (순열, 관측 방향 단측)
+    """
+    z = np.asarray(values, dtype='float64')
+    z = z - z.mean()
+    n = len(z)
+    W = sparse.csr_matrix(W)
+    s0 = W.sum()
+    I = n / s0 * (z @ (W @ z)) / (z @ z)
+
+    # 정규성 가정 분산 (Cliff & Ord)
+    s1 = 0.5 * (W + W.T).power(2).sum()
+    s2 = ((np.asarray(W.sum(axis=0)).ravel() + np.asarray(W.sum(axis=1)).ravel()) ** 2).sum()
+    expected = -1.0 / (n - 1)
+    variance = (n ** 2 * s1 - n * s2 + 3 * s0 ** 2) / ((n ** 2 - 1) * s0 ** 2) - expected ** 2
+    z_norm = (I - expected) / np.sqrt(variance)
+    result = {'I': I, '기대값': expected, 'z_norm': z_norm, 'p_norm': 2 * stats.norm.sf(abs(z_norm))}
+
+    if n_perm:
+        rng = np.random.default_rng(seed)
+        sims = []
+        for start in range(0, n_perm, batch_size):
+            size = min(batch_size, n_perm - start)
+            Z = z[np.argsort(rng.random((size, n)), axis=1)].T
+            sims.append(n / s0 * np.einsum('ib,ib->b', Z, W @ Z) / (z @ z))
+        sims = np.concatenate(sims)
+        larger = (sims >= I).sum() if I >= expected else (sims <= I).sum()
+        result['p_sim'] = (larger + 1) / (n_perm + 1)
+    return result
+
+
+def _random_neighbors(rng, n, n_perm, k):
+    """순열마다 자기 자신을 뺀 n-1 개 중 k 개 비복원 추출 인덱스 (n_perm, k)"""
+    if n - 1 <= 10_000:
+        return np.argsort(rng.random((n_perm, n - 1)), axis=1)[:, :k]
+    ids = rng.integers(0, n - 1, size=(n_perm, k))
+    while True:
+        ordered = np.sort(ids, axis=1)
+        dup = (ordered[:, 1:] == ordered[:, :-1]).any(axis=1)
+        if not dup.any():
+            return ids
+        ids[dup] = rng.integers(0, n - 1, size=(dup.sum(), k))
+
+
+def local_morans(values, W, n_perm=999, seed=RANDOM_SEED, alpha=0.05):
+    """
+    국지 Moran's I (LISA) + 조건부 순열검정
+
+    각 지역의 값은 고정하고 나머지 값에서 이웃 수만큼 무작위로 뽑아 공간 시차를 다시 계산한다.
+    무작위 이웃 인덱스 행렬 (순열 수 x 최대 이웃 수) 하나를 모든 지역이 공유하며 (자기 자신 제외),
+    지역 청크 x 순열 x 이웃 배열로 한 번에 계산한다.
+
+    Args:
+        values (array-like): 지역별 값 (W 행 순서)
+        W (sparse matrix): 공간 가중치 (행 표준화 권장)
+        n_perm (int): 순열 수
+        seed (int): 난수 시드
+        alpha (float): 군집 유의수준
+
+    Returns:
+        pd.DataFrame: [LISA, 공간시차, p_sim, 군집]
+    """
+    x = np.asarray(values, dtype='float64')
+    z = x - x.mean()
+    n = len(z)
+    W = sparse.csr_matrix(W)
+    m2 = (z @ z) / n
+    lag = W @ z
+    local = z / m2 * lag
+
+    counts = np.diff(W.indptr)
+    k_max = int(counts.max()) if n else 0
+    # 지역별 가중치를 (n, k_max) 로 펼침 (이웃 수가 적은 지역은 0)
+    slot = np.arange(W.nnz) - np.repeat(W.indptr[:-1], counts)
+    weights = np.zeros((n, max(k_max, 1)))
+    weights[np.repeat(np.arange(n), counts), slot] = W.data
+
+    rng = np.random.default_rng(seed)
+    neighbors = _random_neighbors(rng, n, n_perm, k_max)
+    larger = np.zeros(n, dtype='int64')
+    chunk = max(1, LISA_CHUNK // max(1, n_perm * k_max))
+    for start in range(0, n, chunk):
+        idx = np.arange(start, min(start + chunk, n))
+        # 자기 자신(idx) 이상 인덱스는 한 칸 밀어서 제외
+        ids = neighbors[None, :, :] + (neighbors[None, :, :] >= idx[:, None, None])
+        sims = z[idx, None] / m2 * np.einsum('ibk,ik->ib', z[ids], weights[idx, :k_max])
+        larger[idx] = (sims >= local[idx, None]).sum(axis=1)
+
+    # 관측값이 순열분포 아래쪽이면 반대쪽 꼬리로 접기 (PySAL p_sim 과 같은 정의)
+    low = (n_perm - larger) < larger
+    larger[low] = n_perm - larger[low]
+    # 이웃이 없는 지역(섬)은 검정 불가
+    p_sim = np.where(counts > 0, (larger + 1) / (n_perm + 1), np.nan)
+
+    quadrant = np.where(z > 0, np.where(lag > 0, 'HH', 'HL'), np.where(lag > 0, 'LH', 'LL'))
+    cluster = np.where(p_sim <= alpha, quadrant, 'NS')
+    return pd.DataFrame({
+        'LISA': local,
+        '공간시차': lag,
+        'p_sim': p_sim,
+        '군집': pd.Series(cluster).map(LISA_LABELS).to_numpy()
+    })
+
+
+def add_lisa(df, value_col, W, n_perm=999, seed=RANDOM_SEED, alpha=0.05, prefix=None):
+    """
+    LISA 결과를 데이터프레임에 추가 (4분면 분류와 함께 사용)
+
+    Args:
+        df (pd.DataFrame): 지역별 데이터 (W 행 순서)
+        value_col (str): 분석 변수
+        W (sparse matrix): 공간 가중치
+        prefix (str, optional): 추가 컬럼 접두어 (기본: value_col)
+
+    Returns:
+        pd.DataFrame: 복사본 + [{prefix}_LISA, {prefix}_LISA_p, {prefix}_LISA_군집]
+
+    Examples:
+        >>> W = district_weights(df['자치구'].tolist())
+        >>> df = add_lisa(df, 'CCTV효과범죄_per_1000', W)
+        >>> pd.crosstab(df['Quadrant'], df['CCTV효과범죄_per_1000_LISA_군집'])
+    """
+    prefix = prefix or value_col
+    lisa = local_morans(df[value_col].to_numpy(), W, n_perm=n_perm, seed=seed, alpha=alpha)
+    result = df.copy()
+    result[f'{prefix}_LISA'] = lisa['LISA'].to_numpy()
+    result[f'{prefix}_LISA_p'] = lisa['p_sim'].to_numpy()
+    result[f'{prefix}_LISA_군집'] = lisa['군집'].to_numpy()
+    return result
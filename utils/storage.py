@@ -0,0 +1,140 @@
+"""
+처리 데이터 저장소 (Parquet 우선, CSV 호환)
+
+data/processed 의 통합 데이터를 타입이 보존되는 압축 Parquet 파일로 저장하고,
+필요한 컬럼만 골라 읽을 수 있도록 합니다.
+- 경로는 확장자와 무관하게 같은 이름의 .parquet / .csv 쌍으로 취급
+- pyarrow가 없거나 Parquet 파일이 없으면 기존 UTF-8-SIG CSV로 자동 대체
+"""
+
+import os
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+
+# 범주형(category)으로 저장할 라벨 컬럼 (문자열 컬럼은 Parquet이 자체적으로 사전 인코딩)
+CATEGORY_COLUMNS = ['분면', 'Quadrant', 'CCTV밀도_등급', '범죄율_등급']
+
+# Parquet 압축 방식
+PARQUET_COMPRESSION = 'zstd'
+
+
+def _table_paths(file_path):
+    """확장자를 떼어낸 경로로 (parquet 경로, csv 경로) 쌍 반환"""
+    stem, _ = os.path.splitext(file_path)
+    return f'{stem}.parquet', f'{stem}.csv'
+
+
+def apply_schema(df, schema=None):
+    """
+    저장 전 컬럼 타입 정리
+
+    CATEGORY_COLUMNS 는 category 로 변환하고, schema 로 지정한 컬럼은 해당 타입으로 변환한다.
+
+    Args:
+        df (pd.DataFrame): 데이터프레임
+        schema (dict, optional): {컬럼명: dtype} (예: {'총인구': 'int64'})
+
+    Returns:
+        pd.DataFrame: 타입이 정리된 복사본
+    """
+    df = df.copy()
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('category')
+    if schema:
+        df = df.astype({col: dtype for col, dtype in schema.items() if col in df.columns})
+    return df
+
+
+def save_table(df, file_path, schema=None, export_csv=False):
+    """
+    처리 데이터를 Parquet(압축)으로 저장, 필요 시 CSV도 함께 내보내기
+
+    Args:
+        df (pd.DataFrame): 저장할 데이터프레임
+        file_path (str): 저장 경로 (.parquet / .csv 어느 쪽이든 가능)
+        schema (dict, optional): {컬럼명: dtype} 타입 지정
+        export_csv (bool): True면 같은 이름의 UTF-8-SIG CSV도 저장 (기본: False)
+
+    Returns:
+        str: 실제 저장된 기본 파일 경로
+
+    Examples:
+        >>> save_table(merged, os.path.join(DATA_PATHS['processed'], 'integrated_data.csv'), export_csv=True)
+    """
+    parquet_path, csv_path = _table_paths(file_path)
+    os.makedirs(os.path.dirname(parquet_path) or '.', exist_ok=True)
+
+    if not PARQUET_AVAILABLE:
+        print("[WARNING] pyarrow 미설치 - CSV로만 저장합니다")
+        df.to_csv(csv_path, index=False, encoding='utf-8-sig')
+        print(f"[OK] 파일 저장 완료: {csv_path}")
+        return csv_path
+
+    apply_schema(df, schema).to_parquet(
+        parquet_path, engine='pyarrow', compression=PARQUET_COMPRESSION, index=False
+    )
+    print(f"[OK] 파일 저장 완료: {parquet_path}")
+
+    if export_csv:
+        df.to_csv(csv_path, index=False, encoding='utf-8-sig')
+        print(f"[OK] 파일 저장 완료: {csv_path}")
+
+    return parquet_path
+
+
+def load_table(file_path, columns=None):
+    """
+    처리 데이터 로드 (Parquet 우선, 없으면 CSV)
+
+    Args:
+        file_path (str): 파일 경로 (.parquet / .csv 어느 쪽이든 가능)
+        columns (list, optional): 읽을 컬럼 리스트 (기본: 전체)
+
+    Returns:
+        pd.DataFrame: 로드된 데이터프레임 (columns 지정 시 해당 순서)
+
+    Raises:
+        FileNotFoundError: Parquet/CSV 모두 없을 때
+
+    Examples:
+        >>> df = load_table('data/processed/integrated_data_with_analysis.csv',
+        ...                 columns=['자치구', 'CCTV_per_1000', '범죄_per_1000'])
+    """
+    parquet_path, csv_path = _table_paths(file_path)
+    columns = list(columns) if columns is not None else None
+
+    if PARQUET_AVAILABLE and os.path.exists(parquet_path):
+        return pd.read_parquet(parquet_path, engine='pyarrow', columns=columns)
+
+    if os.path.exists(csv_path):
+        df = pd.read_csv(csv_path, encoding='utf-8-sig', usecols=columns)
+        return df[columns] if columns is not None else df
+
+    raise FileNotFoundError(f"[ERROR] 데이터 파일 없음: {parquet_path} / {csv_path}")
+
+
+def export_table_csv(file_path, csv_path=None):
+    """
+    저장된 Parquet 테이블을 UTF-8-SIG CSV로 내보내기
+
+    Args:
+        file_path (str): 원본 테이블 경로
+        csv_path (str, optional): CSV 저장 경로 (기본: 같은 이름의 .csv)
+
+    Returns:
+        str: 저장된 CSV 경로
+    """
+    if csv_path is None:
+        _, csv_path = _table_paths(file_path)
+    df = load_table(file_path)
+    os.makedirs(os.path.dirname(csv_path) or '.', exist_ok=True)
+    df.to_csv(csv_path, index=False, encoding='utf-8-sig')
+    print(f"[OK] CSV 내보내기 완료: {csv_path}")
+    return csv_path